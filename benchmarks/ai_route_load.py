@@ -0,0 +1,104 @@
+"""
+AI TODO 생성 라우트 동시 부하 벤치마크
+
+지연을 주입한 Fake 모델로 POST /api/todos/ai 요청을 동시에 보내, 모델 호출을 스레드풀에서
+블로킹으로 기다리던 기존 동기 라우트와 비동기 라우트의 처리량/지연 시간을 비교합니다.
+부하 중에 /api/health(동기 라우트)도 함께 호출해 스레드풀이 고갈되는지 확인합니다.
+
+    poetry run python -m benchmarks.ai_route_load
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import date
+from typing import List
+
+import httpx
+from dependency_injector import providers
+from fastapi import FastAPI
+
+from src.application.services.ai_service import AIService
+from src.main import app
+from src.presentation.api.health import router as health_router
+from src.presentation.api.schemas import AITodoCreate
+from test.fake_ai_model_service import FakeAIModelService
+
+USER_INPUT = "내일 회의 준비하고 보고서 작성해야 해"
+
+
+def create_legacy_app(latency: float) -> FastAPI:
+    """변경 전 구현: 동기 라우트가 스레드풀 워커에서 모델 응답을 블로킹으로 기다림"""
+    legacy_app = FastAPI()
+    legacy_app.include_router(health_router)
+
+    @legacy_app.post("/api/todos/ai")
+    def create_todo_with_ai(ai_todo_create: AITodoCreate):
+        time.sleep(latency)
+        return {"base_date": ai_todo_create.base_date, "tasks": []}
+
+    return legacy_app
+
+
+async def timed_post(client: httpx.AsyncClient, target_date: date) -> float:
+    started = time.perf_counter()
+    response = await client.post(
+        "/api/todos/ai", json={"user_input": USER_INPUT, "base_date": target_date.isoformat()}
+    )
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def timed_health(client: httpx.AsyncClient) -> float:
+    started = time.perf_counter()
+    (await client.get("/api/health")).raise_for_status()
+    return time.perf_counter() - started
+
+
+async def measure(name: str, asgi_app, concurrency: int) -> None:
+    transport = httpx.ASGITransport(app=asgi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        requests = [
+            asyncio.create_task(timed_post(client, date.fromordinal(date.today().toordinal() + i)))
+            for i in range(concurrency)
+        ]
+        # 부하가 걸린 직후 헬스 체크 응답 시간을 측정
+        await asyncio.sleep(0.01)
+        health = await timed_health(client)
+        timings: List[float] = await asyncio.gather(*requests)
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name:<8}wall {elapsed:6.2f} s  {concurrency / elapsed:8.1f} req/s  "
+        f"p50 {quantiles[49] * 1000:8.1f} ms  p95 {quantiles[94] * 1000:8.1f} ms  "
+        f"health {health * 1000:8.1f} ms"
+    )
+
+
+async def run(concurrency: int, latency: float) -> None:
+    await measure("sync", create_legacy_app(latency), concurrency)
+
+    # 결과 캐시를 거치지 않도록 AIService를 Fake 모델로 직접 구성
+    app.container.ai_service.override(
+        providers.Object(AIService(FakeAIModelService(latency=latency)))
+    )
+    try:
+        await measure("async", app, concurrency)
+    finally:
+        app.container.ai_service.reset_override()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=1.0, help="Fake 모델 응답 지연(초)")
+    args = parser.parse_args()
+    os.environ.setdefault("DISABLE_AUTH", "true")
+    asyncio.run(run(args.concurrency, args.latency))
+
+
+if __name__ == "__main__":
+    main()
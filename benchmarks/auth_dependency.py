@@ -0,0 +1,61 @@
+"""
+인증 의존성(get_current_user) 마이크로 벤치마크
+
+같은 액세스 토큰으로 get_current_user를 반복 호출해, 검증된 JWT 캐시가 없을 때와
+있을 때의 호출당 시간을 비교합니다.
+
+    poetry run python -m benchmarks.auth_dependency
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.application.services.auth_service import AuthService
+from src.domain.models.user import User
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.presentation.api.auth import get_current_user
+
+
+async def measure(auth_service: AuthService, token: str, iterations: int) -> float:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    # 첫 호출(캐시 적재)은 측정에서 제외
+    await get_current_user(credentials=credentials, auth_service=auth_service)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await get_current_user(credentials=credentials, auth_service=auth_service)
+    return (time.perf_counter() - started) / iterations
+
+
+async def run(iterations: int, repeat: int) -> None:
+    os.environ["DISABLE_AUTH"] = "false"
+    services = {
+        "no cache": AuthService(None, None),
+        "cache": AuthService(
+            None, None, verified_token_cache=LRUTTLCache(max_entries=10000, ttl_seconds=1800)
+        ),
+    }
+    token = services["no cache"].create_access_token(
+        User(id=1, kakao_id="bench", nickname="벤치")
+    )
+
+    results = {}
+    for name, service in services.items():
+        results[name] = min([await measure(service, token, iterations) for _ in range(repeat)])
+        print(f"{name:<10}{results[name] * 1_000_000:8.2f} us/call")
+    print(f"speedup   {results['no cache'] / results['cache']:8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+주요 API 엔드포인트 HTTP 부하 벤치마크
+
+실제 FastAPI 앱을 시드 데이터가 들어 있는 SQLite(또는 --database-url로 지정한 MySQL)에 연결하고,
+시나리오마다 정해진 수의 요청을 동시에 보내 p50/p95/p99 지연 시간과 초당 요청 수를 측정합니다.
+AI 생성은 지연을 주입한 FakeAIModelService를 사용합니다.
+
+결과는 저장된 기준값(benchmarks/baseline.json)과 비교해, p95가 허용 범위보다 늘었거나
+초당 요청 수가 허용 범위보다 줄어든 시나리오를 회귀로 표시하고 종료 코드 1로 끝납니다.
+기준값은 측정한 머신에 따라 달라지므로 같은 환경에서 --save-baseline으로 다시 저장해 비교합니다.
+
+    poetry run python -m benchmarks.http_suite
+    poetry run python -m benchmarks.http_suite --scenarios todos_by_date task_toggle
+    poetry run python -m benchmarks.http_suite --save-baseline
+    poetry run python -m benchmarks.http_suite --database-url "mysql+aiomysql://..."
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from dependency_injector import providers
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from benchmarks.synthetic_data import SyntheticDataset, SyntheticDataSpec, load_synthetic_data
+from src.application.services.ai_service import AIService
+from src.database import (
+    Database,
+    UnitOfWork,
+    enable_sqlite_transactions,
+    to_async_database_url,
+)
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
+from src.infrastructure.database.sqlalchemy_models import Base
+from src.main import app
+from test.fake_ai_model_service import FakeAIModelService
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# 인증 우회 시 사용하는 개발 사용자 (src.presentation.api.auth.get_current_user)
+BENCH_USER_ID = 9999999
+FIRST_DATE = date(2025, 1, 1)
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    requests: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+# 요청 순번을 받아 응답을 돌려주는 요청 함수
+RequestFn = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    request: RequestFn
+    # 읽기 전용 시나리오만 측정 전에 워밍업 요청을 보냄
+    read_only: bool = False
+
+
+async def seed(engine: AsyncEngine, days: int, seed_value: int) -> SyntheticDataset:
+    """개발 사용자의 days일치 히스토리를 합성 데이터 생성기로 다시 만듭니다."""
+    spec = SyntheticDataSpec(
+        users=1, days=days, first_user_id=BENCH_USER_ID, first_date=FIRST_DATE, seed=seed_value
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+        return await connection.run_sync(load_synthetic_data, spec)
+
+
+def build_scenarios(dataset: SyntheticDataset, requests: int, seed_value: int) -> List[Scenario]:
+    rng = random.Random(seed_value)
+    dates = [rng.choice(dataset.dates) for _ in range(requests)]
+    task_ids = [rng.choice(dataset.task_ids) for _ in range(requests)]
+    if len(dataset.root_task_ids) < requests:
+        raise SystemExit("삭제 시나리오에 쓸 태스크가 부족합니다. --days를 늘려 주세요")
+    delete_ids = rng.sample(dataset.root_task_ids, requests)
+    new_date = dataset.dates[-1] + timedelta(days=1)
+
+    bulk_body = {
+        "tasks": [
+            {"title": "회의 준비", "points": 3},
+            {"title": "안건 작성", "points": 1, "parent_id": 0},
+            {"title": "자료 수집", "points": 1, "parent_id": 0},
+            {"title": "보고서 작성", "points": 5},
+            {"title": "초안 검토", "points": 2, "parent_id": 3},
+        ]
+    }
+
+    return [
+        Scenario(
+            "todos_by_date",
+            lambda client, i: client.get(
+                "/api/todos", params={"target_date": dates[i].isoformat()}
+            ),
+            read_only=True,
+        ),
+        Scenario(
+            "todos_history",
+            lambda client, i: client.get("/api/todos", params={"limit": 100}),
+            read_only=True,
+        ),
+        Scenario(
+            "todos_bulk",
+            lambda client, i: client.post(
+                "/api/todos/bulk",
+                json={**bulk_body, "base_date": (new_date + timedelta(days=i)).isoformat()},
+            ),
+        ),
+        Scenario(
+            "task_toggle",
+            lambda client, i: client.patch(f"/api/tasks/{task_ids[i]}/toggle"),
+        ),
+        Scenario(
+            "task_update",
+            lambda client, i: client.put(
+                f"/api/tasks/{task_ids[i]}", json={"title": f"수정 {i}", "points": i % 10 + 1}
+            ),
+        ),
+        Scenario(
+            "task_delete",
+            lambda client, i: client.delete(f"/api/tasks/{delete_ids[i]}"),
+        ),
+        Scenario(
+            "todos_ai",
+            # 입력마다 날짜를 바꿔 결과 공유(single-flight) 없이 모델을 호출
+            lambda client, i: client.post(
+                "/api/todos/ai",
+                json={
+                    "user_input": "내일 회의 준비하고 보고서 작성해야 해",
+                    "base_date": (FIRST_DATE + timedelta(days=i)).isoformat(),
+                },
+            ),
+        ),
+    ]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int, warmup: int
+) -> ScenarioResult:
+    if scenario.read_only:
+        for i in range(min(warmup, requests)):
+            (await scenario.request(client, i)).raise_for_status()
+
+    timings: List[float] = []
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            response = await scenario.request(client, index)
+            timings.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                raise RuntimeError(
+                    f"{scenario.name} 요청 실패: {response.status_code} {response.text[:200]}"
+                )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(timings, n=100, method="inclusive")
+    return ScenarioResult(
+        requests=requests,
+        rps=round(requests / elapsed, 1),
+        p50_ms=round(quantiles[49] * 1000, 2),
+        p95_ms=round(quantiles[94] * 1000, 2),
+        p99_ms=round(quantiles[98] * 1000, 2),
+    )
+
+
+def compare(
+    results: Dict[str, ScenarioResult], baseline: Dict[str, dict], tolerance: float
+) -> List[str]:
+    """기준값보다 p95가 tolerance 비율 넘게 늘었거나 rps가 tolerance 비율 넘게 줄어든 시나리오"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result.p95_ms > expected["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {expected['p95_ms']:.2f} -> {result.p95_ms:.2f} ms")
+        if result.rps < expected["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {expected['rps']:.1f} -> {result.rps:.1f}")
+    return regressions
+
+
+def format_row(name: str, result: ScenarioResult, expected: Optional[dict]) -> str:
+    row = (
+        f"{name:<15}{result.rps:9.1f} req/s  p50 {result.p50_ms:8.2f}  "
+        f"p95 {result.p95_ms:8.2f}  p99 {result.p99_ms:8.2f} ms"
+    )
+    if expected:
+        row += (
+            f"   (p95 {_change(result.p95_ms, expected['p95_ms'])}, "
+            f"rps {_change(result.rps, expected['rps'])})"
+        )
+    return row
+
+
+def _change(value: float, expected: float) -> str:
+    return f"{(value - expected) / expected * 100:+6.1f}%" if expected else "   n/a"
+
+
+async def run(args: argparse.Namespace, database_url: str) -> Dict[str, ScenarioResult]:
+    url = to_async_database_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        # SQLite는 쓰기를 직렬화하므로, 동시 쓰기 트랜잭션이 잠금 승격에서 실패하지 않도록
+        # 연결 하나를 차례로 사용 (요청 간 DB 대기는 풀 대기 시간으로 측정됨)
+        engine = enable_sqlite_transactions(
+            create_async_engine(url, pool_size=1, max_overflow=0)
+        )
+    else:
+        engine = create_async_engine(url, pool_size=10, max_overflow=20)
+
+    database = Database(engine)
+    unit_of_work = UnitOfWork(database)
+    container = app.container
+    container.db_engine.override(providers.Object(engine))
+    container.database.override(providers.Object(database))
+    container.unit_of_work.override(providers.Object(unit_of_work))
+    # 결과 캐시/호출 한도를 거치지 않고 매 요청 Fake 모델을 호출
+    container.ai_service.override(
+        providers.Object(AIService(FakeAIModelService(latency=args.ai_latency)))
+    )
+
+    rounds: Dict[str, List[ScenarioResult]] = {}
+    try:
+        for _ in range(args.rounds):
+            # 라운드마다 같은 시드 데이터와 빈 캐시에서 다시 시작
+            dataset = await seed(engine, args.days, args.seed)
+            container.todo_tree_cache.override(
+                providers.Object(TodoTreeCache(unit_of_work=unit_of_work))
+            )
+            scenarios = build_scenarios(dataset, args.requests, args.seed)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for scenario in scenarios:
+                    if args.scenarios and scenario.name not in args.scenarios:
+                        continue
+                    result = await run_scenario(
+                        client, scenario, args.requests, args.concurrency, args.warmup
+                    )
+                    rounds.setdefault(scenario.name, []).append(result)
+    finally:
+        for provider in (
+            container.db_engine,
+            container.database,
+            container.unit_of_work,
+            container.todo_tree_cache,
+            container.ai_service,
+        ):
+            provider.reset_override()
+        await engine.dispose()
+
+    return {name: median_result(results) for name, results in rounds.items()}
+
+
+def median_result(results: List[ScenarioResult]) -> ScenarioResult:
+    """라운드별 결과의 항목별 중앙값 (한 라운드의 일시적인 지연이 결과를 흔들지 않도록)"""
+    return ScenarioResult(
+        requests=results[0].requests,
+        rps=statistics.median(result.rps for result in results),
+        p50_ms=statistics.median(result.p50_ms for result in results),
+        p95_ms=statistics.median(result.p95_ms for result in results),
+        p99_ms=statistics.median(result.p99_ms for result in results),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--scenarios", nargs="+", help="실행할 시나리오 (기본값: 전체)")
+    parser.add_argument("--requests", type=int, default=300, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="반복 횟수 (결과는 라운드별 중앙값)")
+    parser.add_argument("--days", type=int, default=365, help="시드 데이터의 Todo 일수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--ai-latency", type=float, default=0.05, help="Fake 모델 응답 지연(초)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="회귀로 보지 않는 변화 비율 (기본값: 25%%)"
+    )
+    args = parser.parse_args()
+    os.environ["DISABLE_AUTH"] = "true"
+    os.environ["DEV_USER_ID"] = str(BENCH_USER_ID)
+    # 요청마다 남는 AI 호출/SQL 로그가 결과 표를 가리지 않도록 숨김
+    logging.disable(logging.WARNING)
+
+    if args.database_url:
+        results = asyncio.run(run(args, args.database_url))
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            database_url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+            results = asyncio.run(run(args, database_url))
+
+    settings = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "days": args.days,
+        "seed": args.seed,
+        "ai_latency": args.ai_latency,
+        "rounds": args.rounds,
+        "database": to_async_database_url(args.database_url).get_backend_name()
+        if args.database_url
+        else "sqlite",
+    }
+    baseline: Dict[str, dict] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            document = json.load(f)
+        baseline = document["scenarios"]
+        if document["settings"] != settings:
+            print(f"주의: 기준값과 측정 설정이 다릅니다 (기준값: {document['settings']})\n")
+
+    for name, result in results.items():
+        print(format_row(name, result, baseline.get(name)))
+
+    if args.save_baseline:
+        document = {
+            "settings": settings,
+            "environment": {"python": platform.python_version(), "platform": platform.platform()},
+            "scenarios": {
+                **baseline,
+                **{name: asdict(result) for name, result in results.items()},
+            },
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n회귀:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+카카오 로그인 경로 지연 시간 벤치마크
+
+로컬 스텁 서버를 카카오 인증/API 서버 대신 띄우고, 로그인 경로(토큰 교환 + 사용자 정보 조회)를
+호출마다 새 AsyncClient를 여는 기존 방식과 공유 커넥션 풀 클라이언트로 비교합니다.
+
+    poetry run python -m benchmarks.kakao_login_latency
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from src.infrastructure.auth import KakaoAuthProvider
+from src.infrastructure.http.client import create_http_client
+
+
+class KakaoStubHandler(BaseHTTPRequestHandler):
+    """카카오 토큰/사용자 정보 API를 흉내 내는 keep-alive 스텁"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle 지연이 측정값을 가리지 않도록 끔
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send_json({"access_token": "stub_access_token"})
+
+    def do_GET(self):
+        self._send_json({"id": 12345, "properties": {"nickname": "스텁"}})
+
+    def _send_json(self, body):
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LegacyKakaoAuthProvider:
+    """변경 전 구현: 호출마다 새 AsyncClient를 열고 닫음"""
+
+    def __init__(self, base_url: str):
+        self._base_url = base_url
+
+    async def get_access_token_from_code(self, code, client_id, client_secret, redirect_uri):
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{self._base_url}/oauth/token",
+                data={"grant_type": "authorization_code", "code": code},
+            )
+            return response.json().get("access_token")
+
+    async def get_user_info(self, access_token):
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{self._base_url}/v2/user/me",
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            return response.json()
+
+
+async def login(provider) -> None:
+    access_token = await provider.get_access_token_from_code(
+        "code", "client_id", "client_secret", "http://localhost/callback"
+    )
+    await provider.get_user_info(access_token)
+
+
+async def measure(call: Callable[[], Awaitable[None]], iterations: int) -> List[float]:
+    await call()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summarize(name: str, timings: List[float]) -> str:
+    quantiles = statistics.quantiles(timings, n=100)
+    return (
+        f"{name:<14}p50 {quantiles[49] * 1000:7.2f} ms  "
+        f"p95 {quantiles[94] * 1000:7.2f} ms  "
+        f"mean {statistics.fmean(timings) * 1000:7.2f} ms"
+    )
+
+
+async def run(base_url: str, iterations: int) -> None:
+    legacy = LegacyKakaoAuthProvider(base_url)
+    print(summarize("per-call", await measure(lambda: login(legacy), iterations)))
+
+    resource = create_http_client()
+    client = await resource.__anext__()
+    try:
+        shared = KakaoAuthProvider(client=client, auth_base_url=base_url, api_base_url=base_url)
+        print(summarize("shared pool", await measure(lambda: login(shared), iterations)))
+    finally:
+        await resource.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument(
+        "--base-url", help="이미 떠 있는 스텁 서버 주소 (기본값: 로컬 스텁 서버를 직접 실행)"
+    )
+    args = parser.parse_args()
+
+    if args.base_url:
+        asyncio.run(run(args.base_url, args.iterations))
+        return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KakaoStubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run(run(f"http://127.0.0.1:{server.server_port}", args.iterations))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+규모 테스트용 합성 사용자 히스토리 생성기
+
+sqlalchemy_models의 테이블에 사용자, 날짜별 Todo, 태스크와 서브태스크 트리를 시드 고정 난수로
+만들어 일괄 INSERT하고 포인트 집계 테이블도 채웁니다. 같은 설정과 시드는 항상 같은 데이터(ID 포함)를 만듭니다.
+
+    poetry run python -m benchmarks.synthetic_data --database-url sqlite:///data/scale.db --reset
+    poetry run python -m benchmarks.synthetic_data --database-url "mysql+aiomysql://..." \\
+        --users 100 --days 730 --tasks-per-day 2 8 --subtask-fanout 0 4 --depth 2
+"""
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import to_async_database_url
+from src.infrastructure.database.sqlalchemy_models import (
+    Base,
+    DailyUserStatsORM,
+    TaskORM,
+    TodoORM,
+    UserLifetimeStatsORM,
+    UserORM,
+)
+
+
+@dataclass(frozen=True)
+class SyntheticDataSpec:
+    """생성할 데이터의 규모와 분포"""
+
+    users: int = 1
+    days: int = 365
+    # 날짜별 최상위 태스크 수 범위 (양 끝 포함)
+    tasks_per_day: Tuple[int, int] = (2, 6)
+    # 태스크 하나의 자식 수 범위 (양 끝 포함)
+    subtask_fanout: Tuple[int, int] = (0, 3)
+    # 최상위 태스크 아래 서브태스크 트리의 깊이 (0이면 서브태스크 없음)
+    depth: int = 1
+    completion_ratio: float = 0.3
+    first_user_id: int = 1
+    first_date: date = date(2025, 1, 1)
+    seed: int = 42
+    batch_size: int = 10000
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    """생성한 데이터의 ID 범위. Todo와 태스크 ID는 1부터 연속입니다."""
+
+    user_ids: List[int]
+    dates: List[date]
+    todo_count: int
+    task_count: int
+    # 최상위 태스크 ID (서로의 서브트리에 속하지 않음)
+    root_task_ids: List[int]
+
+    @property
+    def task_ids(self) -> range:
+        return range(1, self.task_count + 1)
+
+
+_TODO_COLUMNS = ("id", "user_id", "base_date")
+_TASK_COLUMNS = ("id", "title", "points", "todo_id", "user_id", "completed", "parent_id")
+
+
+class _BatchWriter:
+    """
+    행을 batch_size개씩 모아 INSERT합니다. 태스크를 쓰기 전에 참조하는 Todo를 먼저 씁니다.
+
+    INSERT 문은 테이블 정의로 한 번만 컴파일하고, 행은 드라이버에 튜플 그대로 넘겨
+    행마다 SQLAlchemy가 파라미터를 변환하는 비용을 없앱니다. 그래서 날짜는 ISO 문자열,
+    불리언은 0/1로 넣습니다.
+    """
+
+    def __init__(self, connection: Connection, batch_size: int) -> None:
+        self.connection = connection
+        self.batch_size = batch_size
+        self.todo_sql = _compile_insert(connection, TodoORM, _TODO_COLUMNS)
+        self.task_sql = _compile_insert(connection, TaskORM, _TASK_COLUMNS)
+        self.todos: List[tuple] = []
+        self.tasks: List[tuple] = []
+
+    def add_todo(self, row: tuple) -> None:
+        self.todos.append(row)
+        if len(self.todos) >= self.batch_size:
+            self.flush_todos()
+
+    def add_task(self, row: tuple) -> None:
+        self.tasks.append(row)
+        if len(self.tasks) >= self.batch_size:
+            self.flush()
+
+    def flush_todos(self) -> None:
+        if self.todos:
+            self.connection.exec_driver_sql(self.todo_sql, self.todos)
+            self.todos = []
+
+    def flush(self) -> None:
+        self.flush_todos()
+        if self.tasks:
+            # 부모 태스크가 자식보다 먼저 오도록 생성 순서대로 INSERT
+            self.connection.exec_driver_sql(self.task_sql, self.tasks)
+            self.tasks = []
+
+
+def _compile_insert(connection: Connection, orm_class, columns: Tuple[str, ...]) -> str:
+    """드라이버의 위치 파라미터 형식(?, %s)으로 컴파일한 INSERT 문"""
+    table = orm_class.__table__
+    statement = insert(table).values({column: None for column in columns})
+    compiled = statement.compile(dialect=connection.dialect)
+    if tuple(compiled.positiontup or ()) != columns:
+        raise ValueError(f"{table.name} INSERT 파라미터 순서가 예상과 다릅니다")
+    return str(compiled)
+
+
+def _between(rng: random.Random, bounds: Tuple[int, int]) -> int:
+    """rng.randint(*bounds)와 같은 범위의 정수 (적재 속도를 위해 random()만 사용)"""
+    low, high = bounds
+    return low + int(rng.random() * (high - low + 1))
+
+
+def _rebuild_user_stats(connection: Connection, user_ids: List[int]) -> None:
+    """TaskService가 유지하는 날짜별/누적 포인트 집계를 적재한 태스크로 한 번에 계산합니다."""
+    completed_points = case((TaskORM.completed, TaskORM.points), else_=0)
+    completed_tasks = case((TaskORM.completed, 1), else_=0)
+    columns = ["total_points", "completed_points", "task_count", "completed_task_count"]
+    daily = (
+        select(
+            TaskORM.user_id,
+            TodoORM.base_date,
+            func.sum(TaskORM.points),
+            func.sum(completed_points),
+            func.count(),
+            func.sum(completed_tasks),
+        )
+        .join(TodoORM, TodoORM.id == TaskORM.todo_id)
+        .where(TaskORM.user_id.between(user_ids[0], user_ids[-1]))
+        .group_by(TaskORM.user_id, TodoORM.base_date)
+    )
+    connection.execute(
+        insert(DailyUserStatsORM).from_select(["user_id", "base_date", *columns], daily)
+    )
+    lifetime = (
+        select(
+            DailyUserStatsORM.user_id,
+            *(func.sum(getattr(DailyUserStatsORM, column)) for column in columns),
+        )
+        .where(DailyUserStatsORM.user_id.between(user_ids[0], user_ids[-1]))
+        .group_by(DailyUserStatsORM.user_id)
+    )
+    connection.execute(insert(UserLifetimeStatsORM).from_select(["user_id", *columns], lifetime))
+
+
+def load_synthetic_data(connection: Connection, spec: SyntheticDataSpec) -> SyntheticDataset:
+    """
+    빈 테이블에 spec대로 합성 데이터를 INSERT합니다.
+
+    동기 Connection을 받으므로 비동기 엔진에서는 AsyncConnection.run_sync로 호출합니다.
+    커밋은 호출한 쪽에서 합니다.
+    """
+    rng = random.Random(spec.seed)
+    user_ids = list(range(spec.first_user_id, spec.first_user_id + spec.users))
+    dates = [spec.first_date + timedelta(days=offset) for offset in range(spec.days)]
+    iso_dates = [base_date.isoformat() for base_date in dates]
+
+    connection.execute(
+        insert(UserORM),
+        [
+            {"id": user_id, "kakao_id": f"synthetic-{user_id}", "nickname": f"user {user_id}"}
+            for user_id in user_ids
+        ],
+    )
+
+    writer = _BatchWriter(connection, spec.batch_size)
+    todo_id = 0
+    next_task_id = 1
+    root_task_ids: List[int] = []
+
+    def add_tree(todo_id: int, user_id: int, parent_id: Optional[int], depth: int) -> None:
+        nonlocal next_task_id
+        task_id = next_task_id
+        next_task_id += 1
+        writer.add_task(
+            (
+                task_id,
+                f"task {task_id}",
+                1 + int(rng.random() * 10),
+                todo_id,
+                user_id,
+                1 if rng.random() < spec.completion_ratio else 0,
+                parent_id,
+            )
+        )
+        if depth < spec.depth:
+            for _ in range(_between(rng, spec.subtask_fanout)):
+                add_tree(todo_id, user_id, task_id, depth + 1)
+
+    for user_id in user_ids:
+        for base_date in iso_dates:
+            todo_id += 1
+            writer.add_todo((todo_id, user_id, base_date))
+            for _ in range(_between(rng, spec.tasks_per_day)):
+                root_task_ids.append(next_task_id)
+                add_tree(todo_id, user_id, None, 0)
+    writer.flush()
+    _rebuild_user_stats(connection, user_ids)
+
+    return SyntheticDataset(
+        user_ids=user_ids,
+        dates=dates,
+        todo_count=todo_id,
+        task_count=next_task_id - 1,
+        root_task_ids=root_task_ids,
+    )
+
+
+def _bulk_load(connection: Connection, spec: SyntheticDataSpec) -> SyntheticDataset:
+    """이 연결에서만 디스크 동기화/제약 검사를 줄인 뒤 적재합니다."""
+    if connection.dialect.name == "mysql":
+        connection.exec_driver_sql("SET unique_checks = 0, foreign_key_checks = 0")
+        return load_synthetic_data(connection, spec)
+
+    # 드라이버가 INSERT 직전에 트랜잭션을 열기 때문에 아직 트랜잭션 밖에서 실행됨
+    connection.exec_driver_sql("PRAGMA synchronous = OFF")
+    # 행마다 보조 인덱스를 갱신하지 않도록 인덱스를 지우고 적재한 뒤 한 번에 다시 만듦
+    # (MySQL은 외래 키에 필요한 인덱스를 지울 수 없으므로 SQLite에서만)
+    indexes = [index for orm_class in (TodoORM, TaskORM) for index in orm_class.__table__.indexes]
+    for index in indexes:
+        index.drop(connection)
+    dataset = load_synthetic_data(connection, spec)
+    for index in indexes:
+        index.create(connection)
+    return dataset
+
+
+async def generate(database_url: str, spec: SyntheticDataSpec, reset: bool) -> SyntheticDataset:
+    url = to_async_database_url(database_url)
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as connection:
+            if reset:
+                await connection.run_sync(Base.metadata.drop_all)
+            await connection.run_sync(Base.metadata.create_all)
+        # 적재용 세션 설정이 풀에 돌아가 다른 작업에 남지 않도록 적재 후 연결을 버림
+        async with engine.connect() as connection:
+            dataset = await connection.run_sync(_bulk_load, spec)
+            await connection.commit()
+            await connection.invalidate()
+        return dataset
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 만든 뒤 적재")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--tasks-per-day", type=int, nargs=2, default=[2, 6], metavar=("MIN", "MAX"))
+    parser.add_argument(
+        "--subtask-fanout", type=int, nargs=2, default=[0, 3], metavar=("MIN", "MAX")
+    )
+    parser.add_argument("--depth", type=int, default=1, help="서브태스크 트리 깊이")
+    parser.add_argument("--completion-ratio", type=float, default=0.3)
+    parser.add_argument("--first-user-id", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    spec = SyntheticDataSpec(
+        users=args.users,
+        days=args.days,
+        tasks_per_day=tuple(args.tasks_per_day),
+        subtask_fanout=tuple(args.subtask_fanout),
+        depth=args.depth,
+        completion_ratio=args.completion_ratio,
+        first_user_id=args.first_user_id,
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+    started = time.perf_counter()
+    dataset = asyncio.run(generate(args.database_url, spec, args.reset))
+    elapsed = time.perf_counter() - started
+    rows = len(dataset.user_ids) + dataset.todo_count + dataset.task_count
+    print(
+        f"users {len(dataset.user_ids)}  todos {dataset.todo_count}  tasks {dataset.task_count}  "
+        f"{elapsed:.1f} s ({rows / elapsed:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+태스크 트리 연쇄 삭제 벤치마크
+
+기존 Python 재귀 삭제(노드마다 SELECT 2번 + DELETE 1번)와
+WITH RECURSIVE 기반 삭제를 깊은 트리/넓은 트리에서 비교합니다.
+
+    poetry run python -m benchmarks.task_subtree_delete
+    poetry run python -m benchmarks.task_subtree_delete --database-url "mysql+aiomysql://..."
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import (
+    Database,
+    UnitOfWork,
+    enable_sqlite_transactions,
+    to_async_database_url,
+)
+from src.infrastructure.database.sqlalchemy_models import (
+    Base,
+    TaskORM,
+    TodoORM,
+    UserORM,
+)
+from src.infrastructure.database.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+BENCH_USER_ID = 1
+
+
+def deep_tree(size: int) -> Dict[int, Optional[int]]:
+    """1 -> 2 -> ... -> size 체인"""
+    return {task_id: task_id - 1 or None for task_id in range(1, size + 1)}
+
+
+def wide_tree(size: int) -> Dict[int, Optional[int]]:
+    """루트 하나에 size - 1개의 자식"""
+    return {task_id: 1 if task_id > 1 else None for task_id in range(1, size + 1)}
+
+
+async def legacy_delete_with_descendants(unit_of_work: UnitOfWork, task_id: int) -> None:
+    """변경 전 구현: 노드마다 자식 조회, 자기 조회, ORM 삭제를 재귀로 수행"""
+
+    async def delete_recursive(session, task_id: int) -> None:
+        subtasks = (
+            await session.scalars(select(TaskORM).where(TaskORM.parent_id == task_id))
+        ).all()
+        for subtask in subtasks:
+            await delete_recursive(session, subtask.id)
+        task_orm = await session.get(TaskORM, task_id)
+        if task_orm:
+            await session.delete(task_orm)
+
+    async with unit_of_work.session() as session:
+        await delete_recursive(session, task_id)
+        await session.flush()
+
+
+async def reset_tasks(database_engine, parent_ids: Dict[int, Optional[int]]) -> None:
+    async with database_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(insert(UserORM), [{"id": BENCH_USER_ID, "kakao_id": "bench"}])
+        await connection.execute(
+            insert(TodoORM),
+            [{"id": 1, "user_id": BENCH_USER_ID, "base_date": date(2025, 1, 1)}],
+        )
+        # 부모가 먼저 삽입되도록 ID 순으로 정렬
+        await connection.execute(
+            insert(TaskORM),
+            [
+                {
+                    "id": task_id,
+                    "title": f"task {task_id}",
+                    "points": 1,
+                    "todo_id": 1,
+                    "user_id": BENCH_USER_ID,
+                    "completed": False,
+                    "parent_id": parent_id,
+                }
+                for task_id, parent_id in sorted(parent_ids.items())
+            ],
+        )
+
+
+async def measure(
+    engine, parent_ids: Dict[int, Optional[int]], delete: Callable, repeat: int
+) -> str:
+    statements: List[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    timings = []
+    for _ in range(repeat):
+        await reset_tasks(engine, parent_ids)
+        statements.clear()
+        event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+        try:
+            started = time.perf_counter()
+            await delete(1)
+            timings.append(time.perf_counter() - started)
+        except RecursionError:
+            return "RecursionError"
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    return f"{min(timings) * 1000:9.1f} ms  {len(statements):6d} stmts"
+
+
+async def run(database_url: str, sizes: List[int], repeat: int) -> None:
+    url = to_async_database_url(database_url)
+    engine = create_async_engine(url)
+    if url.get_backend_name() == "sqlite":
+        enable_sqlite_transactions(engine)
+    unit_of_work = UnitOfWork(Database(engine))
+    repository = SQLAlchemyTaskRepository(unit_of_work.session)
+
+    paths = {
+        "legacy": lambda task_id: legacy_delete_with_descendants(unit_of_work, task_id),
+        "cte": repository.delete_with_descendants,
+    }
+    shapes = {"deep": deep_tree, "wide": wide_tree}
+
+    print(f"{'shape':<6}{'nodes':>7}  " + "".join(f"{name:<28}" for name in paths))
+    try:
+        for shape, build in shapes.items():
+            for size in sizes:
+                parent_ids = build(size)
+                results = [
+                    await measure(engine, parent_ids, delete, repeat)
+                    for delete in paths.values()
+                ]
+                print(f"{shape:<6}{size:>7}  " + "".join(f"{result:<28}" for result in results))
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    # 기존 구현의 RecursionError 롤백 로그가 결과 표를 가리지 않도록 숨김
+    logging.getLogger("src.database").setLevel(logging.CRITICAL)
+
+    if args.database_url:
+        asyncio.run(run(args.database_url, args.sizes, args.repeat))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        asyncio.run(run(database_url, args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
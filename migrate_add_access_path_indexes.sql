@@ -0,0 +1,31 @@
+-- Migration script to align indexes with the todo/task access paths
+
+-- Merge duplicate todos per (user_id, base_date) into the oldest one before adding the unique constraint
+CREATE TEMPORARY TABLE todo_keep AS
+SELECT user_id, base_date, MIN(id) AS keep_id
+FROM todos
+GROUP BY user_id, base_date
+HAVING COUNT(*) > 1;
+
+UPDATE tasks t
+JOIN todos d ON d.id = t.todo_id
+JOIN todo_keep k ON k.user_id = d.user_id AND k.base_date = d.base_date
+SET t.todo_id = k.keep_id
+WHERE d.id <> k.keep_id;
+
+DELETE d FROM todos d
+JOIN todo_keep k ON k.user_id = d.user_id AND k.base_date = d.base_date
+WHERE d.id <> k.keep_id;
+
+DROP TEMPORARY TABLE todo_keep;
+
+-- One todo per user and date; also serves (user_id, base_date) lookups and range scans
+ALTER TABLE todos
+ADD CONSTRAINT uq_todos_user_id_base_date UNIQUE (user_id, base_date);
+
+-- Task lookups by todo/user (and parent) and subtask lookups / cascading deletes by parent
+CREATE INDEX ix_tasks_todo_id_user_id_parent_id ON tasks (todo_id, user_id, parent_id);
+CREATE INDEX ix_tasks_parent_id ON tasks (parent_id);
+
+-- No query filters or sorts by title
+DROP INDEX ix_tasks_title ON tasks;
@@ -0,0 +1,4 @@
+-- Migration script to add a per-user data version used for ETag / If-None-Match on todo and task reads
+
+ALTER TABLE users
+ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,40 @@
+-- Migration script to add per-user daily and lifetime task point rollups maintained by TaskService
+
+CREATE TABLE daily_user_stats (
+    user_id INTEGER NOT NULL,
+    base_date DATE NOT NULL,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    completed_points INTEGER NOT NULL DEFAULT 0,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    completed_task_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, base_date),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE TABLE user_lifetime_stats (
+    user_id INTEGER NOT NULL,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    completed_points INTEGER NOT NULL DEFAULT 0,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    completed_task_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- Backfill from existing tasks (run before deploying the code that maintains the rollups)
+INSERT INTO daily_user_stats
+    (user_id, base_date, total_points, completed_points, task_count, completed_task_count)
+SELECT t.user_id, d.base_date,
+       COALESCE(SUM(t.points), 0),
+       COALESCE(SUM(CASE WHEN t.completed THEN t.points ELSE 0 END), 0),
+       COUNT(*),
+       SUM(CASE WHEN t.completed THEN 1 ELSE 0 END)
+FROM tasks t
+JOIN todos d ON d.id = t.todo_id
+GROUP BY t.user_id, d.base_date;
+
+INSERT INTO user_lifetime_stats
+    (user_id, total_points, completed_points, task_count, completed_task_count)
+SELECT user_id, SUM(total_points), SUM(completed_points), SUM(task_count), SUM(completed_task_count)
+FROM daily_user_stats
+GROUP BY user_id;
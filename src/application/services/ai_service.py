@@ -1,35 +1,121 @@
-from typing import Dict, Any
+import asyncio
+import copy
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union
 from datetime import date
 
 from src.infrastructure.ai.base_model_service import AIModelService
+from src.infrastructure.ai.cached_model_service import normalize_user_input
+from src.infrastructure.ai.rate_limiter import AIRateLimiter
+from src.infrastructure.concurrency.single_flight import SingleFlight
 
 
 class AIService:
     """AI 모델을 사용하여 TODO 생성 기능을 제공하는 서비스"""
 
-    def __init__(self, model_service: AIModelService):
+    def __init__(
+        self,
+        model_service: AIModelService,
+        single_flight: Optional[SingleFlight] = None,
+        batch_concurrency: int = 4,
+        rate_limiter: Optional[AIRateLimiter] = None,
+    ):
         """
         AIService 초기화
 
         Args:
             model_service: 사용할 AI 모델 서비스 (GeminiModelService, ClaudeModelService 등)
+            single_flight: 정규화한 입력과 날짜가 같은 동시 요청을 모델 호출 하나로 합치는 그룹
+                (None이면 요청마다 호출)
+            batch_concurrency: 일괄 생성 시 동시에 진행할 최대 모델 호출 수
+            rate_limiter: 요청마다 사용자별 한도를 차감할 한도 관리자 (None이면 사용자별 한도 없음)
         """
+        if batch_concurrency <= 0:
+            raise ValueError("batch_concurrency must be positive")
         self.model_service = model_service
+        self.single_flight = single_flight
+        self.batch_concurrency = batch_concurrency
+        self.rate_limiter = rate_limiter
 
-    def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+    async def generate_todos_from_text(
+        self, user_input: str, target_date: date = None, user_id: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         자연어 입력을 받아 TODO 목록을 생성합니다.
 
         Args:
             user_input: 사용자의 자연어 입력
             target_date: TODO의 기준 날짜 (없으면 오늘)
+            user_id: 요청한 사용자 (사용자별 요청 한도 계산용)
 
         Returns:
             생성된 TODO와 Task 목록을 담은 딕셔너리
+
+        Raises:
+            AIRateLimitExceeded: 사용자별 요청 한도나 모델 호출 한도를 넘어 요청이 거절된 경우
         """
         if target_date is None:
             target_date = date.today()
 
-        result = self.model_service.generate_todos_from_text(user_input, target_date)
+        # 합쳐진 실행 안에서는 어느 사용자의 요청인지 구분할 수 없으므로 합류 전에 차감
+        self._acquire_user(user_id)
+        if self.single_flight is None:
+            result = await self.model_service.generate_todos_from_text(user_input, target_date)
+        else:
+            key = (normalize_user_input(user_input), target_date)
+            shared_result = await self.single_flight.do(
+                key, lambda: self.model_service.generate_todos_from_text(user_input, target_date)
+            )
+            # 합쳐진 요청들이 같은 결과 객체를 받으므로 복사본을 수정
+            result = copy.deepcopy(shared_result)
         result["base_date"] = target_date.isoformat()
-        return result
\ No newline at end of file
+        return result
+
+    async def generate_todos_batch(
+        self, requests: List[Tuple[str, Optional[date]]], user_id: Optional[int] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        여러 (입력, 날짜)에 대한 TODO를 최대 batch_concurrency개씩 동시에 생성합니다.
+
+        Args:
+            requests: (사용자의 자연어 입력, 기준 날짜) 목록
+            user_id: 요청한 사용자 (항목마다 사용자별 요청 한도에서 차감)
+
+        Returns:
+            입력 순서대로 생성 결과 또는 해당 항목에서 발생한 예외.
+            한 항목이 실패해도 나머지 항목은 계속 생성합니다.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def generate(user_input: str, target_date: Optional[date]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_todos_from_text(user_input, target_date, user_id)
+
+        return await asyncio.gather(
+            *(generate(user_input, target_date) for user_input, target_date in requests),
+            return_exceptions=True,
+        )
+
+    async def stream_todos_from_text(
+        self, user_input: str, target_date: date = None, user_id: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        자연어 입력으로 생성한 태스크를 모델 응답이 도착하는 대로 하나씩 내보냅니다.
+
+        Args:
+            user_input: 사용자의 자연어 입력
+            target_date: TODO의 기준 날짜 (없으면 오늘)
+            user_id: 요청한 사용자 (사용자별 요청 한도 계산용)
+
+        Yields:
+            서브태스크를 포함한 태스크 딕셔너리
+        """
+        if target_date is None:
+            target_date = date.today()
+
+        self._acquire_user(user_id)
+        async for task in self.model_service.stream_tasks_from_text(user_input, target_date):
+            yield task
+
+    def _acquire_user(self, user_id: Optional[int]) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_user(user_id)
\ No newline at end of file
@@ -1,10 +1,14 @@
+import hashlib
 import os
+import time
 from typing import Optional, Dict, Any
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from src.domain.models.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.application.services.social_auth_provider import SocialAuthProvider
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
 
 
 # 기본값 상수
@@ -19,10 +23,16 @@ class AuthService:
         self,
         user_repository: UserRepository,
         auth_provider: SocialAuthProvider,
+        todo_tree_cache: Optional[TodoTreeCache] = None,
+        verified_token_cache: Optional[LRUTTLCache] = None,
     ):
         self._user_repository = user_repository
         self._auth_provider = auth_provider
+        self._todo_tree_cache = todo_tree_cache or TodoTreeCache(enabled=False)
+        self._verified_token_cache = verified_token_cache
         self._secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key")
+        # 서명 키가 다른 AuthService가 같은 캐시를 써도 서로의 검증 결과를 재사용하지 않도록 키에 포함
+        self._secret_key_digest = hashlib.sha256(self._secret_key.encode()).digest()
         self._algorithm = "HS256"
         self._access_token_expire_minutes = 30
 
@@ -38,10 +48,10 @@ class AuthService:
             code, client_id, client_secret, redirect_uri
         )
 
-    def get_or_create_user(self, kakao_user_info: Dict[str, Any]) -> User:
+    async def get_or_create_user(self, kakao_user_info: Dict[str, Any]) -> User:
         """카카오 사용자 정보로 유저 조회 또는 생성"""
         kakao_id = str(kakao_user_info["id"])
-        existing_user = self._user_repository.get_by_kakao_id(kakao_id)
+        existing_user = await self._user_repository.get_by_kakao_id(kakao_id)
 
         if existing_user:
             return existing_user
@@ -61,7 +71,7 @@ class AuthService:
             email=kakao_account.get("email"),
         )
 
-        return self._user_repository.create(new_user)
+        return await self._user_repository.create(new_user)
 
     def create_access_token(self, user: User) -> str:
         """JWT 액세스 토큰 생성"""
@@ -78,17 +88,40 @@ class AuthService:
         return encoded_jwt
 
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """JWT 토큰 검증"""
+        """
+        JWT 토큰 검증
+
+        검증에 성공한 payload는 토큰 만료(exp) 시각까지 캐시에 보관해, 같은 토큰의
+        반복 요청에서는 서명 검증과 파싱을 건너뜁니다. 실패한 토큰은 캐시하지 않습니다.
+        """
+        cache_key = None
+        if self._verified_token_cache is not None:
+            cache_key = (
+                self._secret_key_digest,
+                hashlib.sha256(token.encode()).digest(),
+            )
+            cached_payload = self._verified_token_cache.get(cache_key)
+            if cached_payload is not None:
+                return dict(cached_payload)
+
         try:
             payload = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
-            return payload
         except JWTError:
             return None
 
+        expires_at = payload.get("exp")
+        if cache_key is not None and isinstance(expires_at, (int, float)):
+            ttl_seconds = expires_at - time.time()
+            if ttl_seconds > 0:
+                self._verified_token_cache.set(cache_key, dict(payload), ttl_seconds)
+        return payload
+
     async def unlink_kakao_account(self, kakao_id: str) -> bool:
         """카카오 계정 연결 해제 (Admin Key 사용)"""
         return await self._auth_provider.unlink_account(kakao_id)
 
-    def delete_user(self, user_id: int) -> bool:
+    async def delete_user(self, user_id: int) -> bool:
         """사용자 계정 삭제 (회원탈퇴)"""
-        return self._user_repository.delete(user_id)
+        deleted = await self._user_repository.delete(user_id)
+        self._todo_tree_cache.invalidate_user(user_id)
+        return deleted
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
+
+
+class DataVersionService:
+    """
+    사용자별 데이터 버전을 관리하는 서비스
+
+    Todo/Task 쓰기마다 같은 트랜잭션에서 버전을 올리고 Todo 트리 캐시를 무효화합니다.
+    조회 API는 이 버전으로 ETag를 만들어 변경이 없으면 304를 응답합니다.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        todo_tree_cache: Optional[TodoTreeCache] = None,
+    ):
+        self._user_repository = user_repository
+        self._todo_tree_cache = todo_tree_cache or TodoTreeCache(enabled=False)
+
+    async def get_version(self, user_id: int) -> Optional[int]:
+        """사용자의 현재 데이터 버전. 사용자가 없으면 None"""
+        return await self._user_repository.get_data_version(user_id)
+
+    async def mark_changed(self, user_id: int) -> None:
+        """사용자의 Todo/Task가 변경되었음을 기록합니다."""
+        await self._user_repository.increment_data_version(user_id)
+        self._todo_tree_cache.invalidate_user(user_id)
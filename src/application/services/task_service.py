@@ -1,59 +1,112 @@
 from typing import List, Optional
 
 from src.domain.models.task import Task
+from src.domain.models.task_stats import TaskStats
 from src.domain.repositories.task_repository import ITaskRepository
+from src.application.services.data_version_service import DataVersionService
+from src.application.services.user_stats_service import UserStatsService
 
 
 class TaskService:
-    def __init__(self, task_repository: ITaskRepository):
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        data_version_service: Optional[DataVersionService] = None,
+        user_stats_service: Optional[UserStatsService] = None,
+    ):
         self.task_repository = task_repository
+        self.data_version_service = data_version_service
+        self.user_stats_service = user_stats_service
 
-    def create_task(self, task: Task) -> Task:
+    async def create_task(self, task: Task) -> Task:
         # 서브태스크가 또 다른 서브태스크를 가지는 것을 방지
         if task.parent_id is not None:
-            parent_task = self.task_repository.get_by_id(task.parent_id)
+            parent_task = await self.task_repository.get_by_id(task.parent_id)
             if parent_task and parent_task.parent_id is not None:
                 raise ValueError("서브태스크는 또 다른 서브태스크를 가질 수 없습니다.")
         
-        return self.task_repository.create(task)
+        created_task = await self.task_repository.create(task)
+        await self._record_stats(task.user_id, task.todo_id, TaskStats.of(created_task))
+        await self._mark_changed(task.user_id)
+        return created_task
 
-    def get_task_by_id(self, task_id: int) -> Optional[Task]:
-        return self.task_repository.get_by_id(task_id)
+    async def create_tasks_bulk(self, todo_id: int, user_id: int, tasks: List[Task]) -> List[Task]:
+        """
+        여러 태스크를 한 번에 생성하고, 생성된 부모 태스크 트리를 반환합니다.
 
-    def get_tasks_by_todo_id(self, todo_id: int) -> List[Task]:
-        return self.task_repository.get_by_todo_id(todo_id)
+        각 task의 parent_id는 DB ID가 아니라 tasks 목록에서 앞에 위치한 부모 태스크의 인덱스입니다.
+        """
+        parent_tasks = []
+        parent_tasks_by_index = {}
+        for index, task in enumerate(tasks):
+            task.todo_id = todo_id
+            task.user_id = user_id
+            task.subtasks = []
+
+            if task.parent_id is None:
+                parent_tasks.append(task)
+                parent_tasks_by_index[index] = task
+                continue
+
+            parent_task = parent_tasks_by_index.get(task.parent_id)
+            if parent_task is None:
+                if 0 <= task.parent_id < index:
+                    raise ValueError("서브태스크는 또 다른 서브태스크를 가질 수 없습니다.")
+                raise ValueError(f"Invalid parent_id: {task.parent_id}")
+
+            # 실제 parent_id는 부모 태스크 삽입 후 저장소에서 채워짐
+            task.parent_id = None
+            parent_task.subtasks.append(task)
+
+        if not parent_tasks:
+            return []
+        created_tasks = await self.task_repository.create_with_subtasks(parent_tasks)
+        await self._record_stats(user_id, todo_id, TaskStats.of_tree(created_tasks))
+        await self._mark_changed(user_id)
+        return created_tasks
+
+    async def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        return await self.task_repository.get_by_id(task_id)
+
+    async def get_tasks_by_todo_id(self, todo_id: int) -> List[Task]:
+        return await self.task_repository.get_by_todo_id(todo_id)
     
-    def get_task_with_subtasks(self, task_id: int) -> Optional[Task]:
-        task = self.task_repository.get_by_id(task_id)
+    async def get_task_with_subtasks(self, task_id: int) -> Optional[Task]:
+        task = await self.task_repository.get_by_id(task_id)
         if task:
-            task.subtasks = self.task_repository.get_subtasks_by_parent_id(task_id)
+            task.subtasks = await self.task_repository.get_subtasks_by_parent_id(task_id)
         return task
     
-    def get_tasks_with_subtasks_by_todo_id(self, todo_id: int, user_id: int) -> List[Task]:
-        tasks = self.task_repository.get_by_todo_id_and_user(todo_id, user_id)
+    async def get_tasks_with_subtasks_by_todo_id(self, todo_id: int, user_id: int) -> List[Task]:
+        tasks = await self.task_repository.get_by_todo_id_and_user(todo_id, user_id)
         # 부모 태스크만 필터링 (parent_id가 None인 것들)
         parent_tasks = [task for task in tasks if task.parent_id is None]
         
-        # 각 부모 태스크에 subtask들을 추가
-        for task in parent_tasks:
-            task.subtasks = self.task_repository.get_subtasks_by_parent_id(task.id)
+        # 한 번 조회한 목록 안에서 각 부모 태스크에 subtask들을 추가
+        tasks_by_id = {task.id: task for task in parent_tasks}
+        for task in tasks:
+            if task.parent_id is not None and task.parent_id in tasks_by_id:
+                tasks_by_id[task.parent_id].subtasks.append(task)
         
         return parent_tasks
 
-    def update_task(
+    async def update_task(
         self, task_id: int, title: Optional[str] = None, points: Optional[int] = None, completed: Optional[bool] = None, parent_id: Optional[int] = None, user_id: int = None
     ) -> Task:
         """태스크의 기본 정보를 전체 수정합니다."""
-        task = self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id)
         if not task or task.user_id != user_id:
             raise ValueError(f"Task with id {task_id} not found")
 
-        # parent_id 변경 시 서브태스크 depth 검증
+        # parent_id 변경 시 순환과 서브태스크 depth 검증
         if parent_id is not None and parent_id != task.parent_id:
-            parent_task = self.task_repository.get_by_id(parent_id)
+            if await self._is_self_or_descendant(parent_id, task_id):
+                raise ValueError("태스크 자신이나 하위 태스크를 부모로 지정할 수 없습니다.")
+            parent_task = await self.task_repository.get_by_id(parent_id)
             if parent_task and parent_task.parent_id is not None:
                 raise ValueError("서브태스크는 또 다른 서브태스크를 가질 수 없습니다.")
 
+        before = TaskStats.of(task)
         if title is not None:
             task.update_title(title)
         if points is not None:
@@ -63,21 +116,49 @@ class TaskService:
         if parent_id is not None:
             task.parent_id = parent_id
 
-        return self.task_repository.update(task)
+        updated_task = await self.task_repository.update(task)
+        await self._record_stats(user_id, task.todo_id, TaskStats.of(updated_task) - before)
+        await self._mark_changed(user_id)
+        return updated_task
 
-    def toggle_task_completion(self, task_id: int, user_id: int) -> Task:
+    async def toggle_task_completion(self, task_id: int, user_id: int) -> Task:
         """태스크의 완료 상태를 토글합니다."""
-        task = self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id)
         if not task or task.user_id != user_id:
             raise ValueError(f"Task with id {task_id} not found")
 
+        before = TaskStats.of(task)
         task.toggle_completion()
-        return self.task_repository.update(task)
+        updated_task = await self.task_repository.update(task)
+        await self._record_stats(user_id, task.todo_id, TaskStats.of(updated_task) - before)
+        await self._mark_changed(user_id)
+        return updated_task
 
-    def delete_task(self, task_id: int, user_id: int) -> None:
+    async def delete_task(self, task_id: int, user_id: int) -> None:
         """태스크와 모든 하위 태스크를 연쇄 삭제합니다."""
-        task = self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id)
         if not task or task.user_id != user_id:
             raise ValueError(f"Task with id {task_id} not found")
         
-        self.task_repository.delete_with_descendants(task_id)
+        deleted = await self.task_repository.delete_with_descendants(task_id)
+        await self._record_stats(user_id, task.todo_id, -deleted)
+        await self._mark_changed(user_id)
+
+    async def _is_self_or_descendant(self, candidate_id: int, task_id: int) -> bool:
+        """candidate_id에서 부모를 따라 올라가다 task_id를 만나는지 확인합니다."""
+        visited = set()
+        while candidate_id is not None and candidate_id not in visited:
+            if candidate_id == task_id:
+                return True
+            visited.add(candidate_id)
+            candidate = await self.task_repository.get_by_id(candidate_id)
+            candidate_id = candidate.parent_id if candidate else None
+        return False
+
+    async def _record_stats(self, user_id: int, todo_id: int, delta: TaskStats) -> None:
+        if self.user_stats_service:
+            await self.user_stats_service.record(user_id, todo_id, delta)
+
+    async def _mark_changed(self, user_id: int) -> None:
+        if self.data_version_service:
+            await self.data_version_service.mark_changed(user_id)
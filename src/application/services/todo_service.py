@@ -1,46 +1,75 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from src.domain.models.todo import Todo
 from src.domain.repositories.todo_repository import ITodoRepository
 from src.application.services.task_service import TaskService
+from src.application.services.data_version_service import DataVersionService
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
 
 class TodoService:
-    def __init__(self, todo_repository: ITodoRepository, task_service: TaskService):
+    def __init__(
+        self,
+        todo_repository: ITodoRepository,
+        task_service: TaskService,
+        todo_tree_cache: Optional[TodoTreeCache] = None,
+        data_version_service: Optional[DataVersionService] = None,
+    ):
         self.todo_repository = todo_repository
         self.task_service = task_service
+        self.todo_tree_cache = todo_tree_cache or TodoTreeCache(enabled=False)
+        self.data_version_service = data_version_service
 
-    def get_all_todos(self) -> List[Todo]:
-        return self.todo_repository.get_all_todos()
+    async def get_all_todos(self) -> List[Todo]:
+        return await self.todo_repository.get_all_todos()
     
-    def get_all_todos_with_tasks(self, user_id: int) -> List[Todo]:
-        todos = self.todo_repository.get_all_todos_by_user(user_id)
-        for todo in todos:
-            todo.tasks = self.task_service.get_tasks_with_subtasks_by_todo_id(todo.id, user_id)
-        return todos
+    async def get_all_todos_with_tasks(self, user_id: int) -> List[Todo]:
+        return await self.todo_tree_cache.get_all_todos(
+            user_id, lambda: self.todo_repository.get_todos_with_tasks_by_user(user_id)
+        )
     
-    def get_todos_by_date_with_tasks(self, target_date: date, user_id: int) -> List[Todo]:
-        todos = self.todo_repository.get_todos_by_date_and_user(target_date, user_id)
-        for todo in todos:
-            todo.tasks = self.task_service.get_tasks_with_subtasks_by_todo_id(todo.id, user_id)
-        return todos
+    async def get_todos_page_with_tasks(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> Tuple[List[Todo], bool]:
+        """최신 날짜부터 Todo 페이지를 조회하고, 다음 페이지가 있는지 여부를 함께 반환합니다."""
+        todos = await self.todo_repository.get_todos_page_with_tasks(
+            user_id, limit + 1, after, date_from, date_to
+        )
+        return todos[:limit], len(todos) > limit
     
-    def get_todo_by_id(self, todo_id: int) -> Optional[Todo]:
-        return self.todo_repository.get_by_id(todo_id)
+    async def get_todos_by_date_with_tasks(self, target_date: date, user_id: int) -> List[Todo]:
+        return await self.todo_tree_cache.get_todos_by_date(
+            user_id,
+            target_date,
+            lambda: self.todo_repository.get_todos_with_tasks_by_user(user_id, target_date),
+        )
     
-    def get_todo_with_tasks(self, todo_id: int) -> Optional[Todo]:
-        todo = self.todo_repository.get_by_id(todo_id)
-        if todo:
-            todo.tasks = self.task_service.get_tasks_with_subtasks_by_todo_id(todo_id, todo.user_id)
-        return todo
+    async def get_todo_by_id(self, todo_id: int) -> Optional[Todo]:
+        return await self.todo_repository.get_by_id(todo_id)
+    
+    async def get_todo_with_tasks(self, todo_id: int) -> Optional[Todo]:
+        return await self.todo_tree_cache.get_todo(
+            todo_id, lambda: self.todo_repository.get_todo_with_tasks(todo_id)
+        )
 
-    def create_todo(self, base_date: Optional[date] = None, user_id: int = None) -> Todo:
+    async def create_todo(self, base_date: Optional[date] = None, user_id: int = None) -> Todo:
         if base_date is None:
             base_date = date.today()
         
         # Check if todo already exists for this date and user
-        existing_todos = self.todo_repository.get_todos_by_date_and_user(base_date, user_id)
+        existing_todos = await self.todo_repository.get_todos_by_date_and_user(base_date, user_id)
         if existing_todos:
             return existing_todos[0]
         
         todo = Todo(base_date=base_date, user_id=user_id)
-        return self.todo_repository.create_todo(todo)
+        created_todo = await self.todo_repository.create_todo(todo)
+        await self._mark_changed(user_id)
+        return created_todo
+
+    async def _mark_changed(self, user_id: int) -> None:
+        if self.data_version_service:
+            await self.data_version_service.mark_changed(user_id)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List
+
+from src.domain.models.task_stats import TaskStats
+from src.domain.repositories.user_stats_repository import IUserStatsRepository
+
+
+@dataclass(frozen=True)
+class UserStatsSummary:
+    base_date: date
+    today: TaskStats
+    # base_date가 속한 주 (월요일~일요일)
+    week: TaskStats
+    lifetime: TaskStats
+
+
+# 달력 조회 한 번에 담을 수 있는 최대 일수 (윤년 1년)
+MAX_CALENDAR_DAYS = 366
+
+
+@dataclass(frozen=True)
+class CalendarStats:
+    """date_from부터 하루씩의 집계를 항목별 배열로 담은 달력 (i번째 값은 date_from + i일)"""
+
+    date_from: date
+    date_to: date
+    total_points: List[int]
+    completed_points: List[int]
+    task_count: List[int]
+    completed_task_count: List[int]
+
+
+class UserStatsService:
+    """
+    사용자별 포인트/태스크 집계를 관리하는 서비스
+
+    TaskService가 태스크를 쓸 때 같은 트랜잭션에서 날짜별 집계와 누적 집계에 변화량을 더하므로,
+    조회는 태스크를 읽지 않고 집계 행 몇 개만 읽습니다.
+    """
+
+    def __init__(self, user_stats_repository: IUserStatsRepository):
+        self._user_stats_repository = user_stats_repository
+
+    async def record(self, user_id: int, todo_id: int, delta: TaskStats) -> None:
+        """todo_id에 속한 태스크들의 변화량을 집계에 반영합니다."""
+        if delta.is_zero():
+            return
+        await self._user_stats_repository.add(user_id, todo_id, delta)
+
+    async def get_summary(self, user_id: int, base_date: date) -> UserStatsSummary:
+        week_start = base_date - timedelta(days=base_date.weekday())
+        return UserStatsSummary(
+            base_date=base_date,
+            today=await self._user_stats_repository.get_daily_total(user_id, base_date, base_date),
+            week=await self._user_stats_repository.get_daily_total(
+                user_id, week_start, week_start + timedelta(days=6)
+            ),
+            lifetime=await self._user_stats_repository.get_lifetime(user_id),
+        )
+
+    async def get_calendar(self, user_id: int, date_from: date, date_to: date) -> CalendarStats:
+        """기간의 날짜별 집계. 태스크가 없는 날은 0으로 채웁니다."""
+        if date_from > date_to:
+            raise ValueError("from must not be after to")
+        days = (date_to - date_from).days + 1
+        if days > MAX_CALENDAR_DAYS:
+            raise ValueError(f"Date range must not exceed {MAX_CALENDAR_DAYS} days")
+
+        daily = await self._user_stats_repository.get_daily_from_tasks(
+            user_id, date_from, date_to
+        )
+        calendar = [
+            daily.get(date_from + timedelta(days=offset), TaskStats()) for offset in range(days)
+        ]
+        return CalendarStats(
+            date_from=date_from,
+            date_to=date_to,
+            total_points=[stats.total_points for stats in calendar],
+            completed_points=[stats.completed_points for stats in calendar],
+            task_count=[stats.task_count for stats in calendar],
+            completed_task_count=[stats.completed_task_count for stats in calendar],
+        )
@@ -1,9 +1,11 @@
+import httpx
 from dependency_injector import containers, providers
 
-from src.database import Database, create_db_engine
+from src.database import Database, UnitOfWork, create_db_engine
 from src.domain.repositories.todo_repository import ITodoRepository
 from src.domain.repositories.task_repository import ITaskRepository
 from src.domain.repositories.user_repository import UserRepository
+from src.domain.repositories.user_stats_repository import IUserStatsRepository
 from src.infrastructure.database.sqlalchemy_todo_repository import (
     SQLAlchemyTodoRepository,
 )
@@ -13,12 +15,28 @@ from src.infrastructure.database.sqlalchemy_task_repository import (
 from src.infrastructure.database.sqlalchemy_user_repository import (
     SqlAlchemyUserRepository,
 )
+from src.infrastructure.database.sqlalchemy_user_stats_repository import (
+    SQLAlchemyUserStatsRepository,
+)
 from src.application.services.todo_service import TodoService
 from src.application.services.task_service import TaskService
 from src.application.services.auth_service import AuthService
 from src.application.services.ai_service import AIService
+from src.application.services.data_version_service import DataVersionService
+from src.application.services.user_stats_service import UserStatsService
+from src.infrastructure.ai.cached_model_service import CachedAIModelService, open_ai_result_cache
+from src.infrastructure.ai.fallback_model_service import FallbackAIModelService
 from src.infrastructure.ai.gemini_model_service import GeminiModelService
+from src.infrastructure.ai.rate_limited_model_service import RateLimitedAIModelService
+from src.infrastructure.ai.rate_limiter import AIRateLimiter
+from src.infrastructure.ai.telemetry import AITelemetry
 from src.infrastructure.auth import KakaoAuthProvider
+from src.infrastructure.http.client import create_http_client
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
+from src.infrastructure.concurrency.single_flight import SingleFlight
+from src.infrastructure.metrics.query_profiler import QueryProfiler
+from src.infrastructure.metrics.registry import MetricsRegistry
 
 
 class Container(containers.DeclarativeContainer):
@@ -34,39 +52,157 @@ class Container(containers.DeclarativeContainer):
         db_pwd=config.db.password,
         db_host=config.db.host,
         db_name=config.db.name,
+        pool_size=config.db.pool_size,
+        max_overflow=config.db.max_overflow,
     )
 
     database = providers.Singleton(Database, engine=db_engine)
 
+    # 요청 단위로 세션/트랜잭션을 공유하는 작업 단위
+    unit_of_work = providers.Singleton(UnitOfWork, database=database)
+
+    # Caches
+    todo_tree_cache = providers.Singleton(
+        TodoTreeCache,
+        max_entries=config.cache.todo_tree.max_entries,
+        ttl_seconds=config.cache.todo_tree.ttl_seconds,
+        enabled=config.cache.todo_tree.enabled,
+        unit_of_work=unit_of_work,
+    )
+    # 검증된 JWT payload 캐시 (항목별로 토큰의 exp 시각에 만료)
+    verified_token_cache = providers.Singleton(
+        LRUTTLCache,
+        max_entries=config.cache.verified_tokens.max_entries,
+        ttl_seconds=config.cache.verified_tokens.ttl_seconds,
+    )
+
     # Repositories
     todo_repository: providers.Provider[ITodoRepository] = providers.Factory(
-        SQLAlchemyTodoRepository, session_factory=database.provided.session
+        SQLAlchemyTodoRepository, session_factory=unit_of_work.provided.session
     )
     task_repository: providers.Provider[ITaskRepository] = providers.Factory(
-        SQLAlchemyTaskRepository, session_factory=database.provided.session
+        SQLAlchemyTaskRepository, session_factory=unit_of_work.provided.session
     )
     user_repository: providers.Provider[UserRepository] = providers.Factory(
-        SqlAlchemyUserRepository, session_factory=database.provided.session
+        SqlAlchemyUserRepository, session_factory=unit_of_work.provided.session
+    )
+    user_stats_repository: providers.Provider[IUserStatsRepository] = providers.Factory(
+        SQLAlchemyUserStatsRepository, session_factory=unit_of_work.provided.session
+    )
+
+    # Metrics
+    metrics_registry = providers.Singleton(MetricsRegistry)
+    # 요청별 SQL 쿼리 프로파일러 (profiling.sql.enabled일 때만 엔진과 미들웨어에 연결)
+    query_profiler = providers.Singleton(
+        QueryProfiler, n_plus_one_threshold=config.profiling.sql.n_plus_one_threshold
     )
 
     # AI Model Services
-    gemini_model_service = providers.Factory(
-        GeminiModelService, api_key=config.gemini.api_key
+    ai_telemetry = providers.Singleton(AITelemetry, registry=metrics_registry)
+    # 프로세스 전체의 모델 호출 한도 (전역/사용자별 토큰 버킷, 동시 호출 수, 대기열)
+    ai_rate_limiter = providers.Singleton(
+        AIRateLimiter,
+        global_rate_per_second=config.ai.rate_limit.global_rate_per_second,
+        global_burst=config.ai.rate_limit.global_burst,
+        user_rate_per_second=config.ai.rate_limit.user_rate_per_second,
+        user_burst=config.ai.rate_limit.user_burst,
+        max_concurrency=config.ai.rate_limit.max_concurrency,
+        max_queue=config.ai.rate_limit.max_queue,
+        enabled=config.ai.rate_limit.enabled,
+    )
+    # 모델 클라이언트는 한 번만 만들고 재사용 (캐시 적중 시 모델 초기화 비용도 없도록)
+    # 설정한 Gemini 모델 순서대로 실패 대체/헤지 요청 (응답 시간 통계를 유지하도록 Singleton)
+    # 제공자 호출마다 한도를 적용해 실패 대체/헤지 요청도 전역 버킷과 동시 호출 수에 포함
+    ai_model_service = providers.Singleton(
+        FallbackAIModelService,
+        model_services=providers.Callable(
+            RateLimitedAIModelService.for_services,
+            model_services=providers.Callable(
+                GeminiModelService.for_models,
+                api_key=config.gemini.api_key,
+                model_names=config.gemini.models,
+                telemetry=ai_telemetry,
+            ),
+            limiter=ai_rate_limiter,
+        ),
+        hedge_percentile=config.ai.fallback.hedge_percentile,
+        initial_hedge_delay=config.ai.fallback.initial_hedge_delay_seconds,
+        min_hedge_delay=config.ai.fallback.min_hedge_delay_seconds,
+        latency_window=config.ai.fallback.latency_window,
+        min_samples=config.ai.fallback.min_samples,
+        telemetry=ai_telemetry,
+    )
+    # 디스크 계층의 SQLite 연결을 main.lifespan 종료 시 닫도록 Resource로 등록
+    ai_result_cache = providers.Resource(
+        open_ai_result_cache,
+        max_entries=config.ai.result_cache.max_entries,
+        ttl_seconds=config.ai.result_cache.ttl_seconds,
+        disk_path=config.ai.result_cache.disk_path,
+        disk_max_entries=config.ai.result_cache.disk_max_entries,
+        enabled=config.ai.result_cache.enabled,
     )
+    cached_ai_model_service = providers.Factory(
+        CachedAIModelService, model_service=ai_model_service, cache=ai_result_cache
+    )
+
+    # 같은 입력의 동시 요청을 모델 호출 하나로 합치는 그룹 (프로세스 단위로 공유)
+    ai_single_flight = providers.Singleton(SingleFlight)
 
     # AI Service
-    ai_service = providers.Factory(AIService, model_service=gemini_model_service)
+    ai_service = providers.Factory(
+        AIService,
+        model_service=cached_ai_model_service,
+        single_flight=ai_single_flight,
+        batch_concurrency=config.ai.batch.max_concurrency,
+        rate_limiter=ai_rate_limiter,
+    )
 
     # Auth Providers
-    kakao_auth_provider = providers.Factory(KakaoAuthProvider)
+    # 앱 lifespan 동안 카카오 API 연결을 재사용하는 공유 클라이언트 (main.lifespan에서 생성/종료)
+    kakao_http_client = providers.Resource(
+        create_http_client,
+        max_connections=config.http.kakao.max_connections,
+        max_keepalive_connections=config.http.kakao.max_keepalive_connections,
+        keepalive_expiry=config.http.kakao.keepalive_expiry,
+        http2=config.http.kakao.http2,
+    )
+    kakao_timeout = providers.Factory(
+        httpx.Timeout,
+        connect=config.http.kakao.timeout.connect,
+        read=config.http.kakao.timeout.read,
+        write=config.http.kakao.timeout.write,
+        pool=config.http.kakao.timeout.pool,
+    )
+    kakao_auth_provider = providers.Factory(
+        KakaoAuthProvider, client=kakao_http_client, timeout=kakao_timeout
+    )
 
     # Services
-    task_service = providers.Factory(TaskService, task_repository=task_repository)
+    data_version_service = providers.Factory(
+        DataVersionService,
+        user_repository=user_repository,
+        todo_tree_cache=todo_tree_cache,
+    )
+    user_stats_service = providers.Factory(
+        UserStatsService, user_stats_repository=user_stats_repository
+    )
+    task_service = providers.Factory(
+        TaskService,
+        task_repository=task_repository,
+        data_version_service=data_version_service,
+        user_stats_service=user_stats_service,
+    )
     todo_service = providers.Factory(
-        TodoService, todo_repository=todo_repository, task_service=task_service
+        TodoService,
+        todo_repository=todo_repository,
+        task_service=task_service,
+        todo_tree_cache=todo_tree_cache,
+        data_version_service=data_version_service,
     )
     auth_service = providers.Factory(
         AuthService,
         user_repository=user_repository,
         auth_provider=kakao_auth_provider,
+        todo_tree_cache=todo_tree_cache,
+        verified_token_cache=verified_token_cache,
     )
@@ -1,49 +1,191 @@
 import logging
-from contextlib import contextmanager
-from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import sessionmaker, Session
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 import os
 
 logger = logging.getLogger(__name__)
 
+# 동기 드라이버 URL이 주어져도 같은 DB의 비동기 드라이버로 연결
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
 
-def create_db_engine(db_user: str, db_pwd: str, db_host: str, db_name: str):
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_OVERFLOW = 20
+
+
+def to_async_database_url(database_url: str) -> URL:
+    url = make_url(database_url)
+    async_driver = ASYNC_DRIVERS.get(url.drivername)
+    if async_driver:
+        return url.set(drivername=async_driver)
+    return url
+
+
+def enable_sqlite_transactions(engine: AsyncEngine) -> AsyncEngine:
+    """
+    SQLite 드라이버의 암묵적 트랜잭션 처리를 끄고 SQLAlchemy가 BEGIN을 직접 실행하게 합니다.
+
+    이렇게 해야 SAVEPOINT와 작업 단위 롤백이 MySQL과 같은 의미로 동작합니다.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def create_db_engine(
+    db_user: str,
+    db_pwd: str,
+    db_host: str,
+    db_name: str,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+) -> AsyncEngine:
     database_url = os.getenv("DATABASE_URL")
     if database_url:
-        return create_engine(database_url)
+        url = to_async_database_url(database_url)
     else:
         # Fallback for local development without docker-compose
-        return create_engine(
-            f"mysql+pymysql://{db_user}:{db_pwd}@{db_host}:3306/{db_name}"
-        )
+        url = make_url(f"mysql+aiomysql://{db_user}:{db_pwd}@{db_host}:3306/{db_name}")
+
+    if url.get_backend_name() == "sqlite":
+        return enable_sqlite_transactions(create_async_engine(url))
+
+    # 동시 처리량은 스레드풀이 아니라 커넥션 풀 크기로 제한됨
+    return create_async_engine(
+        url,
+        pool_size=pool_size or DEFAULT_POOL_SIZE,
+        max_overflow=max_overflow if max_overflow is not None else DEFAULT_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
 
 
 class Database:
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: AsyncEngine) -> None:
         self._engine = engine
-        self._session_factory = sessionmaker(
-            autocommit=False, autoflush=False, bind=self._engine
+        self._session_factory = async_sessionmaker(
+            bind=self._engine, autoflush=False, expire_on_commit=False
         )
-        self._initialize_database()
 
-    @contextmanager
-    def session(self):
-        session: Session = self._session_factory()
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
+    @asynccontextmanager
+    async def session(self):
+        session: AsyncSession = self._session_factory()
         try:
             yield session
         except Exception:
             logger.exception("Session rollback because of exception")
-            session.rollback()
+            await session.rollback()
             raise
         finally:
-            session.close()
-    
-    def _initialize_database(self) -> None:
+            await session.close()
+
+    async def initialize(self) -> None:
         """Initialize database tables if they don't exist"""
         from src.infrastructure.database.sqlalchemy_models import Base
         try:
-            Base.metadata.create_all(bind=self._engine)
+            async with self._engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
             logger.info("Database tables initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize database tables: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def dispose(self) -> None:
+        """커넥션 풀의 모든 연결을 닫습니다."""
+        await self._engine.dispose()
+
+
+class UnitOfWork:
+    """요청 하나의 모든 저장소 호출이 하나의 세션과 트랜잭션을 공유하도록 하는 작업 단위"""
+
+    def __init__(self, database: Database) -> None:
+        self._database = database
+        self._current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+            "unit_of_work_session", default=None
+        )
+        self._after_callbacks: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+            "unit_of_work_after_callbacks", default=None
+        )
+        self._begin_callbacks: List[Callable[[], None]] = []
+
+    @asynccontextmanager
+    async def begin(self):
+        """작업 단위를 시작합니다. 블록이 정상 종료되면 한 번 커밋하고, 예외가 발생하면 롤백합니다."""
+        current_session = self._current_session.get()
+        if current_session is not None:
+            # 이미 진행 중인 작업 단위에 합류
+            yield current_session
+            return
+
+        after_callbacks: List[Callable[[], None]] = []
+        try:
+            async with self._database.session() as session:
+                token = self._current_session.set(session)
+                callbacks_token = self._after_callbacks.set(after_callbacks)
+                try:
+                    for callback in self._begin_callbacks:
+                        callback()
+                    yield session
+                    await session.commit()
+                finally:
+                    self._after_callbacks.reset(callbacks_token)
+                    self._current_session.reset(token)
+        finally:
+            for callback in after_callbacks:
+                callback()
+
+    def on_begin(self, callback: Callable[[], None]) -> None:
+        """
+        새 작업 단위가 첫 쿼리를 실행하기 전에 매번 callback을 호출합니다.
+
+        callback은 작업 단위를 시작한 컨텍스트에서 실행되므로 ContextVar로 작업 단위별 값을 남길 수 있고,
+        call_after로 작업 단위가 끝날 때의 정리도 등록할 수 있습니다.
+        """
+        self._begin_callbacks.append(callback)
+
+    def call_after(self, callback: Callable[[], None]) -> None:
+        """
+        현재 작업 단위가 커밋 또는 롤백으로 끝난 뒤 callback을 호출합니다.
+
+        진행 중인 작업 단위가 없으면 바로 호출합니다.
+        """
+        after_callbacks = self._after_callbacks.get()
+        if after_callbacks is None:
+            callback()
+        else:
+            after_callbacks.append(callback)
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        현재 작업 단위의 세션을 반환합니다.
+
+        저장소는 이 세션에 flush만 하고 커밋은 작업 단위가 끝날 때 한 번 수행됩니다.
+        작업 단위 밖에서 호출되면 이 호출만을 위한 작업 단위를 열고 닫습니다.
+        """
+        async with self.begin() as session:
+            yield session
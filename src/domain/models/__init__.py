@@ -1,5 +1,6 @@
 from .todo import Todo
 from .task import Task
+from .task_stats import TaskStats
 from .user import User
 
-__all__ = ["Todo", "Task", "User"]
+__all__ = ["Todo", "Task", "TaskStats", "User"]
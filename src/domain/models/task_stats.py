@@ -0,0 +1,46 @@
+from dataclasses import dataclass, fields
+from typing import Iterable
+
+from src.domain.models.task import Task
+
+
+@dataclass(frozen=True)
+class TaskStats:
+    """태스크 포인트/개수 집계 (사용자별 날짜 집계, 누적 집계와 그 변화량에 사용)"""
+
+    total_points: int = 0
+    completed_points: int = 0
+    task_count: int = 0
+    completed_task_count: int = 0
+
+    @classmethod
+    def of(cls, task: Task) -> "TaskStats":
+        """태스크 하나(서브태스크 제외)의 집계"""
+        return cls(
+            total_points=task.points,
+            completed_points=task.points if task.completed else 0,
+            task_count=1,
+            completed_task_count=1 if task.completed else 0,
+        )
+
+    @classmethod
+    def of_tree(cls, tasks: Iterable[Task]) -> "TaskStats":
+        """태스크들과 그 서브태스크 전체의 집계"""
+        stats = cls()
+        for task in tasks:
+            stats = stats + cls.of(task) + cls.of_tree(task.subtasks)
+        return stats
+
+    def __add__(self, other: "TaskStats") -> "TaskStats":
+        return TaskStats(
+            *(getattr(self, f.name) + getattr(other, f.name) for f in fields(self))
+        )
+
+    def __neg__(self) -> "TaskStats":
+        return TaskStats(*(-getattr(self, f.name) for f in fields(self)))
+
+    def __sub__(self, other: "TaskStats") -> "TaskStats":
+        return self + -other
+
+    def is_zero(self) -> bool:
+        return self == TaskStats()
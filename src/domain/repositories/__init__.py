@@ -1,5 +1,6 @@
 from .todo_repository import ITodoRepository
 from .task_repository import ITaskRepository
 from .user_repository import UserRepository
+from .user_stats_repository import IUserStatsRepository
 
-__all__ = ["ITodoRepository", "ITaskRepository", "UserRepository"]
+__all__ = ["ITodoRepository", "ITaskRepository", "UserRepository", "IUserStatsRepository"]
@@ -2,37 +2,43 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from src.domain.models.task import Task
+from src.domain.models.task_stats import TaskStats
 
 class ITaskRepository(ABC):
     @abstractmethod
-    def create(self, task: Task) -> Task:
+    async def create(self, task: Task) -> Task:
         pass
 
     @abstractmethod
-    def get_by_id(self, task_id: int) -> Optional[Task]:
+    async def create_with_subtasks(self, tasks: List[Task]) -> List[Task]:
+        """부모 태스크들과 각 task.subtasks를 한 트랜잭션에서 일괄 생성하고 ID가 채워진 트리를 반환합니다."""
         pass
 
     @abstractmethod
-    def get_by_todo_id(self, todo_id: int) -> List[Task]:
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
         pass
 
     @abstractmethod
-    def get_by_todo_id_and_user(self, todo_id: int, user_id: int) -> List[Task]:
+    async def get_by_todo_id(self, todo_id: int) -> List[Task]:
         pass
 
     @abstractmethod
-    def update(self, task: Task) -> Task:
+    async def get_by_todo_id_and_user(self, todo_id: int, user_id: int) -> List[Task]:
         pass
 
     @abstractmethod
-    def delete(self, task_id: int) -> None:
+    async def update(self, task: Task) -> Task:
+        pass
+
+    @abstractmethod
+    async def delete(self, task_id: int) -> None:
         pass
     
     @abstractmethod
-    def get_subtasks_by_parent_id(self, parent_id: int) -> List[Task]:
+    async def get_subtasks_by_parent_id(self, parent_id: int) -> List[Task]:
         pass
     
     @abstractmethod
-    def delete_with_descendants(self, task_id: int) -> None:
-        """태스크와 모든 하위 태스크를 연쇄 삭제합니다."""
+    async def delete_with_descendants(self, task_id: int) -> TaskStats:
+        """태스크와 모든 하위 태스크를 연쇄 삭제하고, 삭제한 태스크들의 집계를 반환합니다."""
         pass
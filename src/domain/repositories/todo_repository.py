@@ -1,29 +1,57 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from src.domain.models.todo import Todo
 
 class ITodoRepository(ABC):
     @abstractmethod
-    def get_all_todos(self) -> List[Todo]:
+    async def get_all_todos(self) -> List[Todo]:
         pass
 
     @abstractmethod
-    def create_todo(self, todo: Todo) -> Todo:
+    async def create_todo(self, todo: Todo) -> Todo:
         pass
     
     @abstractmethod
-    def get_by_id(self, todo_id: int) -> Optional[Todo]:
+    async def get_by_id(self, todo_id: int) -> Optional[Todo]:
         pass
 
     @abstractmethod
-    def get_todos_by_date(self, target_date: date) -> List[Todo]:
+    async def get_todos_by_date(self, target_date: date) -> List[Todo]:
         pass
 
     @abstractmethod
-    def get_all_todos_by_user(self, user_id: int) -> List[Todo]:
+    async def get_all_todos_by_user(self, user_id: int) -> List[Todo]:
         pass
 
     @abstractmethod
-    def get_todos_by_date_and_user(self, target_date: date, user_id: int) -> List[Todo]:
+    async def get_todos_by_date_and_user(self, target_date: date, user_id: int) -> List[Todo]:
+        pass
+
+    @abstractmethod
+    async def get_todos_with_tasks_by_user(
+        self, user_id: int, target_date: Optional[date] = None
+    ) -> List[Todo]:
+        """사용자의 Todo와 Task/서브태스크 트리를 한 번에 조회합니다. (target_date가 있으면 해당 날짜만)"""
+        pass
+
+    @abstractmethod
+    async def get_todo_with_tasks(self, todo_id: int) -> Optional[Todo]:
+        """Todo 하나와 Task/서브태스크 트리를 한 번에 조회합니다."""
+        pass
+
+    @abstractmethod
+    async def get_todos_page_with_tasks(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Todo]:
+        """
+        (base_date, id) 내림차순으로 after 이후의 Todo를 최대 limit개까지 트리와 함께 조회합니다.
+
+        after는 직전 페이지 마지막 Todo의 (base_date, id)입니다.
+        """
         pass
@@ -5,21 +5,29 @@ from src.domain.models.user import User
 
 class UserRepository(ABC):
     @abstractmethod
-    def get_by_id(self, user_id: int) -> Optional[User]:
+    async def get_by_id(self, user_id: int) -> Optional[User]:
         pass
 
     @abstractmethod
-    def get_by_kakao_id(self, kakao_id: str) -> Optional[User]:
+    async def get_by_kakao_id(self, kakao_id: str) -> Optional[User]:
         pass
 
     @abstractmethod
-    def create(self, user: User) -> User:
+    async def create(self, user: User) -> User:
         pass
 
     @abstractmethod
-    def update(self, user: User) -> User:
+    async def update(self, user: User) -> User:
         pass
 
     @abstractmethod
-    def delete(self, user_id: int) -> bool:
+    async def delete(self, user_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_data_version(self, user_id: int) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def increment_data_version(self, user_id: int) -> None:
         pass
\ No newline at end of file
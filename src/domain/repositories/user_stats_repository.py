@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict
+
+from src.domain.models.task_stats import TaskStats
+
+
+class IUserStatsRepository(ABC):
+    @abstractmethod
+    async def add(self, user_id: int, todo_id: int, delta: TaskStats) -> None:
+        """todo_id의 날짜 집계와 사용자 누적 집계에 delta를 더합니다."""
+        pass
+
+    @abstractmethod
+    async def get_daily_total(self, user_id: int, date_from: date, date_to: date) -> TaskStats:
+        """date_from부터 date_to까지(양 끝 포함) 날짜 집계의 합"""
+        pass
+
+    @abstractmethod
+    async def get_lifetime(self, user_id: int) -> TaskStats:
+        pass
+
+    @abstractmethod
+    async def get_daily_from_tasks(
+        self, user_id: int, date_from: date, date_to: date
+    ) -> Dict[date, TaskStats]:
+        """date_from부터 date_to까지(양 끝 포함) 태스크가 있는 날짜별 집계를 태스크에서 직접 계산합니다."""
+        pass
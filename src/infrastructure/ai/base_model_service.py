@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any
 from datetime import date
 
 
@@ -7,10 +7,12 @@ class AIModelService(ABC):
     """AI 모델 서비스의 추상 베이스 클래스"""
 
     @abstractmethod
-    def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+    async def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
         """
         자연어 입력을 받아 TODO 목록을 생성합니다.
 
+        모델 호출을 기다리는 동안 이벤트 루프나 스레드풀 워커를 점유하지 않도록 비동기로 구현합니다.
+
         Args:
             user_input: 사용자의 자연어 입력
             target_date: TODO의 기준 날짜 (없으면 오늘)
@@ -30,6 +32,19 @@ class AIModelService(ABC):
         """
         pass
 
+    async def stream_tasks_from_text(
+        self, user_input: str, target_date: date = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        자연어 입력으로 생성한 태스크를 완성되는 대로 하나씩 내보냅니다.
+
+        스트리밍 API가 없는 모델은 전체 응답을 받은 뒤 태스크를 차례로 내보냅니다.
+        각 태스크는 generate_todos_from_text 결과의 tasks 항목과 같은 형식입니다.
+        """
+        result = await self.generate_todos_from_text(user_input, target_date)
+        for task in result["tasks"]:
+            yield task
+
     def _build_prompt(self, user_input: str, target_date: date) -> str:
         """AI 프롬프트를 생성합니다."""
         return f"""당신은 TODO 목록을 생성하는 AI 어시스턴트입니다.
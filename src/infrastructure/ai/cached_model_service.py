@@ -0,0 +1,193 @@
+import asyncio
+import copy
+import hashlib
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from src.infrastructure.ai.base_model_service import AIModelService
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+
+# 프롬프트나 응답 형식이 바뀌면 올려서 이전 결과를 재사용하지 않게 함
+CACHE_KEY_VERSION = "v1"
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.,!?~…。]+$")
+
+
+def normalize_user_input(user_input: str) -> str:
+    """
+    같은 요청으로 볼 수 있는 입력을 하나의 형태로 정규화합니다.
+
+    유니코드 정규화(NFKC), 소문자화, 공백 축약, 끝의 문장 부호 제거만 수행하므로
+    의미가 다른 입력이 같은 키로 합쳐지지 않습니다.
+    """
+    normalized = unicodedata.normalize("NFKC", user_input).lower()
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _TRAILING_PUNCTUATION.sub("", normalized)
+
+
+@dataclass(frozen=True)
+class AIResultCacheStats:
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
+
+class AIResultCache:
+    """
+    AI TODO 생성 결과 캐시 (메모리 LRU 계층 + SQLite 디스크 계층)
+
+    키는 정규화한 입력과 기준 날짜로 만듭니다. "내일" 같은 상대 표현의 해석이 날짜에 따라
+    달라지므로 날짜가 다르면 같은 입력이라도 다른 항목입니다.
+    디스크 계층의 파일 I/O(주기적인 크기 제한 포함)는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 100000,
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self._memory = LRUTTLCache(max_entries, ttl_seconds)
+        self._disk = (
+            SQLiteCache(disk_path, disk_max_entries, ttl_seconds)
+            if enabled and disk_path
+            else None
+        )
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(user_input: str, target_date: date) -> str:
+        raw_key = "\0".join(
+            [CACHE_KEY_VERSION, target_date.isoformat(), normalize_user_input(user_input)]
+        )
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 결과의 복사본을 반환합니다. 디스크 계층에서 찾으면 메모리 계층에도 올립니다."""
+        value = self._memory.get(key)
+        if value is not None:
+            self._count("memory")
+            return copy.deepcopy(value)
+
+        if self._disk is not None:
+            value = await asyncio.to_thread(self._disk.get, key)
+            if value is not None:
+                self._memory.set(key, value)
+                self._count("disk")
+                return copy.deepcopy(value)
+
+        self._count("miss")
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        value = copy.deepcopy(value)
+        self._memory.set(key, value)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.set, key, value)
+
+    def stats(self) -> AIResultCacheStats:
+        with self._lock:
+            return AIResultCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                memory_size=len(self._memory),
+            )
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            if outcome == "memory":
+                self._memory_hits += 1
+            elif outcome == "disk":
+                self._disk_hits += 1
+            else:
+                self._misses += 1
+
+
+def open_ai_result_cache(
+    max_entries: int,
+    ttl_seconds: float,
+    disk_path: Optional[str] = None,
+    disk_max_entries: int = 100000,
+    enabled: bool = True,
+) -> Iterator[AIResultCache]:
+    """
+    AIResultCache를 만들고, 종료 시 디스크 계층의 SQLite 연결을 닫습니다.
+
+    컨테이너의 Resource로 등록해 앱 lifespan에서 한 번 만들고 닫는 용도입니다.
+    """
+    cache = AIResultCache(max_entries, ttl_seconds, disk_path, disk_max_entries, enabled)
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+class CachedAIModelService(AIModelService):
+    """같은 입력/날짜의 결과를 캐시에서 돌려주고, 없을 때만 실제 모델을 호출하는 AI 모델 서비스"""
+
+    def __init__(self, model_service: AIModelService, cache: AIResultCache):
+        self.model_service = model_service
+        self.cache = cache
+
+    async def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+        if target_date is None:
+            target_date = date.today()
+        if not self.cache.enabled:
+            return await self.model_service.generate_todos_from_text(user_input, target_date)
+
+        key = self.cache.make_key(user_input, target_date)
+        cached_result = await self.cache.get(key)
+        if cached_result is not None:
+            return cached_result
+
+        # 모델 호출이 실패하면 예외를 그대로 전달하고 캐시에 남기지 않음
+        result = await self.model_service.generate_todos_from_text(user_input, target_date)
+        await self.cache.set(key, result)
+        return copy.deepcopy(result)
+
+    async def stream_tasks_from_text(
+        self, user_input: str, target_date: date = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if target_date is None:
+            target_date = date.today()
+        if not self.cache.enabled:
+            async for task in self.model_service.stream_tasks_from_text(user_input, target_date):
+                yield task
+            return
+
+        key = self.cache.make_key(user_input, target_date)
+        cached_result = await self.cache.get(key)
+        if cached_result is not None:
+            for task in cached_result["tasks"]:
+                yield task
+            return
+
+        tasks = []
+        async for task in self.model_service.stream_tasks_from_text(user_input, target_date):
+            tasks.append(copy.deepcopy(task))
+            yield task
+        # 스트림을 끝까지 받은 경우에만 전체 결과를 캐시
+        await self.cache.set(key, {"tasks": tasks})
@@ -0,0 +1,178 @@
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from src.infrastructure.ai.base_model_service import AIModelService
+from src.infrastructure.ai.telemetry import AITelemetry
+
+
+@dataclass(frozen=True)
+class FallbackStats:
+    calls: int
+    hedged: int
+    failovers: int
+    # 제공자 순서대로, 해당 제공자의 응답이 채택된 횟수
+    wins: Tuple[int, ...]
+
+
+class _LatencyWindow:
+    """최근 성공 응답 시간으로 백분위 지연 시간을 계산하는 창"""
+
+    def __init__(self, size: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> float:
+        samples = sorted(self._samples)
+        rank = max(1, math.ceil(percentile * len(samples)))
+        return samples[rank - 1]
+
+
+class FallbackAIModelService(AIModelService):
+    """
+    여러 AI 모델 제공자를 순서대로 사용하는 복합 모델 서비스
+
+    - 실패 대체: 제공자 호출이 실패하면 바로 다음 제공자를 호출합니다.
+    - 헤지 요청: 제공자가 최근 응답 시간의 hedge_percentile 백분위 안에 응답하지 않으면
+      기존 호출을 유지한 채 다음 제공자에도 요청을 보내고, 먼저 성공한 응답을 사용합니다.
+      남은 호출은 취소합니다.
+
+    응답 시간 표본이 min_samples개 미만인 제공자는 initial_hedge_delay를 기다린 뒤 헤지합니다.
+    모든 제공자가 실패하면 마지막 예외를 그대로 전달합니다.
+    """
+
+    def __init__(
+        self,
+        model_services: List[AIModelService],
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 3.0,
+        min_hedge_delay: float = 0.1,
+        latency_window: int = 100,
+        min_samples: int = 20,
+        telemetry: Optional[AITelemetry] = None,
+    ) -> None:
+        if not model_services:
+            raise ValueError("model_services must not be empty")
+        if not 0 < hedge_percentile <= 1:
+            raise ValueError("hedge_percentile must be in (0, 1]")
+        self.model_services = list(model_services)
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples = min_samples
+        self.telemetry = telemetry
+        self._latencies = [_LatencyWindow(latency_window) for _ in self.model_services]
+        self._calls = 0
+        self._hedged = 0
+        self._failovers = 0
+        self._wins = [0] * len(self.model_services)
+
+    def hedge_delay(self, index: int) -> float:
+        """index번째 제공자의 응답을 기다린 뒤 다음 제공자에 헤지 요청을 보낼 시간(초)"""
+        latencies = self._latencies[index]
+        if len(latencies) < self.min_samples:
+            return self.initial_hedge_delay
+        return max(self.min_hedge_delay, latencies.percentile(self.hedge_percentile))
+
+    def stats(self) -> FallbackStats:
+        return FallbackStats(
+            calls=self._calls,
+            hedged=self._hedged,
+            failovers=self._failovers,
+            wins=tuple(self._wins),
+        )
+
+    async def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+        if target_date is None:
+            target_date = date.today()
+        self._calls += 1
+
+        pending: Dict[asyncio.Task, int] = {}
+        next_index = 0
+        last_error: Optional[BaseException] = None
+
+        def start_next() -> None:
+            nonlocal next_index
+            task = asyncio.ensure_future(self._call(next_index, user_input, target_date))
+            pending[task] = next_index
+            next_index += 1
+
+        start_next()
+        try:
+            while pending:
+                # 마지막으로 시작한 제공자 기준으로 헤지 시점을 정함 (남은 제공자가 없으면 끝까지 기다림)
+                timeout = (
+                    self.hedge_delay(next_index - 1)
+                    if next_index < len(self.model_services)
+                    else None
+                )
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self._hedged += 1
+                    self._record_retry("hedge")
+                    start_next()
+                    continue
+
+                for task in done:
+                    index = pending.pop(task)
+                    if task.exception() is None:
+                        self._wins[index] += 1
+                        return task.result()
+                    last_error = task.exception()
+
+                if not pending and next_index < len(self.model_services):
+                    self._failovers += 1
+                    self._record_retry("failover")
+                    start_next()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def stream_tasks_from_text(
+        self, user_input: str, target_date: date = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # 스트림은 헤지하지 않음. 첫 태스크를 내보내기 전에 실패한 경우에만 다음 제공자로 대체
+        if target_date is None:
+            target_date = date.today()
+        self._calls += 1
+
+        last_error: Optional[BaseException] = None
+        for index, model_service in enumerate(self.model_services):
+            if index > 0:
+                self._failovers += 1
+                self._record_retry("failover")
+            started = False
+            try:
+                async for task in model_service.stream_tasks_from_text(user_input, target_date):
+                    started = True
+                    yield task
+            except Exception as e:
+                if started:
+                    raise
+                last_error = e
+                continue
+            self._wins[index] += 1
+            return
+        raise last_error
+
+    def _record_retry(self, reason: str) -> None:
+        if self.telemetry is not None:
+            self.telemetry.record_retry(reason)
+
+    async def _call(self, index: int, user_input: str, target_date: date) -> Dict[str, Any]:
+        started = time.monotonic()
+        result = await self.model_services[index].generate_todos_from_text(user_input, target_date)
+        self._latencies[index].add(time.monotonic() - started)
+        return result
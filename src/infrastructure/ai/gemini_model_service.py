@@ -1,30 +1,53 @@
+import asyncio
 import os
 import json
-from typing import Dict, Any
+import time
+from typing import AsyncIterator, Dict, Any, List, Optional
 import google.generativeai as genai
 from datetime import date
 
 from src.infrastructure.ai.base_model_service import AIModelService
+from src.infrastructure.ai.response_parser import IncrementalTaskParser, validate_task
+from src.infrastructure.ai.telemetry import AITelemetry
 
 
 class GeminiModelService(AIModelService):
     """Google Gemini API를 사용하는 AI 모델 서비스"""
 
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        model_name: str = "gemini-2.5-flash-lite",
+        telemetry: Optional[AITelemetry] = None,
+    ):
         """
         GeminiModelService 초기화
 
         Args:
             api_key: Google Gemini API 키. 제공되지 않으면 환경 변수에서 로드
+            model_name: 사용할 Gemini 모델 이름
+            telemetry: 호출 지연 시간/토큰 수/결과를 기록할 계측 (없으면 자체 저장소에 기록)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
 
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
-
-    def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+        self.telemetry = telemetry or AITelemetry()
+
+    @classmethod
+    def for_models(
+        cls, api_key: str, model_names: List[str], telemetry: Optional[AITelemetry] = None
+    ) -> List["GeminiModelService"]:
+        """같은 API 키로 여러 Gemini 모델의 서비스를 순서대로 만듭니다."""
+        return [
+            cls(api_key=api_key, model_name=model_name, telemetry=telemetry)
+            for model_name in model_names
+        ]
+
+    async def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
         """
         자연어 입력을 받아 TODO 목록을 생성합니다.
 
@@ -39,37 +62,102 @@ class GeminiModelService(AIModelService):
             target_date = date.today()
 
         prompt = self._build_prompt(user_input, target_date)
+        started = time.perf_counter()
+        outcome = "error"
+        usage_metadata = None
 
         try:
-            response = self.model.generate_content(prompt)
-
-            # 응답 전체 구조 확인
-            print(f"[DEBUG] Response object: {response}")
-            print(f"[DEBUG] Response dir: {dir(response)}")
+            # SDK의 비동기 호출을 사용해 응답을 기다리는 동안 스레드를 점유하지 않음
+            response = await self.model.generate_content_async(prompt)
 
-            # 응답 디버깅
             if not response:
                 raise RuntimeError("Gemini 응답이 None입니다")
+            usage_metadata = getattr(response, "usage_metadata", None)
 
             # text 속성 확인
             response_text = ""
             if hasattr(response, 'text'):
                 response_text = response.text
-                print(f"[DEBUG] Gemini 원본 응답: {response_text}")
             elif hasattr(response, 'candidates') and response.candidates:
                 # candidates를 통해 접근
                 response_text = response.candidates[0].content.parts[0].text
-                print(f"[DEBUG] Gemini 원본 응답 (candidates): {response_text}")
             else:
-                raise RuntimeError(f"응답에서 텍스트를 찾을 수 없습니다. Response 속성: {dir(response)}")
+                raise RuntimeError("응답에서 텍스트를 찾을 수 없습니다")
 
             if not response_text or response_text.strip() == "":
                 raise RuntimeError("Gemini가 빈 응답을 반환했습니다")
 
-            result = self._parse_response(response_text)
+            try:
+                result = self._parse_response(response_text)
+            except ValueError:
+                outcome = "parse_error"
+                raise
+            outcome = "success"
             return result
+        except (asyncio.CancelledError, GeneratorExit):
+            # 헤지 요청에서 진 호출이나 클라이언트가 끊은 스트림
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Gemini API 호출 중 오류 발생: {str(e)}")
+        finally:
+            self.telemetry.record_call(
+                self.model_name, "generate", outcome, time.perf_counter() - started, usage_metadata
+            )
+
+    async def stream_tasks_from_text(
+        self, user_input: str, target_date: date = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Gemini 스트리밍 응답을 받는 대로 파싱해, 닫힌 태스크를 즉시 내보냅니다.
+
+        Args:
+            user_input: 사용자의 자연어 입력
+            target_date: TODO의 기준 날짜 (없으면 오늘)
+
+        Yields:
+            검증과 포인트 조정을 마친 태스크 딕셔너리
+        """
+        if target_date is None:
+            target_date = date.today()
+
+        prompt = self._build_prompt(user_input, target_date)
+        parser = IncrementalTaskParser()
+        started = time.perf_counter()
+        outcome = "error"
+        usage_metadata = None
+
+        try:
+            response = await self.model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                # 사용량은 마지막 조각에 누적값으로 들어옴
+                usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
+                # 종료 사유만 담긴 조각은 텍스트가 없음
+                if not chunk.parts:
+                    continue
+                try:
+                    tasks = parser.feed(chunk.text)
+                except ValueError:
+                    outcome = "parse_error"
+                    raise
+                for task in tasks:
+                    yield task
+            try:
+                parser.close()
+            except ValueError:
+                outcome = "parse_error"
+                raise
+            outcome = "success"
+        except (asyncio.CancelledError, GeneratorExit):
+            # 헤지 요청에서 진 호출이나 클라이언트가 끊은 스트림
+            outcome = "cancelled"
+            raise
         except Exception as e:
             raise RuntimeError(f"Gemini API 호출 중 오류 발생: {str(e)}")
+        finally:
+            self.telemetry.record_call(
+                self.model_name, "stream", outcome, time.perf_counter() - started, usage_metadata
+            )
 
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -98,21 +186,9 @@ class GeminiModelService(AIModelService):
             if "tasks" not in result:
                 raise ValueError("응답에 'tasks' 필드가 없습니다")
 
+            # 필수 필드, points 범위(1-10), subtasks 기본값 검증
             for task in result["tasks"]:
-                if "title" not in task or "points" not in task:
-                    raise ValueError("태스크에 필수 필드가 없습니다")
-
-                # points 범위 확인 및 조정
-                task["points"] = max(1, min(10, int(task["points"])))
-
-                # subtasks 검증
-                if "subtasks" not in task:
-                    task["subtasks"] = []
-
-                for subtask in task["subtasks"]:
-                    if "title" not in subtask or "points" not in subtask:
-                        raise ValueError("서브태스크에 필수 필드가 없습니다")
-                    subtask["points"] = max(1, min(10, int(subtask["points"])))
+                validate_task(task)
 
             return result
 
@@ -0,0 +1,36 @@
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List
+
+from src.infrastructure.ai.base_model_service import AIModelService
+from src.infrastructure.ai.rate_limiter import AIRateLimiter
+
+
+class RateLimitedAIModelService(AIModelService):
+    """실제 모델 호출마다 AIRateLimiter의 허가를 받는 AI 모델 서비스"""
+
+    def __init__(self, model_service: AIModelService, limiter: AIRateLimiter):
+        self.model_service = model_service
+        self.limiter = limiter
+
+    @classmethod
+    def for_services(
+        cls, model_services: List[AIModelService], limiter: AIRateLimiter
+    ) -> List["RateLimitedAIModelService"]:
+        """
+        제공자 서비스마다 한도를 적용합니다.
+
+        FallbackAIModelService 안쪽에 두어 실패 대체와 헤지 요청도 각각 모델 호출 하나로 차감되게 합니다.
+        """
+        return [cls(model_service, limiter) for model_service in model_services]
+
+    async def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+        async with self.limiter.acquire():
+            return await self.model_service.generate_todos_from_text(user_input, target_date)
+
+    async def stream_tasks_from_text(
+        self, user_input: str, target_date: date = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # 스트림이 끝날 때까지 동시 호출 자리를 유지
+        async with self.limiter.acquire():
+            async for task in self.model_service.stream_tasks_from_text(user_input, target_date):
+                yield task
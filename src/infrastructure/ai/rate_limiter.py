@@ -0,0 +1,143 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+
+
+class AIRateLimitExceeded(Exception):
+    """AI 모델 호출 한도를 넘어 즉시 거절된 요청"""
+
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(f"AI 요청 한도 초과 ({reason}), {retry_after:.1f}초 후 재시도")
+        self.retry_after = retry_after
+        self.reason = reason
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry-After 헤더 값 (1 이상의 정수 초)"""
+        return max(1, math.ceil(self.retry_after))
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+
+    def try_acquire(self) -> float:
+        """토큰 하나를 가져옵니다. 성공하면 0을, 부족하면 다음 토큰까지 남은 시간(초)을 반환합니다."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class AIRateLimiter:
+    """
+    AI 모델 호출 한도 관리 (전역 토큰 버킷 + 사용자별 토큰 버킷 + 동시 호출 제한 + 대기열 제한)
+
+    - 사용자별 버킷(acquire_user)에 토큰이 없으면 기다리지 않고 바로 거절합니다.
+    - 전역 버킷이나 동시 호출 제한(acquire) 때문에 기다려야 하면 대기열에서 차례를 기다립니다.
+    - 대기열이 가득 차 있으면 기다리지 않고 바로 거절합니다.
+
+    사용자별 한도는 요청마다, 나머지 한도는 실제 모델 호출마다 적용합니다. 여러 사용자의 요청이
+    모델 호출 하나로 합쳐질 수 있으므로 사용자별 한도는 합치기 전에 따로 확인해야 합니다.
+
+    거절은 AIRateLimitExceeded(retry_after)로 알리며, API 계층에서 429와 Retry-After로 변환합니다.
+    """
+
+    def __init__(
+        self,
+        global_rate_per_second: float,
+        global_burst: int,
+        user_rate_per_second: float,
+        user_burst: int,
+        max_concurrency: int,
+        max_queue: int,
+        max_users: int = 10000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrency <= 0 or max_queue < 0:
+            raise ValueError("max_concurrency must be positive and max_queue non-negative")
+        self.enabled = enabled
+        self._clock = clock
+        self._global_bucket = TokenBucket(global_rate_per_second, global_burst, clock)
+        self._user_rate = user_rate_per_second
+        self._user_burst = user_burst
+        # 버킷이 가득 찰 만큼 쉬고 있던 사용자의 버킷은 새 버킷과 같으므로 그 뒤에는 버려도 됨
+        self._user_buckets = LRUTTLCache(
+            max_users, ttl_seconds=user_burst / user_rate_per_second, clock=clock
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_queue = max_queue
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """모델 호출 차례를 기다리는 요청 수"""
+        return self._waiting
+
+    def acquire_user(self, user_id: Optional[int]) -> None:
+        """user_id의 요청 하나를 사용자별 한도에서 차감하고, 토큰이 없으면 바로 거절합니다."""
+        if not self.enabled or user_id is None:
+            return
+        wait = self._user_bucket(user_id).try_acquire()
+        if wait > 0:
+            raise AIRateLimitExceeded(wait, "user")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """모델 호출 한 번을 허가받고 범위를 벗어나면 동시 호출 자리를 반납합니다."""
+        if not self.enabled:
+            yield
+            return
+
+        must_wait = self._semaphore.locked() or self._global_bucket.available < 1
+        if must_wait and self._waiting >= self._max_queue:
+            raise AIRateLimitExceeded((self._waiting + 1) / self._global_bucket.rate, "queue")
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                while (wait := self._global_bucket.try_acquire()) > 0:
+                    await asyncio.sleep(wait)
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def _user_bucket(self, user_id: int) -> TokenBucket:
+        bucket = self._user_buckets.get(user_id)
+        if bucket is None:
+            bucket = TokenBucket(self._user_rate, self._user_burst, self._clock)
+        # 사용할 때마다 다시 넣어 TTL을 마지막 사용 시점부터 계산
+        self._user_buckets.set(user_id, bucket)
+        return bucket
@@ -0,0 +1,150 @@
+import json
+from typing import Any, Dict, List, Optional
+
+
+def clamp_points(points: Any) -> int:
+    """포인트를 1~10 사이의 정수로 조정합니다. 숫자로 읽을 수 없으면 ValueError를 발생시킵니다."""
+    if isinstance(points, bool):
+        raise ValueError(f"포인트가 숫자가 아닙니다: {points!r}")
+    try:
+        return max(1, min(10, int(points)))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"포인트가 숫자가 아닙니다: {points!r}")
+
+
+def validate_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    모델이 만든 태스크 하나를 검증하고 정규화합니다.
+
+    필수 필드(title, points)를 확인하고, 포인트를 1~10 범위로 조정하며,
+    subtasks가 없으면 빈 배열로 채웁니다. 전달한 딕셔너리를 직접 수정해 반환합니다.
+    JSON으로는 올바르지만 형식이 다른 응답(숫자가 아닌 points, 배열이 아닌 subtasks 등)도
+    ValueError로 거부합니다.
+    """
+    if not isinstance(task, dict) or "title" not in task or "points" not in task:
+        raise ValueError("태스크에 필수 필드가 없습니다")
+
+    task["points"] = clamp_points(task["points"])
+
+    if "subtasks" not in task:
+        task["subtasks"] = []
+    if not isinstance(task["subtasks"], list):
+        raise ValueError("subtasks가 배열이 아닙니다")
+
+    for subtask in task["subtasks"]:
+        if not isinstance(subtask, dict) or "title" not in subtask or "points" not in subtask:
+            raise ValueError("서브태스크에 필수 필드가 없습니다")
+        subtask["points"] = clamp_points(subtask["points"])
+
+    return task
+
+
+class IncrementalTaskParser:
+    """
+    스트리밍으로 도착하는 모델 응답에서 완성된 태스크를 하나씩 꺼내는 파서
+
+    최상위 객체의 "tasks" 배열 안에서 태스크 객체의 닫는 괄호가 도착하는 즉시 그 객체만
+    json으로 읽어 validate_task로 검증합니다. 문자열 안의 괄호와 이스케이프를 구분하며,
+    JSON 앞뒤의 코드 블록 표시(```json ... ```)는 무시합니다.
+    """
+
+    def __init__(self) -> None:
+        # 현재 열려 있는 컨테이너 ('{' 또는 '[')
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        # 최상위 객체에서 마지막으로 읽은 문자열 (키 후보)
+        self._string_chars: List[str] = []
+        self._last_string: Optional[str] = None
+        self._tasks_depth: Optional[int] = None
+        self._tasks_closed = False
+        self._task_chars: Optional[List[str]] = None
+        self._finished = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """응답 조각을 넣고, 이번 조각으로 완성된 태스크 목록을 반환합니다."""
+        completed = []
+        for char in chunk:
+            if self._finished:
+                break
+            task = self._consume(char)
+            if task is not None:
+                completed.append(task)
+        return completed
+
+    def close(self) -> None:
+        """응답이 끝났을 때 호출합니다. tasks 배열을 끝까지 읽지 못했으면 ValueError를 발생시킵니다."""
+        if self._tasks_depth is None and not self._tasks_closed:
+            raise ValueError("응답에 'tasks' 필드가 없습니다")
+        if not self._tasks_closed:
+            raise ValueError("JSON 파싱 오류: 응답이 tasks 배열 중간에 끝났습니다")
+
+    def _consume(self, char: str) -> Optional[Dict[str, Any]]:
+        if self._task_chars is not None:
+            self._task_chars.append(char)
+
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if len(self._stack) == 1:
+                    self._last_string = json.loads('"' + "".join(self._string_chars) + '"')
+            if len(self._stack) == 1 and self._in_string:
+                self._string_chars.append(char)
+            return None
+
+        if char == '"':
+            if self._stack:
+                self._in_string = True
+                self._string_chars = []
+            return None
+
+        if char in "{[":
+            if not self._stack and char != "{":
+                return None
+            self._stack.append(char)
+            if char == "[" and len(self._stack) == 2 and self._last_string == "tasks":
+                self._tasks_depth = len(self._stack)
+            elif (
+                char == "{"
+                and self._tasks_depth is not None
+                and len(self._stack) == self._tasks_depth + 1
+            ):
+                self._task_chars = [char]
+            return None
+
+        if char in "}]":
+            if not self._stack:
+                return None
+            self._stack.pop()
+            if self._tasks_depth is not None and len(self._stack) == self._tasks_depth - 1:
+                self._tasks_depth = None
+                self._tasks_closed = True
+            elif (
+                char == "}"
+                and self._task_chars is not None
+                and self._tasks_depth is not None
+                and len(self._stack) == self._tasks_depth
+            ):
+                return self._complete_task()
+            if not self._stack:
+                self._finished = True
+            return None
+
+        if char == "," and len(self._stack) == 1:
+            self._last_string = None
+        return None
+
+    def _complete_task(self) -> Dict[str, Any]:
+        text = "".join(self._task_chars)
+        self._task_chars = None
+        try:
+            task = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 파싱 오류: {str(e)}")
+        if not isinstance(task, dict):
+            raise ValueError("태스크 형식이 올바르지 않습니다")
+        return validate_task(task)
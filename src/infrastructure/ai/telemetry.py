@@ -0,0 +1,97 @@
+import logging
+from typing import Any, Optional
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# 모델 호출 지연 시간 버킷 (초)
+MODEL_LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0, 30.0)
+
+
+class AITelemetry:
+    """
+    AI 모델 호출 계측
+
+    호출마다 지연 시간, 토큰 수(SDK usage metadata), 결과(success / error / parse_error)를
+    메트릭 저장소에 기록하고 구조화된 로그 한 줄(extra["ai_call"])을 남깁니다.
+    제공자 대체/헤지 요청은 재시도로 집계합니다.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        self.calls = self.registry.counter(
+            "ai_model_calls_total", "AI 모델 호출 수", ("model", "operation", "outcome")
+        )
+        self.latency = self.registry.histogram(
+            "ai_model_call_duration_seconds",
+            "AI 모델 호출 지연 시간(초)",
+            ("model", "operation", "outcome"),
+            buckets=MODEL_LATENCY_BUCKETS,
+        )
+        self.tokens = self.registry.counter(
+            "ai_model_tokens_total", "AI 모델 토큰 사용량", ("model", "kind")
+        )
+        self.parse_failures = self.registry.counter(
+            "ai_response_parse_failures_total", "AI 모델 응답 파싱 실패 수", ("model",)
+        )
+        self.retries = self.registry.counter(
+            "ai_model_retries_total", "다음 제공자로의 재시도 수", ("reason",)
+        )
+
+    def record_call(
+        self,
+        model: str,
+        operation: str,
+        outcome: str,
+        duration: float,
+        usage_metadata: Any = None,
+    ) -> None:
+        """
+        모델 호출 한 번을 기록합니다.
+
+        Args:
+            model: 모델 이름
+            operation: "generate" 또는 "stream"
+            outcome: "success", "error", "parse_error", "cancelled"
+                (헤지 요청에 져서 취소되었거나 호출한 요청이 취소된 경우)
+            duration: 호출 시간(초)
+            usage_metadata: SDK 응답의 usage_metadata (없으면 토큰 수를 기록하지 않음)
+        """
+        prompt_tokens = getattr(usage_metadata, "prompt_token_count", None) or 0
+        output_tokens = getattr(usage_metadata, "candidates_token_count", None) or 0
+
+        self.calls.inc(model=model, operation=operation, outcome=outcome)
+        self.latency.observe(duration, model=model, operation=operation, outcome=outcome)
+        if prompt_tokens:
+            self.tokens.inc(prompt_tokens, model=model, kind="prompt")
+        if output_tokens:
+            self.tokens.inc(output_tokens, model=model, kind="output")
+        if outcome == "parse_error":
+            self.parse_failures.inc(model=model)
+
+        log = logger.info if outcome == "success" else logger.warning
+        log(
+            "AI 모델 호출 model=%s operation=%s outcome=%s duration_ms=%.1f "
+            "prompt_tokens=%d output_tokens=%d",
+            model,
+            operation,
+            outcome,
+            duration * 1000,
+            prompt_tokens,
+            output_tokens,
+            extra={
+                "ai_call": {
+                    "model": model,
+                    "operation": operation,
+                    "outcome": outcome,
+                    "duration_ms": round(duration * 1000, 1),
+                    "prompt_tokens": prompt_tokens,
+                    "output_tokens": output_tokens,
+                }
+            },
+        )
+
+    def record_retry(self, reason: str) -> None:
+        """다음 제공자로 넘어간 요청을 기록합니다. reason은 "failover" 또는 "hedge"."""
+        self.retries.inc(reason=reason)
@@ -5,43 +5,64 @@ import httpx
 
 from src.application.services.social_auth_provider import SocialAuthProvider
 
+DEFAULT_TIMEOUT = httpx.Timeout(connect=3.0, read=5.0, write=5.0, pool=5.0)
+
 
 class KakaoAuthProvider(SocialAuthProvider):
     """Kakao-specific implementation of the social auth provider interface."""
 
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        auth_base_url: str = "https://kauth.kakao.com",
+        api_base_url: str = "https://kapi.kakao.com",
+    ):
+        """
+        Args:
+            client: 앱 lifespan 동안 공유하는 커넥션 풀 클라이언트 (호출마다 닫지 않음)
+            timeout: 각 카카오 API 호출에 적용할 타임아웃
+            auth_base_url: 카카오 인증 서버 주소 (테스트/벤치마크에서는 로컬 스텁 서버)
+            api_base_url: 카카오 API 서버 주소
+        """
+        self._client = client
+        self._timeout = timeout
+        self._auth_base_url = auth_base_url.rstrip("/")
+        self._api_base_url = api_base_url.rstrip("/")
+
     async def get_user_info(self, access_token: str) -> Optional[Dict[str, Any]]:
-        async with httpx.AsyncClient() as client:
-            headers = {"Authorization": f"Bearer {access_token}"}
-            response = await client.get(
-                "https://kapi.kakao.com/v2/user/me",
-                headers=headers,
-            )
+        headers = {"Authorization": f"Bearer {access_token}"}
+        response = await self._client.get(
+            f"{self._api_base_url}/v2/user/me",
+            headers=headers,
+            timeout=self._timeout,
+        )
 
-            if response.status_code == 200:
-                return response.json()
-            return None
+        if response.status_code == 200:
+            return response.json()
+        return None
 
     async def get_access_token_from_code(
         self, code: str, client_id: str, client_secret: str, redirect_uri: str
     ) -> Optional[str]:
-        async with httpx.AsyncClient() as client:
-            data = {
-                "grant_type": "authorization_code",
-                "client_id": client_id,
-                "redirect_uri": redirect_uri,
-                "code": code,
-                "client_secret": client_secret,
-            }
+        data = {
+            "grant_type": "authorization_code",
+            "client_id": client_id,
+            "redirect_uri": redirect_uri,
+            "code": code,
+            "client_secret": client_secret,
+        }
 
-            response = await client.post(
-                "https://kauth.kakao.com/oauth/token",
-                data=data,
-            )
+        response = await self._client.post(
+            f"{self._auth_base_url}/oauth/token",
+            data=data,
+            timeout=self._timeout,
+        )
 
-            if response.status_code == 200:
-                token_data = response.json()
-                return token_data.get("access_token")
-            return None
+        if response.status_code == 200:
+            token_data = response.json()
+            return token_data.get("access_token")
+        return None
 
     async def unlink_account(self, provider_user_id: str) -> bool:
         admin_key = os.getenv("KAKAO_ADMIN_KEY")
@@ -49,16 +70,15 @@ class KakaoAuthProvider(SocialAuthProvider):
             raise ValueError("KAKAO_ADMIN_KEY가 설정되지 않았습니다.")
 
         try:
-            timeout = httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=5.0)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                headers = {"Authorization": f"KakaoAK {admin_key}"}
-                data = {"target_id_type": "user_id", "target_id": provider_user_id}
-                response = await client.post(
-                    "https://kapi.kakao.com/v1/user/unlink",
-                    headers=headers,
-                    data=data,
-                )
-                return response.status_code == 200
+            headers = {"Authorization": f"KakaoAK {admin_key}"}
+            data = {"target_id_type": "user_id", "target_id": provider_user_id}
+            response = await self._client.post(
+                f"{self._api_base_url}/v1/user/unlink",
+                headers=headers,
+                data=data,
+                timeout=self._timeout,
+            )
+            return response.status_code == 200
         except httpx.HTTPError:
             # Treat network errors as unlink failures but allow higher-level flow to continue.
             return False
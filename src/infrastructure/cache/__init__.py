@@ -0,0 +1,4 @@
+from .lru_ttl_cache import CacheStats, LRUTTLCache
+from .todo_tree_cache import TodoTreeCache
+
+__all__ = ["CacheStats", "LRUTTLCache", "TodoTreeCache"]
@@ -0,0 +1,115 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# 쓰기마다 전체 행 수를 세지 않도록 이 횟수마다 한 번씩 크기 제한을 적용
+TRIM_INTERVAL = 100
+
+
+class SQLiteCache:
+    """
+    재시작 후에도 유지되는 SQLite 파일 기반 JSON 캐시
+
+    항목은 TTL이 지나면 조회되지 않으며, 최대 항목 수를 넘은 항목은 TRIM_INTERVAL번 쓰기마다
+    가장 오래 사용하지 않은 항목부터 제거합니다.
+    여러 워커 프로세스가 같은 파일을 공유할 수 있도록 WAL 모드를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at"
+            " ON cache_entries (accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """항목을 조회합니다. 없거나 만료되었으면 None을 반환합니다."""
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at <= now:
+                self._connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        now = self._clock()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now + self._ttl_seconds, now),
+            )
+            self._writes += 1
+            if self._writes % TRIM_INTERVAL == 1:
+                self._trim(now)
+
+    def trim(self) -> None:
+        """만료된 항목과 최대 항목 수를 넘는 항목을 제거합니다."""
+        with self._lock:
+            self._trim(self._clock())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def _trim(self, now: float) -> None:
+        self._connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        self._connection.execute(
+            """
+            DELETE FROM cache_entries WHERE key IN (
+                SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
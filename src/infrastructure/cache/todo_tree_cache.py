@@ -0,0 +1,147 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import replace
+from datetime import date
+from typing import Awaitable, Callable, Hashable, List, Optional, TypeVar
+
+from src.database import UnitOfWork
+from src.domain.models.todo import Todo
+from src.infrastructure.cache.lru_ttl_cache import CacheStats, LRUTTLCache
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL_SECONDS = 60.0
+
+
+class TodoTreeCache:
+    """
+    사용자별 Todo 트리 조회 결과를 보관하는 read-through 캐시
+
+    항목은 조회를 시작한 시점의 순번과 함께 보관되며, 사용자의 Todo/Task가 변경되면
+    그 사용자의 버전을 최신 순번으로 올려 그 이전에 저장된 항목을 한 번에 무효화합니다.
+
+    작업 단위 안에서는 조회가 작업 단위의 트랜잭션 스냅샷을 읽으므로, 조회 직전이 아니라
+    작업 단위가 시작될 때의 순번을 씁니다. 조회 직전의 순번을 쓰면 작업 단위 시작 후 커밋된
+    쓰기의 무효화가 조회 전에 끝났을 때, 그 쓰기 이전 스냅샷의 트리가 유효한 항목으로 남습니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        enabled: bool = True,
+        unit_of_work: Optional[UnitOfWork] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self._unit_of_work = unit_of_work
+        self._entries: LRUTTLCache = LRUTTLCache(max_entries, ttl_seconds, clock)
+        # 사용자별 마지막 무효화 시점의 순번 (모든 사용자가 하나의 증가하는 순번을 공유).
+        # 순번 순으로 보관하고 max_entries명을 넘으면 가장 오래된 것부터 버리며, 버린 가장 큰
+        # 순번을 기록에 없는 사용자의 버전으로 씁니다. 버린 사용자의 버전보다 작아지지 않으므로
+        # 무효화된 항목이 다시 유효해지지 않습니다.
+        self._versions: "OrderedDict[int, int]" = OrderedDict()
+        self._max_versions = max_entries
+        self._pruned_version = 0
+        self._sequence = 0
+        # 현재 작업 단위가 시작될 때의 순번 (작업 단위 밖이면 None)
+        self._unit_of_work_sequence: ContextVar[Optional[int]] = ContextVar(
+            "todo_tree_cache_unit_of_work_sequence", default=None
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if unit_of_work is not None:
+            unit_of_work.on_begin(self._remember_unit_of_work_sequence)
+
+    async def get_todos_by_date(
+        self, user_id: int, target_date: date, loader: Callable[[], Awaitable[List[Todo]]]
+    ) -> List[Todo]:
+        return await self._get_or_load(
+            ("date", user_id, target_date), loader, lambda todos: user_id
+        )
+
+    async def get_all_todos(
+        self, user_id: int, loader: Callable[[], Awaitable[List[Todo]]]
+    ) -> List[Todo]:
+        return await self._get_or_load(("all", user_id), loader, lambda todos: user_id)
+
+    async def get_todo(
+        self, todo_id: int, loader: Callable[[], Awaitable[Optional[Todo]]]
+    ) -> Optional[Todo]:
+        # 조회 전에는 소유자를 알 수 없으므로 조회한 Todo의 user_id로 버전을 확인
+        return await self._get_or_load(
+            ("todo", todo_id), loader, lambda todo: todo.user_id if todo else None
+        )
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        사용자의 캐시 항목을 모두 무효화합니다.
+
+        진행 중인 작업 단위가 있으면 커밋/롤백 후 한 번 더 무효화해, 트랜잭션이 끝나기 전에
+        다른 요청이나 같은 요청이 캐시에 넣은 항목이 남지 않게 합니다.
+        """
+        if not self.enabled:
+            return
+        self._bump_version(user_id)
+        if self._unit_of_work is not None:
+            self._unit_of_work.call_after(lambda: self._bump_version(user_id))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._entries.stats(), hits=self._hits, misses=self._misses)
+
+    async def _get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        owner_of: Callable[[T], Optional[int]],
+    ) -> T:
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            user_id, sequence, value = entry
+            if self._versions.get(user_id, self._pruned_version) <= sequence:
+                self._count(hit=True)
+                return copy.deepcopy(value)
+            self._entries.delete(key)
+
+        self._count(hit=False)
+        # 조회(작업 단위 안이면 작업 단위) 시작 전 순번으로 저장해, 그 뒤에 무효화되었다면
+        # 저장된 항목이 바로 무효가 되게 함
+        sequence = self._unit_of_work_sequence.get()
+        if sequence is None:
+            sequence = self._sequence
+        value = await loader()
+        user_id = owner_of(value)
+        if user_id is not None:
+            self._entries.set(key, (user_id, sequence, copy.deepcopy(value)))
+        return value
+
+    def _remember_unit_of_work_sequence(self) -> None:
+        self._unit_of_work_sequence.set(self._sequence)
+        self._unit_of_work.call_after(lambda: self._unit_of_work_sequence.set(None))
+
+    def _bump_version(self, user_id: int) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._versions[user_id] = self._sequence
+            self._versions.move_to_end(user_id)
+            if len(self._versions) > self._max_versions:
+                _, self._pruned_version = self._versions.popitem(last=False)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
@@ -0,0 +1,3 @@
+from .single_flight import SingleFlight, SingleFlightStats
+
+__all__ = ["SingleFlight", "SingleFlightStats"]
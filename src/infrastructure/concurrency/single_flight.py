@@ -0,0 +1,70 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나의 실행으로 합치는 single-flight 그룹
+
+    키가 같은 호출이 진행 중이면 새로 실행하지 않고 그 결과(또는 예외)를 함께 기다립니다.
+    결과는 호출이 끝나는 즉시 잊으므로 캐시가 아니며, 실패한 호출도 다음 요청에서 다시 실행됩니다.
+
+    실행은 별도 태스크로 돌리기 때문에 기다리던 요청 하나가 취소되어도 다른 대기자는 영향을
+    받지 않으며, 마지막 대기자까지 취소되면 실행도 취소합니다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._call_count = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key로 fn을 실행하거나, 같은 key의 실행이 진행 중이면 그 결과를 기다립니다.
+
+        같은 key의 대기자는 모두 같은 결과 객체를 받으므로 호출자는 결과를 수정하지 않아야 합니다.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self._call_count += 1
+        else:
+            self._coalesced += 1
+
+        call.waiters += 1
+        try:
+            # shield: 대기자의 취소가 공유 실행으로 전파되지 않도록 함
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+                # 취소가 끝나기 전에 들어온 호출이 취소된 실행에 합류하지 않도록 바로 제거
+                self._forget(key, call)
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            calls=self._call_count, coalesced=self._coalesced, in_flight=len(self._calls)
+        )
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
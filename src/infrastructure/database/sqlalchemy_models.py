@@ -1,5 +1,15 @@
 from datetime import date
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Boolean, DateTime
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    ForeignKey,
+    Boolean,
+    DateTime,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
@@ -7,6 +17,10 @@ Base = declarative_base()
 
 class TodoORM(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        # 사용자당 날짜별 Todo는 하나이며, (user_id, base_date) 조회/범위 스캔에 사용
+        UniqueConstraint("user_id", "base_date", name="uq_todos_user_id_base_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -17,9 +31,14 @@ class TodoORM(Base):
 
 class TaskORM(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_todo_id_user_id_parent_id", "todo_id", "user_id", "parent_id"),
+        # 서브태스크 조회 및 하위 태스크 연쇄 삭제에 사용
+        Index("ix_tasks_parent_id", "parent_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), index=True)
+    title = Column(String(255))
     points = Column(Integer)
     todo_id = Column(Integer, ForeignKey("todos.id"))
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -42,6 +61,35 @@ class UserORM(Base):
     profile_image = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    # Todo/Task가 변경될 때마다 증가하는 데이터 버전 (조회 응답의 ETag에 사용)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     todos = relationship("TodoORM", back_populates="user", cascade="all, delete-orphan")
     tasks = relationship("TaskORM", back_populates="user", cascade="all, delete-orphan")
+    daily_stats = relationship("DailyUserStatsORM", cascade="all, delete-orphan")
+    lifetime_stats = relationship("UserLifetimeStatsORM", cascade="all, delete-orphan")
+
+
+class DailyUserStatsORM(Base):
+    """사용자별 날짜(Todo의 base_date) 태스크 집계. 태스크를 쓸 때 같은 트랜잭션에서 갱신"""
+
+    __tablename__ = "daily_user_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    base_date = Column(Date, primary_key=True)
+    total_points = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_points = Column(Integer, nullable=False, default=0, server_default="0")
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_task_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class UserLifetimeStatsORM(Base):
+    """사용자별 누적 태스크 집계. 태스크를 쓸 때 같은 트랜잭션에서 갱신"""
+
+    __tablename__ = "user_lifetime_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_points = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_points = Column(Integer, nullable=False, default=0, server_default="0")
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_task_count = Column(Integer, nullable=False, default=0, server_default="0")
@@ -1,16 +1,23 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, literal, select
 
 from src.domain.models.task import Task
+from src.domain.models.task_stats import TaskStats
 from src.domain.repositories.task_repository import ITaskRepository
 from src.infrastructure.database.sqlalchemy_models import TaskORM
 
+# 한 번의 DELETE ... IN (...)에 넣는 최대 ID 수 (드라이버 바인드 파라미터 한도 대비)
+DELETE_BATCH_SIZE = 1000
+
 
 class SQLAlchemyTaskRepository(ITaskRepository):
     def __init__(self, session_factory):
         self.__session_factory = session_factory
 
-    def create(self, task: Task) -> Task:
-        with self.__session_factory() as session:
+    async def create(self, task: Task) -> Task:
+        async with self.__session_factory() as session:
             task_orm = TaskORM(
                 title=task.title,
                 points=task.points,
@@ -20,41 +27,76 @@ class SQLAlchemyTaskRepository(ITaskRepository):
                 parent_id=task.parent_id,
             )
             session.add(task_orm)
-            session.commit()
-            session.refresh(task_orm)
+            await session.flush()
+            await session.refresh(task_orm)
             return self._to_domain_task(task_orm)
 
-    def get_by_id(self, task_id: int) -> Optional[Task]:
-        with self.__session_factory() as session:
-            task_orm = session.query(TaskORM).filter(TaskORM.id == task_id).first()
+    async def create_with_subtasks(self, tasks: List[Task]) -> List[Task]:
+        async with self.__session_factory() as session:
+            # 부모 태스크들을 한 번에 삽입해 ID를 받은 뒤, 그 ID로 서브태스크들을 한 번에 삽입
+            parent_orms = [self._to_orm_task(task) for task in tasks]
+            session.add_all(parent_orms)
+            await session.flush()
+
+            subtask_orms = []
+            for task, parent_orm in zip(tasks, parent_orms):
+                subtask_orms.append(
+                    [
+                        self._to_orm_task(subtask, parent_id=parent_orm.id)
+                        for subtask in task.subtasks
+                    ]
+                )
+            session.add_all([orm for orms in subtask_orms for orm in orms])
+            await session.flush()
+
+            created_tasks = []
+            for parent_orm, orms in zip(parent_orms, subtask_orms):
+                created_task = self._to_domain_task(parent_orm)
+                created_task.subtasks = [self._to_domain_task(orm) for orm in orms]
+                created_tasks.append(created_task)
+
+            return created_tasks
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        async with self.__session_factory() as session:
+            task_orm = await session.get(TaskORM, task_id)
             if task_orm:
                 return self._to_domain_task(task_orm)
             return None
 
-    def get_by_todo_id(self, todo_id: int) -> List[Task]:
-        with self.__session_factory() as session:
-            task_orms = session.query(TaskORM).filter(
-                TaskORM.todo_id == todo_id, 
-                TaskORM.parent_id.is_(None)
+    async def get_by_todo_id(self, todo_id: int) -> List[Task]:
+        async with self.__session_factory() as session:
+            task_orms = (
+                await session.scalars(
+                    select(TaskORM).where(
+                        TaskORM.todo_id == todo_id,
+                        TaskORM.parent_id.is_(None),
+                    )
+                )
             ).all()
             return [self._to_domain_task(task_orm) for task_orm in task_orms]
     
-    def get_by_todo_id_and_user(self, todo_id: int, user_id: int) -> List[Task]:
-        with self.__session_factory() as session:
-            task_orms = session.query(TaskORM).filter(
-                TaskORM.todo_id == todo_id,
-                TaskORM.user_id == user_id
+    async def get_by_todo_id_and_user(self, todo_id: int, user_id: int) -> List[Task]:
+        async with self.__session_factory() as session:
+            task_orms = (
+                await session.scalars(
+                    select(TaskORM)
+                    .where(TaskORM.todo_id == todo_id, TaskORM.user_id == user_id)
+                    .order_by(TaskORM.id)
+                )
             ).all()
             return [self._to_domain_task(task_orm) for task_orm in task_orms]
     
-    def get_subtasks_by_parent_id(self, parent_id: int) -> List[Task]:
-        with self.__session_factory() as session:
-            task_orms = session.query(TaskORM).filter(TaskORM.parent_id == parent_id).all()
+    async def get_subtasks_by_parent_id(self, parent_id: int) -> List[Task]:
+        async with self.__session_factory() as session:
+            task_orms = (
+                await session.scalars(select(TaskORM).where(TaskORM.parent_id == parent_id))
+            ).all()
             return [self._to_domain_task(task_orm) for task_orm in task_orms]
 
-    def update(self, task: Task) -> Task:
-        with self.__session_factory() as session:
-            task_orm = session.query(TaskORM).filter(TaskORM.id == task.id).first()
+    async def update(self, task: Task) -> Task:
+        async with self.__session_factory() as session:
+            task_orm = await session.get(TaskORM, task.id)
             if task_orm:
                 # subtasks 필드를 제외하고 업데이트
                 task_orm.title = task.title
@@ -64,35 +106,83 @@ class SQLAlchemyTaskRepository(ITaskRepository):
                 task_orm.completed = task.completed
                 task_orm.parent_id = task.parent_id
                 
-                session.commit()
-                session.refresh(task_orm)
+                await session.flush()
+                await session.refresh(task_orm)
                 return self._to_domain_task(task_orm)
             raise ValueError(f"Task with id {task.id} not found")
 
-    def delete(self, task_id: int) -> None:
-        with self.__session_factory() as session:
-            task_orm = session.query(TaskORM).filter(TaskORM.id == task_id).first()
+    async def delete(self, task_id: int) -> None:
+        async with self.__session_factory() as session:
+            task_orm = await session.get(TaskORM, task_id)
             if task_orm:
-                session.delete(task_orm)
-                session.commit()
-
-    def delete_with_descendants(self, task_id: int) -> None:
-        """태스크와 모든 하위 태스크를 연쇄 삭제합니다."""
-        with self.__session_factory() as session:
-            self._delete_task_and_descendants_recursive(session, task_id)
-            session.commit()
-    
-    def _delete_task_and_descendants_recursive(self, session, task_id: int) -> None:
-        """재귀적으로 태스크와 하위 태스크들을 삭제합니다."""
-        # 먼저 하위 태스크들을 찾아서 재귀적으로 삭제
-        subtasks = session.query(TaskORM).filter(TaskORM.parent_id == task_id).all()
-        for subtask in subtasks:
-            self._delete_task_and_descendants_recursive(session, subtask.id)
-        
-        # 현재 태스크 삭제
-        task_orm = session.query(TaskORM).filter(TaskORM.id == task_id).first()
-        if task_orm:
-            session.delete(task_orm)
+                await session.delete(task_orm)
+                await session.flush()
+
+    async def delete_with_descendants(self, task_id: int) -> TaskStats:
+        """태스크와 모든 하위 태스크를 연쇄 삭제하고, 삭제한 태스크들의 집계를 반환합니다."""
+        async with self.__session_factory() as session:
+            ids_by_depth, deleted = await self._get_subtree(session, task_id)
+
+            # parent_id 외래 키를 위반하지 않도록 가장 깊은 단계부터 삭제
+            for depth in sorted(ids_by_depth, reverse=True):
+                ids = ids_by_depth[depth]
+                for start in range(0, len(ids), DELETE_BATCH_SIZE):
+                    await session.execute(
+                        delete(TaskORM).where(
+                            TaskORM.id.in_(ids[start:start + DELETE_BATCH_SIZE])
+                        )
+                    )
+            await session.flush()
+            return deleted
+
+    async def _get_subtree(self, session, task_id: int) -> Tuple[Dict[int, List[int]], TaskStats]:
+        """
+        WITH RECURSIVE 쿼리 한 번으로 태스크와 모든 하위 태스크의 ID를 깊이별로 조회하고,
+        서브트리 전체의 포인트/개수 집계를 함께 계산합니다.
+        """
+        subtree = (
+            select(TaskORM.id, TaskORM.points, TaskORM.completed, literal(0).label("depth"))
+            .where(TaskORM.id == task_id)
+            .cte("subtree", recursive=True)
+        )
+        # 루트에서 parent_id를 거꾸로 따라 도달한 행은 모두 부모 체인이 루트로 이어지므로,
+        # 잘못된 데이터에 순환이 있다면 반드시 루트를 지납니다. 루트를 다시 방문하지 않으면
+        # 순환이 있어도 재귀가 끝납니다.
+        subtree = subtree.union_all(
+            select(TaskORM.id, TaskORM.points, TaskORM.completed, subtree.c.depth + 1).where(
+                TaskORM.parent_id == subtree.c.id, TaskORM.id != task_id
+            )
+        )
+
+        ids_by_depth: Dict[int, List[int]] = defaultdict(list)
+        total_points = completed_points = completed_task_count = 0
+        rows = await session.execute(
+            select(subtree.c.id, subtree.c.points, subtree.c.completed, subtree.c.depth)
+        )
+        for subtask_id, points, completed, depth in rows:
+            ids_by_depth[depth].append(subtask_id)
+            total_points += points or 0
+            if completed:
+                completed_points += points or 0
+                completed_task_count += 1
+
+        stats = TaskStats(
+            total_points=total_points,
+            completed_points=completed_points,
+            task_count=sum(len(ids) for ids in ids_by_depth.values()),
+            completed_task_count=completed_task_count,
+        )
+        return ids_by_depth, stats
+
+    def _to_orm_task(self, task: Task, parent_id: Optional[int] = None) -> TaskORM:
+        return TaskORM(
+            title=task.title,
+            points=task.points,
+            todo_id=task.todo_id,
+            user_id=task.user_id,
+            completed=task.completed,
+            parent_id=parent_id if parent_id is not None else task.parent_id,
+        )
 
     def _to_domain_task(self, task_orm: TaskORM) -> Task:
         return Task(
@@ -1,65 +1,196 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import IntegrityError
+from src.domain.models.task import Task
 from src.domain.models.todo import Todo
 from src.domain.repositories.todo_repository import ITodoRepository
-from src.infrastructure.database.sqlalchemy_models import TodoORM
+from src.infrastructure.database.sqlalchemy_models import TodoORM, TaskORM
 
 
 class SQLAlchemyTodoRepository(ITodoRepository):
     def __init__(self, session_factory):
         self.__session_factory = session_factory
 
-    def get_all_todos(self) -> List[Todo]:
-        with self.__session_factory() as session:
-            todos_orm = session.query(TodoORM).all()
+    async def get_all_todos(self) -> List[Todo]:
+        async with self.__session_factory() as session:
+            todos_orm = (await session.scalars(select(TodoORM))).all()
             return [self._to_domain_todo(todo_orm) for todo_orm in todos_orm]
 
-    def create_todo(self, todo: Todo) -> Todo:
-        with self.__session_factory() as session:
+    async def create_todo(self, todo: Todo) -> Todo:
+        async with self.__session_factory() as session:
             # Check if todo already exists for this date and user
-            existing_todo = (
-                session.query(TodoORM)
-                .filter(TodoORM.base_date == todo.base_date)
-                .filter(TodoORM.user_id == todo.user_id)
-                .first()
+            existing_todo = await session.scalar(
+                select(TodoORM)
+                .where(TodoORM.base_date == todo.base_date)
+                .where(TodoORM.user_id == todo.user_id)
+                .limit(1)
             )
             if existing_todo:
                 return self._to_domain_todo(existing_todo)
 
             todo_orm = TodoORM(base_date=todo.base_date, user_id=todo.user_id)
-            session.add(todo_orm)
-            session.commit()
-            session.refresh(todo_orm)
+            try:
+                async with session.begin_nested():
+                    session.add(todo_orm)
+            except IntegrityError:
+                # 동시 요청이 같은 (user_id, base_date) Todo를 먼저 만든 경우 그 Todo를 반환
+                existing_todo = await session.scalar(
+                    select(TodoORM)
+                    .where(TodoORM.base_date == todo.base_date)
+                    .where(TodoORM.user_id == todo.user_id)
+                    .limit(1)
+                )
+                if not existing_todo:
+                    raise
+                return self._to_domain_todo(existing_todo)
             return self._to_domain_todo(todo_orm)
 
-    def get_by_id(self, todo_id: int) -> Optional[Todo]:
-        with self.__session_factory() as session:
-            todo_orm = session.query(TodoORM).filter(TodoORM.id == todo_id).first()
+    async def get_by_id(self, todo_id: int) -> Optional[Todo]:
+        async with self.__session_factory() as session:
+            todo_orm = await session.get(TodoORM, todo_id)
             if todo_orm:
                 return self._to_domain_todo(todo_orm)
             return None
 
-    def get_todos_by_date(self, target_date: date) -> List[Todo]:
-        with self.__session_factory() as session:
+    async def get_todos_by_date(self, target_date: date) -> List[Todo]:
+        async with self.__session_factory() as session:
             todos_orm = (
-                session.query(TodoORM).filter(TodoORM.base_date == target_date).all()
-            )
+                await session.scalars(
+                    select(TodoORM).where(TodoORM.base_date == target_date)
+                )
+            ).all()
             return [self._to_domain_todo(todo_orm) for todo_orm in todos_orm]
 
-    def get_all_todos_by_user(self, user_id: int) -> List[Todo]:
-        with self.__session_factory() as session:
-            todos_orm = session.query(TodoORM).filter(TodoORM.user_id == user_id).all()
+    async def get_all_todos_by_user(self, user_id: int) -> List[Todo]:
+        async with self.__session_factory() as session:
+            todos_orm = (
+                await session.scalars(select(TodoORM).where(TodoORM.user_id == user_id))
+            ).all()
             return [self._to_domain_todo(todo_orm) for todo_orm in todos_orm]
 
-    def get_todos_by_date_and_user(self, target_date: date, user_id: int) -> List[Todo]:
-        with self.__session_factory() as session:
+    async def get_todos_by_date_and_user(self, target_date: date, user_id: int) -> List[Todo]:
+        async with self.__session_factory() as session:
             todos_orm = (
-                session.query(TodoORM)
-                .filter(TodoORM.base_date == target_date)
-                .filter(TodoORM.user_id == user_id)
-                .all()
-            )
+                await session.scalars(
+                    select(TodoORM)
+                    .where(TodoORM.base_date == target_date)
+                    .where(TodoORM.user_id == user_id)
+                )
+            ).all()
             return [self._to_domain_todo(todo_orm) for todo_orm in todos_orm]
 
+    async def get_todos_with_tasks_by_user(
+        self, user_id: int, target_date: Optional[date] = None
+    ) -> List[Todo]:
+        async with self.__session_factory() as session:
+            todo_query = select(TodoORM).where(TodoORM.user_id == user_id)
+            task_query = (
+                select(TaskORM)
+                .join(TodoORM, TaskORM.todo_id == TodoORM.id)
+                .where(TodoORM.user_id == user_id)
+                .where(TaskORM.user_id == user_id)
+            )
+            if target_date is not None:
+                todo_query = todo_query.where(TodoORM.base_date == target_date)
+                task_query = task_query.where(TodoORM.base_date == target_date)
+
+            todos_orm = (await session.scalars(todo_query.order_by(TodoORM.id))).all()
+            tasks_orm = (await session.scalars(task_query.order_by(TaskORM.id))).all()
+            return self._build_todo_forest(todos_orm, tasks_orm)
+
+    async def get_todo_with_tasks(self, todo_id: int) -> Optional[Todo]:
+        async with self.__session_factory() as session:
+            todo_orm = await session.get(TodoORM, todo_id)
+            if not todo_orm:
+                return None
+
+            tasks_orm = (
+                await session.scalars(
+                    select(TaskORM)
+                    .where(TaskORM.todo_id == todo_id)
+                    .where(TaskORM.user_id == todo_orm.user_id)
+                    .order_by(TaskORM.id)
+                )
+            ).all()
+            return self._build_todo_forest([todo_orm], tasks_orm)[0]
+
+    async def get_todos_page_with_tasks(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Todo]:
+        async with self.__session_factory() as session:
+            todo_query = select(TodoORM).where(TodoORM.user_id == user_id)
+            if date_from is not None:
+                todo_query = todo_query.where(TodoORM.base_date >= date_from)
+            if date_to is not None:
+                todo_query = todo_query.where(TodoORM.base_date <= date_to)
+            if after is not None:
+                after_date, after_id = after
+                # (base_date, id) < (after_date, after_id) 조건으로 이전 페이지 이후부터 범위 조회
+                todo_query = todo_query.where(
+                    or_(
+                        TodoORM.base_date < after_date,
+                        and_(TodoORM.base_date == after_date, TodoORM.id < after_id),
+                    )
+                )
+
+            todos_orm = (
+                await session.scalars(
+                    todo_query.order_by(TodoORM.base_date.desc(), TodoORM.id.desc()).limit(
+                        limit
+                    )
+                )
+            ).all()
+            if not todos_orm:
+                return []
+
+            tasks_orm = (
+                await session.scalars(
+                    select(TaskORM)
+                    .where(TaskORM.todo_id.in_([todo_orm.id for todo_orm in todos_orm]))
+                    .where(TaskORM.user_id == user_id)
+                    .order_by(TaskORM.id)
+                )
+            ).all()
+            return self._build_todo_forest(todos_orm, tasks_orm)
+
+    def _build_todo_forest(
+        self, todos_orm: List[TodoORM], tasks_orm: List[TaskORM]
+    ) -> List[Todo]:
+        """조회한 Todo/Task 행들로 Todo -> Task -> subtasks 트리를 한 번의 순회로 구성합니다."""
+        todos = [self._to_domain_todo(todo_orm) for todo_orm in todos_orm]
+        todos_by_id = {todo.id: todo for todo in todos}
+
+        tasks = [self._to_domain_task(task_orm) for task_orm in tasks_orm]
+        tasks_by_id = {task.id: task for task in tasks}
+
+        for task in tasks:
+            if task.parent_id is None:
+                todo = todos_by_id.get(task.todo_id)
+                if todo:
+                    todo.tasks.append(task)
+            else:
+                parent_task = tasks_by_id.get(task.parent_id)
+                if parent_task:
+                    parent_task.subtasks.append(task)
+
+        return todos
+
     def _to_domain_todo(self, todo_orm: TodoORM) -> Todo:
         return Todo(id=todo_orm.id, user_id=todo_orm.user_id, base_date=todo_orm.base_date)
+
+    def _to_domain_task(self, task_orm: TaskORM) -> Task:
+        return Task(
+            id=task_orm.id,
+            title=task_orm.title,
+            points=task_orm.points,
+            todo_id=task_orm.todo_id,
+            user_id=task_orm.user_id,
+            completed=task_orm.completed,
+            parent_id=task_orm.parent_id,
+        )
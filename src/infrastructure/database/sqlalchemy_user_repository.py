@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
 from src.domain.models.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.database.sqlalchemy_models import UserORM
@@ -9,22 +9,24 @@ class SqlAlchemyUserRepository(UserRepository):
     def __init__(self, session_factory):
         self._session_factory = session_factory
 
-    def get_by_id(self, user_id: int) -> Optional[User]:
-        with self._session_factory() as session:
-            user_orm = session.query(UserORM).filter(UserORM.id == user_id).first()
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        async with self._session_factory() as session:
+            user_orm = await session.get(UserORM, user_id)
             if user_orm:
                 return self._to_domain(user_orm)
             return None
 
-    def get_by_kakao_id(self, kakao_id: str) -> Optional[User]:
-        with self._session_factory() as session:
-            user_orm = session.query(UserORM).filter(UserORM.kakao_id == kakao_id).first()
+    async def get_by_kakao_id(self, kakao_id: str) -> Optional[User]:
+        async with self._session_factory() as session:
+            user_orm = await session.scalar(
+                select(UserORM).where(UserORM.kakao_id == kakao_id)
+            )
             if user_orm:
                 return self._to_domain(user_orm)
             return None
 
-    def create(self, user: User) -> User:
-        with self._session_factory() as session:
+    async def create(self, user: User) -> User:
+        async with self._session_factory() as session:
             user_orm = UserORM(
                 kakao_id=user.kakao_id,
                 email=user.email,
@@ -32,31 +34,51 @@ class SqlAlchemyUserRepository(UserRepository):
                 profile_image=user.profile_image
             )
             session.add(user_orm)
-            session.commit()
-            session.refresh(user_orm)
+            await session.flush()
+            await session.refresh(user_orm)
             return self._to_domain(user_orm)
 
-    def update(self, user: User) -> User:
-        with self._session_factory() as session:
-            user_orm = session.query(UserORM).filter(UserORM.id == user.id).first()
+    async def update(self, user: User) -> User:
+        async with self._session_factory() as session:
+            user_orm = await session.get(UserORM, user.id)
             if user_orm:
                 user_orm.email = user.email
                 user_orm.nickname = user.nickname
                 user_orm.profile_image = user.profile_image
-                session.commit()
-                session.refresh(user_orm)
+                await session.flush()
+                await session.refresh(user_orm)
                 return self._to_domain(user_orm)
             raise ValueError(f"User with id {user.id} not found")
 
-    def delete(self, user_id: int) -> bool:
-        with self._session_factory() as session:
-            user_orm = session.query(UserORM).filter(UserORM.id == user_id).first()
+    async def delete(self, user_id: int) -> bool:
+        async with self._session_factory() as session:
+            user_orm = await session.get(UserORM, user_id)
             if user_orm:
-                session.delete(user_orm)
-                session.commit()
+                await session.delete(user_orm)
+                await session.flush()
                 return True
             return False
 
+    async def get_data_version(self, user_id: int) -> Optional[int]:
+        async with self._session_factory() as session:
+            return await session.scalar(
+                select(UserORM.data_version).where(UserORM.id == user_id)
+            )
+
+    async def increment_data_version(self, user_id: int) -> None:
+        async with self._session_factory() as session:
+            # 읽고 쓰지 않고 한 번의 UPDATE로 증가시켜 동시 쓰기에서도 버전이 누락되지 않게 함
+            await session.execute(
+                update(UserORM)
+                .where(UserORM.id == user_id)
+                # 데이터 버전만 바뀌므로 프로필 수정 시각(updated_at)은 유지
+                .values(
+                    data_version=UserORM.data_version + 1,
+                    updated_at=UserORM.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
     def _to_domain(self, user_orm: UserORM) -> User:
         return User(
             id=user_orm.id,
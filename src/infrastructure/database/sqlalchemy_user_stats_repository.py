@@ -0,0 +1,116 @@
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Dict
+
+from sqlalchemy import Table, case, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.domain.models.task_stats import TaskStats
+from src.domain.repositories.user_stats_repository import IUserStatsRepository
+from src.infrastructure.database.sqlalchemy_models import (
+    DailyUserStatsORM,
+    TaskORM,
+    TodoORM,
+    UserLifetimeStatsORM,
+)
+
+STATS_COLUMNS = tuple(asdict(TaskStats()))
+
+
+class SQLAlchemyUserStatsRepository(IUserStatsRepository):
+    def __init__(self, session_factory):
+        self.__session_factory = session_factory
+
+    async def add(self, user_id: int, todo_id: int, delta: TaskStats) -> None:
+        async with self.__session_factory() as session:
+            base_date = await session.scalar(
+                select(TodoORM.base_date).where(TodoORM.id == todo_id)
+            )
+            if base_date is None:
+                return
+            dialect = session.bind.dialect.name
+            await session.execute(
+                _upsert_increment(
+                    DailyUserStatsORM.__table__,
+                    {"user_id": user_id, "base_date": base_date},
+                    delta,
+                    dialect,
+                )
+            )
+            await session.execute(
+                _upsert_increment(
+                    UserLifetimeStatsORM.__table__, {"user_id": user_id}, delta, dialect
+                )
+            )
+
+    async def get_daily_total(self, user_id: int, date_from: date, date_to: date) -> TaskStats:
+        async with self.__session_factory() as session:
+            row = (
+                await session.execute(
+                    select(
+                        *(
+                            func.coalesce(func.sum(getattr(DailyUserStatsORM, column)), 0)
+                            for column in STATS_COLUMNS
+                        )
+                    ).where(
+                        DailyUserStatsORM.user_id == user_id,
+                        DailyUserStatsORM.base_date.between(date_from, date_to),
+                    )
+                )
+            ).one()
+            return TaskStats(*row)
+
+    async def get_lifetime(self, user_id: int) -> TaskStats:
+        async with self.__session_factory() as session:
+            stats_orm = await session.get(UserLifetimeStatsORM, user_id)
+            if stats_orm is None:
+                return TaskStats()
+            return TaskStats(*(getattr(stats_orm, column) for column in STATS_COLUMNS))
+
+    async def get_daily_from_tasks(
+        self, user_id: int, date_from: date, date_to: date
+    ) -> Dict[date, TaskStats]:
+        async with self.__session_factory() as session:
+            # (user_id, base_date) 유니크 인덱스로 기간의 Todo를 찾고, (todo_id, user_id, ...)
+            # 인덱스로 각 Todo의 태스크를 읽어 날짜별로 한 번에 집계
+            rows = await session.execute(
+                select(
+                    TodoORM.base_date,
+                    func.coalesce(func.sum(TaskORM.points), 0),
+                    func.coalesce(
+                        func.sum(case((TaskORM.completed, TaskORM.points), else_=0)), 0
+                    ),
+                    func.count(TaskORM.id),
+                    func.sum(case((TaskORM.completed, 1), else_=0)),
+                )
+                .join(
+                    TaskORM,
+                    (TaskORM.todo_id == TodoORM.id) & (TaskORM.user_id == TodoORM.user_id),
+                )
+                .where(
+                    TodoORM.user_id == user_id,
+                    TodoORM.base_date.between(date_from, date_to),
+                )
+                .group_by(TodoORM.base_date)
+            )
+            return {base_date: TaskStats(*stats) for base_date, *stats in rows}
+
+
+def _upsert_increment(table: Table, key: Dict[str, Any], delta: TaskStats, dialect: str):
+    """
+    key 행이 없으면 delta로 만들고, 있으면 delta를 더하는 INSERT 한 번
+
+    읽고 쓰지 않고 데이터베이스에서 더하므로 같은 날짜에 동시에 쓰더라도 변화량이 누락되지 않습니다.
+    """
+    values = {**key, **asdict(delta)}
+    if dialect == "mysql":
+        statement = mysql_insert(table).values(values)
+        return statement.on_duplicate_key_update(
+            {column: table.c[column] + statement.inserted[column] for column in STATS_COLUMNS}
+        )
+    statement = sqlite_insert(table).values(values)
+    return statement.on_conflict_do_update(
+        index_elements=list(key),
+        set_={column: table.c[column] + statement.excluded[column] for column in STATS_COLUMNS},
+    )
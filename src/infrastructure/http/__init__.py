@@ -0,0 +1,3 @@
+from .client import create_http_client
+
+__all__ = ["create_http_client"]
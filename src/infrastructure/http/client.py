@@ -0,0 +1,44 @@
+import logging
+from typing import AsyncIterator
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def create_http_client(
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0,
+    http2: bool = False,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    커넥션 풀을 유지하는 공유 httpx.AsyncClient를 생성하고, 종료 시 풀을 닫습니다.
+
+    컨테이너의 Resource로 등록해 앱 lifespan에서 한 번 만들고 닫는 용도입니다.
+    HTTP/2는 h2 패키지(httpx[http2])가 설치된 경우에만 사용합니다.
+    """
+    if http2 and not _http2_available():
+        logger.warning("h2 package is not installed; falling back to HTTP/1.1")
+        http2 = False
+
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+    )
+    try:
+        yield client
+    finally:
+        await client.aclose()
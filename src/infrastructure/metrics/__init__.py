@@ -0,0 +1,18 @@
+from .prometheus import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from .query_profiler import QueryProfile, QueryProfiler, normalize_statement
+from .registry import Counter, Gauge, Histogram, MetricsRegistry
+from .runtime import instrument_db_pool, register_threadpool_metrics
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "PROMETHEUS_CONTENT_TYPE",
+    "QueryProfile",
+    "QueryProfiler",
+    "instrument_db_pool",
+    "normalize_statement",
+    "register_threadpool_metrics",
+    "render_prometheus",
+]
@@ -0,0 +1,53 @@
+import math
+from typing import List, Sequence
+
+from src.infrastructure.metrics.registry import Histogram, LabelValues, MetricsRegistry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_prometheus(registry: MetricsRegistry) -> str:
+    """메트릭 저장소의 모든 메트릭을 Prometheus 텍스트 형식(0.0.4)으로 만듭니다."""
+    lines: List[str] = []
+    for metric in sorted(registry.collect(), key=lambda metric: metric.name):
+        lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        if isinstance(metric, Histogram):
+            for values, snapshot in sorted(metric.samples().items()):
+                for upper_bound, count in zip(metric.upper_bounds, snapshot.cumulative_counts()):
+                    labels = _labels(
+                        metric.labelnames + ("le",), values + (_format_value(upper_bound),)
+                    )
+                    lines.append(f"{metric.name}_bucket{labels} {count}")
+                labels = _labels(metric.labelnames, values)
+                lines.append(f"{metric.name}_sum{labels} {_format_value(snapshot.sum)}")
+                lines.append(f"{metric.name}_count{labels} {snapshot.count}")
+        else:
+            for values, value in sorted(metric.samples().items()):
+                lines.append(
+                    f"{metric.name}{_labels(metric.labelnames, values)} {_format_value(value)}"
+                )
+    return "\n".join(lines) + "\n"
+
+
+def _labels(names: Sequence[str], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,115 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 현재 요청의 쿼리 프로파일. 프로파일 범위 밖에서 실행한 쿼리는 기록하지 않음
+_current_profile: ContextVar[Optional["QueryProfile"]] = ContextVar(
+    "sql_query_profile", default=None
+)
+
+_STARTED_AT = "query_profiler_started_at"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """
+    SQL 문에서 값만 다른 쿼리가 같은 모양이 되도록 리터럴과 바인드 파라미터를 ?로 바꿉니다.
+
+    IN (?, ?, ?)처럼 개수만 다른 파라미터 목록은 IN (?)로 합칩니다.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryProfile:
+    """요청 하나에서 실행한 SQL 쿼리 수, DB 시간, 쿼리 모양별 실행 횟수"""
+
+    def __init__(self) -> None:
+        self.query_count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.query_count += 1
+        self.duration += duration
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated(self, min_count: int = 2) -> List[Tuple[str, int]]:
+        """min_count번 이상 실행한 쿼리 모양을 많이 실행한 순서로 반환합니다."""
+        return [
+            (shape, count) for shape, count in self.statements.most_common() if count >= min_count
+        ]
+
+
+class QueryProfiler:
+    """
+    SQLAlchemy 엔진 이벤트로 요청별 SQL 쿼리를 기록하고 N+1 의심 패턴을 찾는 프로파일러
+
+    profile() 범위 안에서 실행한 쿼리만 기록합니다. 같은 모양의 SELECT가
+    n_plus_one_threshold번 이상 실행되면 N+1 패턴으로 의심합니다.
+    설정에서 끄면 instrument를 호출하지 않으므로 이벤트 리스너 비용도 없습니다.
+    """
+
+    def __init__(self, n_plus_one_threshold: int = 5) -> None:
+        if n_plus_one_threshold < 2:
+            raise ValueError("n_plus_one_threshold must be at least 2")
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """엔진에 쿼리 시간 측정 리스너를 등록합니다."""
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if _current_profile.get() is None:
+                return
+            conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            profile = _current_profile.get()
+            started = conn.info.get(_STARTED_AT)
+            if profile is None or not started:
+                return
+            profile.record(statement, time.perf_counter() - started.pop())
+
+        @event.listens_for(sync_engine, "handle_error")
+        def handle_error(exception_context):
+            # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시간을 버림
+            connection = exception_context.connection
+            if connection is not None and connection.info.get(_STARTED_AT):
+                connection.info[_STARTED_AT].pop()
+
+    @contextmanager
+    def profile(self) -> Iterator[QueryProfile]:
+        """이 범위(와 여기서 시작한 태스크/스레드)에서 실행한 쿼리를 기록합니다."""
+        profile = QueryProfile()
+        token = _current_profile.set(profile)
+        try:
+            yield profile
+        finally:
+            _current_profile.reset(token)
+
+    def n_plus_one_suspects(self, profile: QueryProfile) -> List[Tuple[str, int]]:
+        """N+1 패턴으로 의심되는 SELECT 모양과 실행 횟수"""
+        return [
+            (shape, count)
+            for shape, count in profile.repeated(self.n_plus_one_threshold)
+            if shape.upper().startswith("SELECT")
+        ]
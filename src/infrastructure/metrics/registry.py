@@ -0,0 +1,251 @@
+import bisect
+import math
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+LabelValues = Tuple[str, ...]
+
+# 초 단위 지연 시간용 기본 버킷
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Metric:
+    """
+    메트릭 공통 동작
+
+    thread_safe=False인 메트릭은 잠금 없이 기록합니다. 이벤트 루프 스레드에서만 기록하고
+    읽는 메트릭(예: ASGI 미들웨어의 요청 메트릭)에 사용해 요청당 비용을 줄입니다.
+    """
+
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        thread_safe: bool = True,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock() if thread_safe else _NoLock()
+
+    def _label_values(self, labels: Dict[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames) or not all(
+            name in labels for name in self.labelnames
+        ):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple([str(labels[name]) for name in self.labelnames])
+
+
+class _NoLock:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class Counter(_Metric):
+    """증가만 하는 누적 값"""
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        thread_safe: bool = True,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, thread_safe)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("counter can only increase")
+        self.inc_values(self._label_values(labels), amount)
+
+    def inc_values(self, values: LabelValues, amount: float = 1.0) -> None:
+        """labelnames 순서의 라벨 값(문자열) 튜플로 바로 기록합니다. 요청마다 호출하는 경로용"""
+        with self._lock:
+            self._values[values] = self._values.get(values, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(_Metric):
+    """현재 값을 나타내는 메트릭 (커넥션 풀 사용량 등)"""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        thread_safe: bool = True,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, thread_safe)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class HistogramSnapshot:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        # 각 버킷 상한 이하 관측 수 (누적 아님, 마지막은 +Inf)
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def cumulative_counts(self) -> List[int]:
+        counts, total = [], 0
+        for count in self.bucket_counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class Histogram(_Metric):
+    """관측값을 고정 버킷으로 나누어 세는 분포"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        thread_safe: bool = True,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, thread_safe)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelValues, HistogramSnapshot] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        self.observe_values(self._label_values(labels), value)
+
+    def observe_values(self, values: LabelValues, value: float) -> None:
+        """labelnames 순서의 라벨 값(문자열) 튜플로 바로 기록합니다. 요청마다 호출하는 경로용"""
+        with self._lock:
+            snapshot = self._values.get(values)
+            if snapshot is None:
+                snapshot = self._values[values] = HistogramSnapshot(self.buckets)
+            snapshot.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            snapshot.sum += value
+            snapshot.count += 1
+
+    def snapshot(self, **labels: object) -> HistogramSnapshot:
+        return self.samples().get(self._label_values(labels)) or HistogramSnapshot(self.buckets)
+
+    def samples(self) -> Dict[LabelValues, HistogramSnapshot]:
+        with self._lock:
+            copied = {}
+            for key, snapshot in self._values.items():
+                copy = HistogramSnapshot(self.buckets)
+                copy.bucket_counts = list(snapshot.bucket_counts)
+                copy.sum = snapshot.sum
+                copy.count = snapshot.count
+                copied[key] = copy
+            return copied
+
+    @property
+    def upper_bounds(self) -> Tuple[float, ...]:
+        return self.buckets + (math.inf,)
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 저장소
+
+    같은 이름으로 다시 요청하면 이미 만든 메트릭을 돌려주므로, 여러 컴포넌트가
+    같은 메트릭을 나누어 기록할 수 있습니다. 조회 시점에 값을 읽어야 하는 게이지는
+    add_collector로 등록한 함수가 collect 직전에 갱신합니다.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        thread_safe: bool = True,
+    ) -> Counter:
+        return self._get_or_create(
+            Counter, name, documentation, labelnames, thread_safe=thread_safe
+        )
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        thread_safe: bool = True,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets, thread_safe=thread_safe
+        )
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """collect 직전에 호출해 게이지 값을 갱신할 함수를 등록합니다."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def get(self, name: str) -> Metric:
+        return self._metrics[name]
+
+    def metrics(self) -> List[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def collect(self) -> List[Metric]:
+        """등록한 collector를 실행한 뒤 모든 메트릭을 반환합니다."""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            collector()
+        return self.metrics()
+
+    def _get_or_create(self, metric_class, name, documentation, labelnames, **options):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(
+                    name, documentation, labelnames, **options
+                )
+            elif type(metric) is not metric_class or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"metric {name} is already registered with a different shape")
+            return metric
@@ -0,0 +1,100 @@
+import time
+from weakref import WeakKeyDictionary, WeakSet
+
+from anyio.to_thread import current_default_thread_limiter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+# 커넥션 점유 시간 버킷 (초)
+POOL_HOLD_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_CHECKOUT_STARTED_AT = "metrics_checkout_started_at"
+
+# 레지스트리별로 이미 계측한 엔진과 스레드풀 메트릭을 등록한 레지스트리. lifespan이 다시 실행되어도 리스너와 collector를 중복 등록하지 않음
+_instrumented_engines: "WeakKeyDictionary[MetricsRegistry, WeakSet[Engine]]" = WeakKeyDictionary()
+_threadpool_registries: "WeakSet[MetricsRegistry]" = WeakSet()
+
+
+def instrument_db_pool(engine: AsyncEngine, registry: MetricsRegistry) -> None:
+    """
+    SQLAlchemy 커넥션 풀 메트릭을 기록합니다.
+
+    - db_pool_connection_hold_seconds: 커넥션을 빌려서 반납할 때까지의 점유 시간
+    - db_pool_checked_out / db_pool_size / db_pool_overflow: 조회 시점의 풀 사용량
+    - db_pool_saturation: 빌려 간 커넥션 수 / (pool_size + max_overflow)
+
+    크기 제한이 없는 풀(NullPool 등)은 점유 시간만 기록합니다.
+    같은 엔진과 레지스트리로 다시 호출하면 아무것도 하지 않습니다.
+    """
+    sync_engine = engine.sync_engine
+    engines = _instrumented_engines.setdefault(registry, WeakSet())
+    if sync_engine in engines:
+        return
+    engines.add(sync_engine)
+
+    pool = sync_engine.pool
+    holds = registry.histogram(
+        "db_pool_connection_hold_seconds",
+        "커넥션 풀에서 빌린 커넥션을 반납할 때까지의 점유 시간(초)",
+        buckets=POOL_HOLD_BUCKETS,
+    )
+    checked_out = registry.gauge("db_pool_checked_out", "현재 빌려 간 커넥션 수")
+    size = registry.gauge("db_pool_size", "커넥션 풀 크기")
+    overflow = registry.gauge("db_pool_overflow", "pool_size를 넘어 추가로 연 커넥션 수")
+    saturation = registry.gauge(
+        "db_pool_saturation", "빌려 간 커넥션 수 / 최대 커넥션 수 (1이면 다음 요청은 대기)"
+    )
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info[_CHECKOUT_STARTED_AT] = time.perf_counter()
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        started_at = connection_record.info.pop(_CHECKOUT_STARTED_AT, None)
+        if started_at is not None:
+            holds.observe(time.perf_counter() - started_at)
+
+    def collect() -> None:
+        # dispose()는 풀을 새로 만들므로 항상 엔진의 현재 풀을 읽음
+        pool = sync_engine.pool
+        if not hasattr(pool, "checkedout"):
+            return
+        max_connections = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        checked_out.set(pool.checkedout())
+        size.set(pool.size())
+        overflow.set(max(pool.overflow(), 0))
+        saturation.set(pool.checkedout() / max_connections if max_connections else 0)
+
+    registry.add_collector(collect)
+
+
+def register_threadpool_metrics(registry: MetricsRegistry) -> None:
+    """
+    동기 라우트/의존성을 실행하는 anyio 스레드풀의 사용량을 기록합니다.
+
+    이벤트 루프 안에서 collect할 때만 값을 읽을 수 있으므로, 루프 밖에서 조회하면 갱신하지 않습니다.
+    같은 레지스트리로 다시 호출하면 아무것도 하지 않습니다.
+    """
+    if registry in _threadpool_registries:
+        return
+    _threadpool_registries.add(registry)
+
+    busy = registry.gauge("threadpool_busy_threads", "작업 중인 스레드풀 워커 수")
+    total = registry.gauge("threadpool_max_threads", "스레드풀 최대 워커 수")
+    waiting = registry.gauge("threadpool_queue_depth", "워커를 기다리는 작업 수")
+
+    def collect() -> None:
+        try:
+            limiter = current_default_thread_limiter()
+        except RuntimeError:
+            return
+        statistics = limiter.statistics()
+        busy.set(statistics.borrowed_tokens)
+        total.set(statistics.total_tokens)
+        waiting.set(statistics.tasks_waiting)
+
+    registry.add_collector(collect)
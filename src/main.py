@@ -1,9 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.presentation.api.health import router as health_router
 from src.presentation.api.todo import router as todo_router
 from src.presentation.api.task import router as task_router
 from src.presentation.api.auth import router as auth_router
+from src.presentation.api.stats import router as stats_router
+from src.presentation.api.metrics import (
+    HTTPMetricsMiddleware,
+    QueryProfilerMiddleware,
+    router as metrics_router,
+)
+from src.infrastructure.metrics.runtime import instrument_db_pool, register_threadpool_metrics
 from src.containers import Container
 from dotenv import load_dotenv
 
@@ -12,12 +21,36 @@ load_dotenv()
 
 container = Container()
 container.config.from_yaml("config.yml")
+register_threadpool_metrics(container.metrics_registry())
+sql_profiler_enabled = container.config.profiling.sql.enabled()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    database = container.database()
+    await database.initialize()
+    instrument_db_pool(database.engine, container.metrics_registry())
+    if sql_profiler_enabled:
+        container.query_profiler().instrument(database.engine)
+    # 공유 HTTP 클라이언트 등 컨테이너 리소스 생성
+    await container.init_resources()
+    try:
+        yield
+    finally:
+        await container.shutdown_resources()
+        await database.dispose()
 
-app = FastAPI(docs_url="/api/documentation", openapi_url="/api/openapi.json")
+
+app = FastAPI(
+    docs_url="/api/documentation", openapi_url="/api/openapi.json", lifespan=lifespan
+)
 app.container = container  # type: ignore
 
 origins = ["*"]
 
+if sql_profiler_enabled:
+    app.add_middleware(QueryProfilerMiddleware, profiler=container.query_profiler())
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -25,8 +58,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 가장 바깥에서 CORS 처리까지 포함한 전체 처리 시간을 측정
+app.add_middleware(HTTPMetricsMiddleware, registry=container.metrics_registry())
 
 app.include_router(health_router)
 app.include_router(todo_router)
 app.include_router(task_router)
 app.include_router(auth_router)
+app.include_router(stats_router)
+app.include_router(metrics_router)
@@ -7,11 +7,12 @@ from dependency_injector.wiring import inject, Provide
 from src.containers import Container
 from src.application.services.auth_service import AuthService
 from src.domain.models.user import User
+from src.presentation.api.unit_of_work import UnitOfWorkRoute
 
 from urllib.parse import urlencode
 from typing import Optional
 
-router = APIRouter(prefix="/api/auth", tags=["auth"])
+router = APIRouter(prefix="/api/auth", tags=["auth"], route_class=UnitOfWorkRoute)
 
 
 @router.get("/kakao")
@@ -52,7 +53,7 @@ async def kakao_login(
             )
 
         # 사용자 조회 또는 생성
-        user = auth_service.get_or_create_user(kakao_user_info)
+        user = await auth_service.get_or_create_user(kakao_user_info)
 
         # JWT 토큰 생성
         jwt_token = auth_service.create_access_token(user)
@@ -147,7 +148,7 @@ async def withdraw_user(
         )
 
         # 앱 내 사용자 데이터 삭제
-        user_delete_success = auth_service.delete_user(current_user.id)
+        user_delete_success = await auth_service.delete_user(current_user.id)
 
         if not user_delete_success:
             raise HTTPException(status_code=404, detail="User not found")
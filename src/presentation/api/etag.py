@@ -0,0 +1,52 @@
+from typing import Optional
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, Header, HTTPException, Response, status
+
+from src.application.services.data_version_service import DataVersionService
+from src.containers import Container
+from src.domain.models.user import User
+from src.presentation.api.auth import get_current_user
+
+
+def make_etag(user_id: int, version: int) -> str:
+    """사용자 데이터 버전으로 만든 약한(weak) ETag"""
+    return f'W/"u{user_id}-v{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더의 태그 중 하나라도 현재 ETag와 약한 비교로 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(",")
+    )
+
+
+@inject
+async def check_user_data_version(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    data_version_service: DataVersionService = Depends(
+        Provide[Container.data_version_service]
+    ),
+) -> None:
+    """
+    사용자 데이터 버전으로 ETag를 붙이고, 클라이언트의 태그가 최신이면 본문 없이 304를 응답합니다.
+
+    라우트 핸들러보다 먼저 실행되므로 304인 경우 Todo/Task 트리 조회는 실행되지 않습니다.
+    """
+    version = await data_version_service.get_version(current_user.id)
+    if version is None:
+        return
+
+    etag = make_etag(current_user.id, version)
+    # 캐시된 응답을 쓰기 전에 항상 서버에 재검증하도록 함
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
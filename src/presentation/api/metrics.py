@@ -0,0 +1,143 @@
+import logging
+import time
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.containers import Container
+from src.infrastructure.metrics.prometheus import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from src.infrastructure.metrics.query_profiler import QueryProfile, QueryProfiler
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api")
+
+# 어떤 라우트에도 맞지 않은 요청은 경로별로 나누지 않음 (라벨 수 폭증 방지)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class HTTPMetricsMiddleware:
+    """
+    라우트 템플릿(/api/todos/{todo_id})과 상태 코드별 요청 수와 지연 시간을 기록하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware와 달리 요청/응답을 감싸는 태스크를 만들지 않는 순수 ASGI 미들웨어입니다.
+    기록은 이벤트 루프 스레드에서만 일어나므로 잠금 없이 고정 버킷에 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.requests = registry.counter(
+            "http_requests_total",
+            "HTTP 요청 수",
+            ("method", "route", "status"),
+            thread_safe=False,
+        )
+        self.latency = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP 요청 처리 시간(초)",
+            ("method", "route", "status"),
+            thread_safe=False,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우터가 매칭한 라우트를 scope에 남김
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE), str(status_code))
+            self.requests.inc_values(labels)
+            self.latency.observe_values(labels, time.perf_counter() - started)
+
+
+class QueryProfilerMiddleware:
+    """
+    요청별 SQL 쿼리 수와 DB 시간을 응답 헤더와 구조화된 로그로 남기는 ASGI 미들웨어
+
+    - Server-Timing: db;dur=<ms>;desc="<n> queries"
+    - X-DB-Query-Count: 쿼리 수
+    - X-DB-N-Plus-One: N+1로 의심되는 쿼리 모양 수 (의심 패턴이 있을 때만)
+
+    헤더는 응답 시작 시점까지의 쿼리만 반영하고, 로그(extra["sql_profile"])는 스트리밍 응답을
+    포함한 요청 전체를 기록합니다. N+1 의심 패턴이 있으면 WARNING으로 남깁니다.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: QueryProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.profiler.profile() as profile:
+
+            async def send_with_profile(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={profile.duration * 1000:.1f};desc="{profile.query_count} queries"',
+                    )
+                    headers.append("X-DB-Query-Count", str(profile.query_count))
+                    suspects = self.profiler.n_plus_one_suspects(profile)
+                    if suspects:
+                        headers.append("X-DB-N-Plus-One", str(len(suspects)))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_profile)
+            finally:
+                self._log(scope, profile)
+
+    def _log(self, scope: Scope, profile: QueryProfile) -> None:
+        suspects = self.profiler.n_plus_one_suspects(profile)
+        route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+        log = logger.warning if suspects else logger.info
+        log(
+            "SQL 프로파일 method=%s route=%s queries=%d db_ms=%.1f n_plus_one=%d",
+            scope["method"],
+            route,
+            profile.query_count,
+            profile.duration * 1000,
+            len(suspects),
+            extra={
+                "sql_profile": {
+                    "method": scope["method"],
+                    "route": route,
+                    "query_count": profile.query_count,
+                    "db_ms": round(profile.duration * 1000, 1),
+                    "repeated": [
+                        {"statement": shape, "count": count} for shape, count in profile.repeated()
+                    ],
+                    "n_plus_one": [
+                        {"statement": shape, "count": count} for shape, count in suspects
+                    ],
+                }
+            },
+        )
+
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def metrics(registry: MetricsRegistry = Depends(Provide[Container.metrics_registry])):
+    """Prometheus 텍스트 형식의 메트릭"""
+    return Response(render_prometheus(registry), media_type=PROMETHEUS_CONTENT_TYPE)
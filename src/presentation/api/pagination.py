@@ -0,0 +1,21 @@
+import base64
+import binascii
+from datetime import date
+from typing import Tuple
+
+
+def encode_todo_cursor(base_date: date, todo_id: int) -> str:
+    """Todo 목록 페이지의 마지막 항목 (base_date, id)을 불투명한 커서 문자열로 인코딩합니다."""
+    raw = f"{base_date.isoformat()}:{todo_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_todo_cursor(cursor: str) -> Tuple[date, int]:
+    """커서 문자열을 (base_date, id)로 디코딩합니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        base_date, todo_id = raw.split(":")
+        return date.fromisoformat(base_date), int(todo_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
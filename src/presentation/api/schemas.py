@@ -1,7 +1,10 @@
 from datetime import date
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# 한 번의 일괄 AI 생성 요청에 담을 수 있는 최대 항목 수 (한 달 분량)
+MAX_AI_BATCH_ITEMS = 31
 
 
 class TodoCreate(BaseModel):
@@ -22,6 +25,12 @@ class TodoResponse(BaseModel):
         from_attributes = True
 
 
+class TodoPageResponse(BaseModel):
+    todos: List[TodoResponse] = []
+    limit: int
+    next_cursor: Optional[str] = None
+
+
 class TaskCreate(BaseModel):
     title: str
     points: int
@@ -76,6 +85,20 @@ class AITodoResponse(BaseModel):
     tasks: List[AITaskData] = []
 
 
+class AITodoBatchCreate(BaseModel):
+    items: List[AITodoCreate] = Field(min_length=1, max_length=MAX_AI_BATCH_ITEMS)
+
+
+class AITodoBatchItemResponse(BaseModel):
+    base_date: date
+    tasks: List[AITaskData] = []
+    error: Optional[str] = None
+
+
+class AITodoBatchResponse(BaseModel):
+    results: List[AITodoBatchItemResponse] = []
+
+
 class BulkTaskCreate(BaseModel):
     title: str
     points: int
@@ -86,3 +109,39 @@ class BulkTaskCreate(BaseModel):
 class BulkTodoCreate(BaseModel):
     base_date: Optional[date] = None
     tasks: List[BulkTaskCreate] = []
+
+
+class TaskStatsResponse(BaseModel):
+    total_points: int
+    completed_points: int
+    task_count: int
+    completed_task_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class UserStatsResponse(BaseModel):
+    base_date: date
+    today: TaskStatsResponse
+    # base_date가 속한 주 (월요일~일요일)
+    week: TaskStatsResponse
+    lifetime: TaskStatsResponse
+
+    class Config:
+        from_attributes = True
+
+
+class CalendarStatsResponse(BaseModel):
+    """from부터 하루씩의 집계를 항목별 배열로 담은 달력 (i번째 값은 from + i일)"""
+
+    date_from: date = Field(alias="from")
+    date_to: date = Field(alias="to")
+    total_points: List[int]
+    completed_points: List[int]
+    task_count: List[int]
+    completed_task_count: List[int]
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
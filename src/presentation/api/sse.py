@@ -0,0 +1,14 @@
+import json
+from typing import Any
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # 리버스 프록시(nginx)가 이벤트를 모아서 보내지 않도록 버퍼링 해제
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse_event(event: str, data: Any) -> str:
+    """Server-Sent Events 형식의 이벤트 하나를 만듭니다. data는 한 줄 JSON으로 직렬화합니다."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,50 @@
+from datetime import date
+from typing import Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.application.services.user_stats_service import UserStatsService
+from src.containers import Container
+from src.domain.models.user import User
+from src.presentation.api.auth import get_current_user
+from src.presentation.api.schemas import CalendarStatsResponse, UserStatsResponse
+from src.presentation.api.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api", route_class=UnitOfWorkRoute)
+
+
+@router.get("/stats", response_model=UserStatsResponse)
+@inject
+async def get_stats(
+    base_date: Optional[date] = Query(
+        None, description="Day to report, defaults to today (YYYY-MM-DD)"
+    ),
+    current_user: User = Depends(get_current_user),
+    service: UserStatsService = Depends(Provide[Container.user_stats_service]),
+):
+    """
+    base_date 하루, base_date가 속한 주(월~일), 누적 포인트와 태스크 수를 반환합니다.
+
+    태스크를 쓸 때 함께 갱신하는 집계 테이블에서 읽으므로 태스크 수와 관계없이 집계 행 몇 개만 조회합니다.
+    """
+    return await service.get_summary(current_user.id, base_date or date.today())
+
+
+@router.get("/stats/calendar", response_model=CalendarStatsResponse)
+@inject
+async def get_calendar_stats(
+    date_from: date = Query(..., alias="from", description="Start date, inclusive (YYYY-MM-DD)"),
+    date_to: date = Query(..., alias="to", description="End date, inclusive (YYYY-MM-DD)"),
+    current_user: User = Depends(get_current_user),
+    service: UserStatsService = Depends(Provide[Container.user_stats_service]),
+):
+    """
+    기간(최대 366일)의 날짜별 포인트와 태스크 수를 히트맵용 배열로 반환합니다.
+
+    날짜마다 Todo 트리를 조회하지 않고, 기간의 Todo와 태스크를 날짜별로 묶는 집계 쿼리 한 번으로 계산합니다.
+    """
+    try:
+        return await service.get_calendar(current_user.id, date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
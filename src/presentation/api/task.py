@@ -7,14 +7,16 @@ from src.containers import Container
 from src.domain.models.task import Task
 from src.presentation.api.schemas import TaskCreate, TaskUpdate, TaskResponse
 from src.presentation.api.auth import get_current_user
+from src.presentation.api.etag import check_user_data_version
+from src.presentation.api.unit_of_work import UnitOfWorkRoute
 from src.domain.models.user import User
 
-router = APIRouter(prefix="/api")
+router = APIRouter(prefix="/api", route_class=UnitOfWorkRoute)
 
 
 @router.post("/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 @inject
-def create_task(
+async def create_task(
     task_create: TaskCreate,
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(Provide[Container.task_service]),
@@ -28,18 +30,22 @@ def create_task(
         completed=task_create.completed,
         parent_id=task_create.parent_id,
     )
-    created_task = task_service.create_task(task)
+    created_task = await task_service.create_task(task)
     return created_task
 
 
-@router.get("/tasks/{task_id}", response_model=TaskResponse)
+@router.get(
+    "/tasks/{task_id}",
+    response_model=TaskResponse,
+    dependencies=[Depends(check_user_data_version)],
+)
 @inject
-def get_task(
+async def get_task(
     task_id: int, 
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(Provide[Container.task_service])
 ):
-    task = task_service.get_task_with_subtasks(task_id)
+    task = await task_service.get_task_with_subtasks(task_id)
     if not task or task.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
@@ -47,27 +53,31 @@ def get_task(
     return task
 
 
-@router.get("/todos/{todo_id}/tasks", response_model=List[TaskResponse])
+@router.get(
+    "/todos/{todo_id}/tasks",
+    response_model=List[TaskResponse],
+    dependencies=[Depends(check_user_data_version)],
+)
 @inject
-def get_tasks_by_todo(
+async def get_tasks_by_todo(
     todo_id: int, 
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(Provide[Container.task_service])
 ):
-    tasks = task_service.get_tasks_with_subtasks_by_todo_id(todo_id, current_user.id)
+    tasks = await task_service.get_tasks_with_subtasks_by_todo_id(todo_id, current_user.id)
     return tasks
 
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
 @inject
-def update_task(
+async def update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(Provide[Container.task_service]),
 ):
     try:
-        updated_task = task_service.update_task(
+        updated_task = await task_service.update_task(
             task_id=task_id,
             title=task_update.title,
             points=task_update.points,
@@ -82,13 +92,13 @@ def update_task(
 
 @router.patch("/tasks/{task_id}/toggle", response_model=TaskResponse)
 @inject
-def toggle_task_completion(
+async def toggle_task_completion(
     task_id: int,
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(Provide[Container.task_service]),
 ):
     try:
-        updated_task = task_service.toggle_task_completion(task_id, current_user.id)
+        updated_task = await task_service.toggle_task_completion(task_id, current_user.id)
         return updated_task
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -96,12 +106,12 @@ def toggle_task_completion(
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-def delete_task(
+async def delete_task(
     task_id: int, 
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(Provide[Container.task_service])
 ):
     try:
-        task_service.delete_task(task_id, current_user.id)
+        await task_service.delete_task(task_id, current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,5 +1,8 @@
+import logging
+
 from fastapi import APIRouter, Depends, status, HTTPException, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional, Union
 from datetime import date
 from dependency_injector.wiring import inject, Provide
 
@@ -8,47 +11,100 @@ from src.application.services.task_service import TaskService
 from src.presentation.api.schemas import (
     TodoCreate,
     TodoResponse,
+    TodoPageResponse,
     AITodoCreate,
     AITodoResponse,
+    AITodoBatchCreate,
+    AITodoBatchItemResponse,
+    AITodoBatchResponse,
     AITaskData,
     AISubtaskData,
     BulkTodoCreate,
 )
 from src.application.mappers.todo_mapper import TodoMapper
+from src.presentation.api.pagination import encode_todo_cursor, decode_todo_cursor
 from src.containers import Container
 from src.presentation.api.auth import get_current_user
+from src.presentation.api.etag import check_user_data_version
+from src.presentation.api.sse import SSE_HEADERS, format_sse_event
+from src.presentation.api.unit_of_work import UnitOfWorkRoute
 from src.domain.models.user import User
 from src.application.services.ai_service import AIService
+from src.infrastructure.ai.rate_limiter import AIRateLimitExceeded
 from src.domain.models.task import Task
 
-router = APIRouter(prefix="/api")
+logger = logging.getLogger(__name__)
+
+AI_RATE_LIMITED_DETAIL = "AI 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+
+router = APIRouter(prefix="/api", route_class=UnitOfWorkRoute)
 
 
 # Todo CRUD operations
-@router.get("/todos", response_model=List[TodoResponse])
+@router.get(
+    "/todos",
+    response_model=Union[List[TodoResponse], TodoPageResponse],
+    dependencies=[Depends(check_user_data_version)],
+)
 @inject
-def get_all_todos(
+async def get_all_todos(
     target_date: Optional[date] = Query(
         None, description="Filter todos by date (YYYY-MM-DD)"
     ),
+    date_from: Optional[date] = Query(
+        None, alias="from", description="History start date, inclusive (YYYY-MM-DD)"
+    ),
+    date_to: Optional[date] = Query(
+        None, alias="to", description="History end date, inclusive (YYYY-MM-DD)"
+    ),
+    limit: int = Query(30, ge=1, le=100, description="History page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor value from the previous history page"
+    ),
     current_user: User = Depends(get_current_user),
     service: TodoService = Depends(Provide[Container.todo_service]),
 ):
+    """
+    target_date가 있으면 해당 날짜의 Todo 목록을, 없으면 최신 날짜부터 페이지 단위의 히스토리를 반환합니다.
+
+    히스토리 응답의 next_cursor를 다음 요청의 cursor로 넘기면 이어지는 페이지를 조회합니다.
+    """
     if target_date:
-        todos = service.get_todos_by_date_with_tasks(target_date, current_user.id)
-    else:
-        todos = service.get_all_todos_with_tasks(current_user.id)
-    return [TodoMapper.to_todo_response(todo) for todo in todos]
+        todos = await service.get_todos_by_date_with_tasks(target_date, current_user.id)
+        return [TodoMapper.to_todo_response(todo) for todo in todos]
+
+    try:
+        after = decode_todo_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    todos, has_more = await service.get_todos_page_with_tasks(
+        current_user.id, limit, after=after, date_from=date_from, date_to=date_to
+    )
+    next_cursor = None
+    if has_more:
+        last_todo = todos[-1]
+        next_cursor = encode_todo_cursor(last_todo.base_date, last_todo.id)
+
+    return TodoPageResponse(
+        todos=[TodoMapper.to_todo_response(todo) for todo in todos],
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
 
-@router.get("/todos/{todo_id}", response_model=TodoResponse)
+@router.get(
+    "/todos/{todo_id}",
+    response_model=TodoResponse,
+    dependencies=[Depends(check_user_data_version)],
+)
 @inject
-def get_todo(
+async def get_todo(
     todo_id: int,
     current_user: User = Depends(get_current_user),
     service: TodoService = Depends(Provide[Container.todo_service]),
 ):
-    todo = service.get_todo_with_tasks(todo_id)
+    todo = await service.get_todo_with_tasks(todo_id)
     if not todo or todo.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found"
@@ -58,19 +114,20 @@ def get_todo(
 
 @router.post("/todos", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
 @inject
-def create_todo(
+async def create_todo(
     todo_create: TodoCreate,
     current_user: User = Depends(get_current_user),
     service: TodoService = Depends(Provide[Container.todo_service]),
 ):
-    todo = service.create_todo(base_date=todo_create.base_date, user_id=current_user.id)
+    todo = await service.create_todo(base_date=todo_create.base_date, user_id=current_user.id)
     return TodoMapper.to_todo_response(todo)
 
 
 @router.post("/todos/ai", response_model=AITodoResponse)
 @inject
-def create_todo_with_ai(
+async def create_todo_with_ai(
     ai_todo_create: AITodoCreate,
+    current_user: User = Depends(get_current_user),
     ai_service: AIService = Depends(Provide[Container.ai_service]),
 ):
     """
@@ -83,31 +140,122 @@ def create_todo_with_ai(
     }
     """
     # AI로 TODO 구조 생성
-    ai_result = ai_service.generate_todos_from_text(
-        user_input=ai_todo_create.user_input, target_date=ai_todo_create.base_date
-    )
+    try:
+        ai_result = await ai_service.generate_todos_from_text(
+            user_input=ai_todo_create.user_input,
+            target_date=ai_todo_create.base_date,
+            user_id=current_user.id,
+        )
+    except AIRateLimitExceeded as e:
+        raise _rate_limited(e)
 
     # AI 결과를 응답 형식으로 변환
-    tasks = [
-        AITaskData(
-            title=task["title"],
-            points=task["points"],
-            subtasks=[
-                AISubtaskData(title=subtask["title"], points=subtask["points"])
-                for subtask in task.get("subtasks", [])
-            ],
-        )
-        for task in ai_result["tasks"]
-    ]
+    tasks = [_to_ai_task_data(task) for task in ai_result["tasks"]]
 
     return AITodoResponse(base_date=ai_todo_create.base_date, tasks=tasks)
 
 
+@router.post("/todos/ai/batch", response_model=AITodoBatchResponse)
+@inject
+async def create_todos_with_ai_batch(
+    batch_create: AITodoBatchCreate,
+    current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(Provide[Container.ai_service]),
+):
+    """
+    여러 날짜의 자연어 입력을 한 번에 받아 AI로 TODO와 Task 구조를 생성합니다. (저장하지 않음)
+
+    항목들은 설정한 동시 실행 수만큼 함께 생성되며, 결과는 입력 순서대로 반환합니다.
+    실패한 항목은 tasks 대신 error를 담고, 나머지 항목의 결과에는 영향을 주지 않습니다.
+    모든 항목이 호출 한도 때문에 거절되면 429로 응답합니다.
+    """
+    target_dates = [item.base_date or date.today() for item in batch_create.items]
+    ai_results = await ai_service.generate_todos_batch(
+        [(item.user_input, target_date) for item, target_date in zip(batch_create.items, target_dates)],
+        user_id=current_user.id,
+    )
+    if all(isinstance(ai_result, AIRateLimitExceeded) for ai_result in ai_results):
+        raise _rate_limited(min(ai_results, key=lambda e: e.retry_after))
+
+    results = []
+    for target_date, ai_result in zip(target_dates, ai_results):
+        if isinstance(ai_result, AIRateLimitExceeded):
+            results.append(
+                AITodoBatchItemResponse(base_date=target_date, error=AI_RATE_LIMITED_DETAIL)
+            )
+            continue
+        if isinstance(ai_result, Exception):
+            logger.error("AI TODO 일괄 생성 항목 실패", exc_info=ai_result)
+            results.append(
+                AITodoBatchItemResponse(
+                    base_date=target_date, error="AI TODO 생성 중 오류가 발생했습니다"
+                )
+            )
+            continue
+        results.append(
+            AITodoBatchItemResponse(
+                base_date=target_date,
+                tasks=[_to_ai_task_data(task) for task in ai_result["tasks"]],
+            )
+        )
+    return AITodoBatchResponse(results=results)
+
+
+@router.post("/todos/ai/stream")
+@inject
+async def stream_todo_with_ai(
+    ai_todo_create: AITodoCreate,
+    current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(Provide[Container.ai_service]),
+):
+    """
+    자연어 입력으로 생성한 태스크를 Server-Sent Events로 하나씩 전송합니다. (저장하지 않음)
+
+    태스크가 완성될 때마다 `task` 이벤트(AITaskData 형식)를 보내고, 끝나면 `done` 이벤트
+    ({"base_date", "task_count"})를 보냅니다. 생성 중 오류가 나면 `error` 이벤트를 보내고 종료합니다.
+    호출 한도를 넘으면 스트림을 시작하지 않고 429로 응답합니다.
+    """
+    target_date = ai_todo_create.base_date or date.today()
+    stream = ai_service.stream_todos_from_text(
+        user_input=ai_todo_create.user_input, target_date=target_date, user_id=current_user.id
+    )
+
+    # 호출 한도 거절을 상태 코드로 알릴 수 있도록 첫 태스크까지 받은 뒤 응답을 시작
+    first_task, first_error = None, None
+    try:
+        first_task = await anext(stream, None)
+    except AIRateLimitExceeded as e:
+        raise _rate_limited(e)
+    except Exception as e:
+        first_error = e
+
+    async def events():
+        task_count = 0
+        try:
+            if first_error is not None:
+                raise first_error
+            task = first_task
+            while task is not None:
+                task_count += 1
+                yield format_sse_event("task", _to_ai_task_data(task).model_dump())
+                task = await anext(stream, None)
+        except Exception:
+            # 응답 헤더를 이미 보냈으므로 상태 코드 대신 error 이벤트로 알림
+            logger.exception("AI TODO 스트리밍 생성 실패")
+            yield format_sse_event("error", {"detail": "AI TODO 생성 중 오류가 발생했습니다"})
+            return
+        yield format_sse_event(
+            "done", {"base_date": target_date.isoformat(), "task_count": task_count}
+        )
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.post(
     "/todos/bulk", response_model=TodoResponse, status_code=status.HTTP_201_CREATED
 )
 @inject
-def create_todo_bulk(
+async def create_todo_bulk(
     bulk_todo_create: BulkTodoCreate,
     current_user: User = Depends(get_current_user),
     todo_service: TodoService = Depends(Provide[Container.todo_service]),
@@ -127,38 +275,48 @@ def create_todo_bulk(
     }
 
     parent_id는 tasks 배열의 인덱스를 의미합니다 (0부터 시작).
+    응답에는 이번 요청으로 생성된 Task들만 포함됩니다.
     """
     # TODO 생성
-    todo = todo_service.create_todo(
+    todo = await todo_service.create_todo(
         base_date=bulk_todo_create.base_date, user_id=current_user.id
     )
 
-    created_tasks = []
-
-    for task_data in bulk_todo_create.tasks:
-        # parent_id가 있으면 이미 생성된 task의 실제 ID를 참조
-        actual_parent_id = None
-        if task_data.parent_id is not None:
-            if 0 <= task_data.parent_id < len(created_tasks):
-                actual_parent_id = created_tasks[task_data.parent_id].id
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid parent_id: {task_data.parent_id}",
-                )
-
-        task = Task(
+    tasks = [
+        Task(
             id=None,
             title=task_data.title,
             points=task_data.points,
             todo_id=todo.id,
             user_id=current_user.id,
             completed=task_data.completed,
-            parent_id=actual_parent_id,
+            parent_id=task_data.parent_id,
         )
-        created_task = task_service.create_task(task)
-        created_tasks.append(created_task)
+        for task_data in bulk_todo_create.tasks
+    ]
+
+    try:
+        todo.tasks = await task_service.create_tasks_bulk(todo.id, current_user.id, tasks)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    # 생성된 TODO와 모든 Task를 함께 반환
-    complete_todo = todo_service.get_todo_with_tasks(todo.id)
-    return TodoMapper.to_todo_response(complete_todo)
+    return TodoMapper.to_todo_response(todo)
+
+
+def _to_ai_task_data(task: Dict[str, Any]) -> AITaskData:
+    return AITaskData(
+        title=task["title"],
+        points=task["points"],
+        subtasks=[
+            AISubtaskData(title=subtask["title"], points=subtask["points"])
+            for subtask in task.get("subtasks", [])
+        ],
+    )
+
+
+def _rate_limited(e: AIRateLimitExceeded) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=AI_RATE_LIMITED_DETAIL,
+        headers={"Retry-After": str(e.retry_after_seconds)},
+    )
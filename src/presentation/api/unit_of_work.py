@@ -0,0 +1,33 @@
+from typing import Callable, Coroutine, Any
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+
+from src.database import UnitOfWork
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    요청 하나를 컨테이너의 작업 단위(UnitOfWork) 하나로 처리하는 라우트
+
+    의존성과 핸들러의 모든 저장소 호출이 같은 세션과 트랜잭션을 사용하며,
+    응답을 보내기 전에 한 번 커밋하고 예외(HTTPException 포함)가 발생하면 롤백합니다.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def unit_of_work_route_handler(request: Request) -> Response:
+            unit_of_work: UnitOfWork = request.app.container.unit_of_work()
+            async with unit_of_work.begin() as session:
+                try:
+                    return await route_handler(request)
+                except (HTTPException, RequestValidationError) as e:
+                    # 의도한 오류 응답(4xx, 304 등)은 예외 로그 없이 롤백만 하고 그대로 전달
+                    await session.rollback()
+                    error = e
+            raise error
+
+        return unit_of_work_route_handler
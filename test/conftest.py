@@ -2,12 +2,21 @@ import pytest
 from dependency_injector import providers
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
+from benchmarks.synthetic_data import SyntheticDataSpec, load_synthetic_data
 from src.application.services.ai_service import AIService
 from src.application.services.social_auth_provider import SocialAuthProvider
-from src.database import Database
+from src.database import (
+    Database,
+    UnitOfWork,
+    enable_sqlite_transactions,
+    to_async_database_url,
+)
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
 from src.infrastructure.database.sqlalchemy_models import Base
 from src.main import app, container
 from test.fake_ai_model_service import FakeAIModelService
@@ -43,28 +52,57 @@ def test_social_auth_provider():
 
 
 @pytest.fixture(scope="function")
-def in_memory_sqlite_db():
-    """SQLite 인메모리 데이터베이스 생성"""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+def sqlite_db_url(tmp_path):
+    """테스트마다 새로 만드는 SQLite 파일 데이터베이스 URL"""
+    return f"sqlite:///{tmp_path / 'todo_grow.db'}"
+
+
+@pytest.fixture(scope="function")
+def sqlite_db(sqlite_db_url):
+    """SQLite 데이터베이스 생성 (테스트 데이터 준비/검증용 동기 엔진)"""
+    engine = create_engine(sqlite_db_url)
 
     Base.metadata.create_all(engine)
-    return engine
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def async_sqlite_db(sqlite_db, sqlite_db_url):
+    """같은 SQLite 데이터베이스에 연결하는 애플리케이션용 비동기 엔진"""
+    # TestClient는 요청마다 이벤트 루프가 달라지므로 연결을 풀에 보관하지 않음
+    return enable_sqlite_transactions(
+        create_async_engine(to_async_database_url(sqlite_db_url), poolclass=NullPool)
+    )
 
 
 @pytest.fixture(scope="function")
-def session_factory(in_memory_sqlite_db):
-    """세션 팩토리 생성"""
-    yield sessionmaker(bind=in_memory_sqlite_db)
+def session_factory(async_sqlite_db):
+    """세션 팩토리 생성 (호출마다 독립된 작업 단위로 커밋)"""
+    yield UnitOfWork(Database(async_sqlite_db)).session
 
 
 @pytest.fixture(scope="function")
-def db_session(session_factory):
+def synthetic_data(sqlite_db):
+    """
+    테스트 데이터베이스에 시드 고정 합성 히스토리를 적재하는 함수
+
+    SyntheticDataSpec의 필드를 키워드 인자로 받아 적재한 SyntheticDataset을 반환합니다.
+    """
+
+    def load(**spec):
+        with sqlite_db.begin() as connection:
+            return load_synthetic_data(connection, SyntheticDataSpec(**spec))
+
+    return load
+
+
+@pytest.fixture(scope="function")
+def db_session(sqlite_db):
     """데이터베이스 세션 fixture"""
-    session = session_factory()
+    session = sessionmaker(bind=sqlite_db)()
     try:
         yield session
     finally:
@@ -72,13 +110,22 @@ def db_session(session_factory):
 
 
 @pytest.fixture(scope="function")
-def app_container(in_memory_sqlite_db, test_social_auth_provider):
+def app_container(async_sqlite_db, test_social_auth_provider):
     """애플리케이션 컨테이너를 테스트용 데이터베이스로 오버라이드"""
     container = app.container
-    test_database = Database(in_memory_sqlite_db)
+    test_database = Database(async_sqlite_db)
+    test_unit_of_work = UnitOfWork(test_database)
 
-    container.db_engine.override(providers.Object(in_memory_sqlite_db))
+    container.db_engine.override(providers.Object(async_sqlite_db))
     container.database.override(providers.Object(test_database))
+    container.unit_of_work.override(providers.Object(test_unit_of_work))
+    # 테스트 간에 캐시 항목이 공유되지 않도록 테스트마다 새 캐시 사용
+    container.todo_tree_cache.override(
+        providers.Object(TodoTreeCache(unit_of_work=test_unit_of_work))
+    )
+    container.verified_token_cache.override(
+        providers.Object(LRUTTLCache(max_entries=100, ttl_seconds=1800))
+    )
     container.kakao_auth_provider.override(providers.Object(test_social_auth_provider))
 
     try:
@@ -86,6 +133,9 @@ def app_container(in_memory_sqlite_db, test_social_auth_provider):
     finally:
         container.db_engine.reset_override()
         container.database.reset_override()
+        container.unit_of_work.reset_override()
+        container.todo_tree_cache.reset_override()
+        container.verified_token_cache.reset_override()
         container.kakao_auth_provider.reset_override()
 
 
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional
 from datetime import date
 
 from src.infrastructure.ai.base_model_service import AIModelService
@@ -7,11 +8,20 @@ from src.infrastructure.ai.base_model_service import AIModelService
 class FakeAIModelService(AIModelService):
     """테스트용 Fake AI 모델 서비스"""
 
-    def __init__(self, mock_response: Dict[str, Any] = None):
+    def __init__(
+        self,
+        mock_response: Dict[str, Any] = None,
+        latency: float = 0.0,
+        error: Optional[Exception] = None,
+    ):
         """
         Args:
             mock_response: 반환할 응답 (없으면 기본값 사용)
+            latency: 응답 전에 기다릴 시간(초). 실제 모델 호출 지연을 흉내 냄
+            error: 지정하면 latency만큼 기다린 뒤 응답 대신 이 예외를 발생시킴
         """
+        self.latency = latency
+        self.error = error
         self.mock_response = mock_response or {
             "tasks": [
                 {
@@ -27,9 +37,15 @@ class FakeAIModelService(AIModelService):
         }
         self.last_input = None
         self.last_target_date = None
+        self.call_count = 0
 
-    def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
+    async def generate_todos_from_text(self, user_input: str, target_date: date = None) -> Dict[str, Any]:
         """테스트용 응답 반환"""
+        self.call_count += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
         self.last_input = user_input
         self.last_target_date = target_date or date.today()
         return self.mock_response
\ No newline at end of file
@@ -1,5 +1,8 @@
+import json
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from sqlalchemy import event
 from src.domain.models.user import User
 from src.infrastructure.database.sqlalchemy_models import UserORM
 import random
@@ -120,4 +123,89 @@ class KakaoUserInfoFixture:
                 "email": email,
                 "profile_image_needs_agreement": True,
             }
-        }
\ No newline at end of file
+        }
+
+
+class CapturedStatement(NamedTuple):
+    statement: str
+    parameters: Any
+
+
+@contextmanager
+def engine_listeners(engine, listeners: Dict[str, Callable]):
+    """블록 안에서만 엔진 이벤트 리스너를 등록 (비동기 엔진이면 sync_engine에 등록)"""
+    engine = getattr(engine, "sync_engine", engine)
+    for name, fn in listeners.items():
+        event.listen(engine, name, fn)
+    try:
+        yield
+    finally:
+        for name, fn in listeners.items():
+            event.remove(engine, name, fn)
+
+
+@contextmanager
+def capture_statements(engine, where: Optional[Callable[[str], bool]] = None):
+    """블록 안에서 실행된 SQL 문과 파라미터를 수집 (where가 있으면 where(문)이 참인 문만)"""
+    captured: List[CapturedStatement] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if where is None or where(statement):
+            captured.append(CapturedStatement(statement, parameters))
+
+    with engine_listeners(engine, {"before_cursor_execute": before_cursor_execute}):
+        yield captured
+
+
+def is_select(statement: str) -> bool:
+    return statement.lstrip().upper().startswith("SELECT")
+
+
+def count_queries(engine, tables=("todos", "tasks")):
+    """블록 안에서 tables를 조회한 SELECT 쿼리를 수집 (ETag용 사용자 버전 조회 등은 제외)"""
+    from_clauses = tuple(f"FROM {table}" for table in tables)
+    return capture_statements(
+        engine,
+        where=lambda statement: is_select(statement)
+        and any(from_clause in statement for from_clause in from_clauses),
+    )
+
+
+@contextmanager
+def count_transactions(engine):
+    """블록 안에서 시작/커밋/롤백된 트랜잭션 수를 센다"""
+    counts = {"begin": 0, "commit": 0, "rollback": 0}
+
+    def listener(name):
+        def increment(conn):
+            counts[name] += 1
+
+        return increment
+
+    with engine_listeners(engine, {name: listener(name) for name in counts}):
+        yield counts
+
+
+def create_bulk_todo(test_client, base_date: str, parent_count: int = 3, subtask_count: int = 2):
+    tasks = []
+    for i in range(parent_count):
+        parent_index = len(tasks)
+        tasks.append({"title": f"부모 {i}", "points": 5})
+        for j in range(subtask_count):
+            tasks.append(
+                {"title": f"자식 {i}-{j}", "points": 1, "parent_id": parent_index}
+            )
+    response = test_client.post(
+        "/api/todos/bulk", json={"base_date": base_date, "tasks": tasks}
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def parse_sse(body: str):
+    """SSE 응답 본문을 (이벤트 이름, JSON 데이터) 목록으로 변환"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from datetime import date
+
+import pytest
+
+from src.infrastructure.ai.fallback_model_service import FallbackAIModelService
+from src.infrastructure.ai.rate_limited_model_service import RateLimitedAIModelService
+from src.infrastructure.ai.rate_limiter import AIRateLimiter
+from test.fake_ai_model_service import FakeAIModelService
+
+TARGET_DATE = date(2025, 12, 25)
+
+
+def provider(title, latency=0.0, error=None):
+    return FakeAIModelService(
+        mock_response={"tasks": [{"title": title, "points": 1, "subtasks": []}]},
+        latency=latency,
+        error=error,
+    )
+
+
+def title_of(result):
+    return result["tasks"][0]["title"]
+
+
+class TestFallbackAIModelService:
+    """다중 제공자 실패 대체/헤지 요청 테스트"""
+
+    async def test_primary_answer_is_used(self):
+        # Given
+        primary, secondary = provider("primary"), provider("secondary")
+        service = FallbackAIModelService([primary, secondary], initial_hedge_delay=1.0)
+
+        # When
+        result = await service.generate_todos_from_text("운동", TARGET_DATE)
+
+        # Then
+        assert title_of(result) == "primary"
+        assert secondary.call_count == 0
+        assert service.stats().wins == (1, 0)
+
+    async def test_fails_over_to_next_provider(self):
+        """실패하면 헤지 시간을 기다리지 않고 바로 다음 제공자를 호출"""
+        # Given
+        primary = provider("primary", error=RuntimeError("Gemini API 호출 중 오류 발생"))
+        service = FallbackAIModelService([primary, provider("secondary")], initial_hedge_delay=10.0)
+
+        # When
+        started = time.perf_counter()
+        result = await service.generate_todos_from_text("운동", TARGET_DATE)
+
+        # Then
+        assert title_of(result) == "secondary"
+        assert time.perf_counter() - started < 1
+        assert service.stats().failovers == 1
+
+    async def test_raises_last_error_when_all_fail(self):
+        # Given
+        service = FallbackAIModelService(
+            [provider("a", error=RuntimeError("first")), provider("b", error=RuntimeError("last"))]
+        )
+
+        # When / Then
+        with pytest.raises(RuntimeError, match="last"):
+            await service.generate_todos_from_text("운동", TARGET_DATE)
+
+    async def test_slow_primary_is_hedged_and_fastest_answer_wins(self):
+        """첫 제공자가 헤지 시간 안에 응답하지 않으면 다음 제공자에도 요청하고 먼저 온 응답을 사용"""
+        # Given: 첫 제공자 1초, 두 번째 0.05초, 헤지 0.05초
+        primary, secondary = provider("primary", latency=1.0), provider("secondary", latency=0.05)
+        service = FallbackAIModelService([primary, secondary], initial_hedge_delay=0.05)
+
+        # When
+        started = time.perf_counter()
+        result = await service.generate_todos_from_text("운동", TARGET_DATE)
+        elapsed = time.perf_counter() - started
+
+        # Then: 남은 첫 제공자 호출은 취소됨
+        assert title_of(result) == "secondary"
+        assert elapsed < 0.5
+        assert service.stats().hedged == 1
+        assert service.stats().wins == (0, 1)
+        assert primary.last_input is None
+
+    async def test_hedge_waits_for_its_own_rate_limit_slot(self):
+        """제공자마다 한도를 적용하면 헤지 요청도 동시 호출 자리를 따로 받아야 호출됨"""
+        # Given: 동시 호출 1개, 첫 제공자 0.3초, 두 번째 0.05초, 헤지 0.05초
+        # (한도가 없으면 헤지한 두 번째 제공자가 0.1초에 먼저 응답)
+        limiter = AIRateLimiter(
+            global_rate_per_second=0.001,
+            global_burst=10,
+            user_rate_per_second=1,
+            user_burst=10,
+            max_concurrency=1,
+            max_queue=1,
+        )
+        primary, secondary = provider("primary", latency=0.3), provider("secondary", latency=0.05)
+        service = FallbackAIModelService(
+            RateLimitedAIModelService.for_services([primary, secondary], limiter),
+            initial_hedge_delay=0.05,
+        )
+
+        # When
+        result = await service.generate_todos_from_text("운동", TARGET_DATE)
+
+        # Then: 헤지 요청은 첫 호출이 자리를 비울 때까지 대기열에서 기다림
+        assert title_of(result) == "primary"
+        assert service.stats().hedged == 1
+        assert limiter.waiting == 0
+
+    async def test_hedge_delay_follows_latency_percentile(self):
+        """표본이 충분하면 최근 응답 시간의 백분위를 헤지 시간으로 사용"""
+        # Given
+        service = FallbackAIModelService(
+            [provider("primary", latency=0.02), provider("secondary")],
+            hedge_percentile=0.9,
+            initial_hedge_delay=5.0,
+            min_hedge_delay=0.001,
+            min_samples=5,
+        )
+        assert service.hedge_delay(0) == 5.0
+
+        # When
+        for _ in range(5):
+            await service.generate_todos_from_text("운동", TARGET_DATE)
+
+        # Then
+        assert 0.02 <= service.hedge_delay(0) < 0.2
+        assert service.stats().hedged == 0
+
+    async def test_stream_fails_over_before_first_task(self):
+        """스트림은 첫 태스크 전에 실패한 경우에만 다음 제공자로 대체"""
+        # Given
+        service = FallbackAIModelService(
+            [provider("primary", error=RuntimeError("down")), provider("secondary")]
+        )
+
+        # When
+        tasks = [task async for task in service.stream_tasks_from_text("운동", TARGET_DATE)]
+
+        # Then
+        assert [task["title"] for task in tasks] == ["secondary"]
+        assert service.stats().wins == (0, 1)
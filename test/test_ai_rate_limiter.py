@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+from dependency_injector import providers
+
+from src.application.services.ai_service import AIService
+from src.infrastructure.ai.rate_limited_model_service import RateLimitedAIModelService
+from src.infrastructure.ai.rate_limiter import AIRateLimiter, AIRateLimitExceeded, TokenBucket
+from src.infrastructure.concurrency.single_flight import SingleFlight
+from test.fake_ai_model_service import FakeAIModelService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_limiter(**overrides):
+    options = dict(
+        global_rate_per_second=100,
+        global_burst=100,
+        user_rate_per_second=1,
+        user_burst=100,
+        max_concurrency=10,
+        max_queue=10,
+    )
+    options.update(overrides)
+    return AIRateLimiter(**options)
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트"""
+
+    def test_refills_at_rate_up_to_capacity(self):
+        # Given
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        # When / Then: 두 개를 쓰면 다음 토큰까지 0.5초
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+
+        # When / Then: 오래 쉬어도 capacity까지만 채워짐
+        clock.now += 60
+        assert bucket.available == 2
+
+
+class TestAIRateLimiter:
+    """AI 모델 호출 한도 테스트"""
+
+    async def test_user_bucket_rejects_immediately(self):
+        """사용자별 한도를 넘으면 기다리지 않고 Retry-After와 함께 거절"""
+        # Given
+        limiter = create_limiter(user_rate_per_second=0.5, user_burst=2)
+
+        # When
+        for _ in range(2):
+            limiter.acquire_user(1)
+        with pytest.raises(AIRateLimitExceeded) as exc_info:
+            limiter.acquire_user(1)
+
+        # Then: 다른 사용자는 영향을 받지 않음
+        assert exc_info.value.reason == "user"
+        assert exc_info.value.retry_after_seconds == 2
+        limiter.acquire_user(2)
+
+    async def test_concurrency_is_capped_and_full_queue_rejects(self):
+        """동시 호출 수를 넘은 요청은 대기열에서 기다리고, 대기열이 가득 차면 바로 거절"""
+        # Given: 동시 1개, 대기열 1개
+        limiter = create_limiter(max_concurrency=1, max_queue=1)
+        release = asyncio.Event()
+        order = []
+
+        async def call(name):
+            async with limiter.acquire():
+                order.append(name)
+                await release.wait()
+
+        running = asyncio.create_task(call("first"))
+        queued = asyncio.create_task(call("second"))
+        await asyncio.sleep(0.01)
+
+        # When
+        with pytest.raises(AIRateLimitExceeded) as exc_info:
+            async with limiter.acquire():
+                pass
+
+        # Then
+        assert exc_info.value.reason == "queue"
+        assert order == ["first"]
+        assert limiter.waiting == 1
+
+        release.set()
+        await asyncio.gather(running, queued)
+        assert order == ["first", "second"]
+        assert limiter.waiting == 0
+
+    async def test_global_bucket_paces_requests(self):
+        """전역 토큰이 없으면 다음 토큰이 채워질 때까지 기다린 뒤 진행"""
+        # Given: 초당 20개, 한 번에 1개
+        limiter = create_limiter(global_rate_per_second=20, global_burst=1)
+        loop = asyncio.get_running_loop()
+
+        # When
+        started = loop.time()
+        for _ in range(3):
+            async with limiter.acquire():
+                pass
+        elapsed = loop.time() - started
+
+        # Then
+        assert elapsed >= 0.09
+
+    async def test_cancelled_waiter_releases_its_place(self):
+        """기다리다 취소된 요청은 대기열과 동시 호출 자리를 남기지 않음"""
+        # Given
+        limiter = create_limiter(max_concurrency=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.acquire():
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+
+        # When
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await running
+
+        # Then
+        assert limiter.waiting == 0
+        async with limiter.acquire():
+            pass
+
+
+class TestAIServiceUserLimit:
+    """합쳐진 요청의 사용자별 한도 테스트"""
+
+    async def test_leader_over_limit_does_not_fail_other_users(self):
+        """한도를 다 쓴 사용자가 먼저 같은 입력을 요청해도 다른 사용자의 요청은 실행됨"""
+        # Given: 사용자 1은 한도를 모두 사용
+        limiter = create_limiter(user_rate_per_second=0.1, user_burst=1)
+        model_service = FakeAIModelService(latency=0.05)
+        service = AIService(
+            RateLimitedAIModelService(model_service, limiter),
+            single_flight=SingleFlight(),
+            rate_limiter=limiter,
+        )
+        limiter.acquire_user(1)
+
+        # When: 사용자 1이 먼저, 사용자 2가 뒤이어 같은 입력을 동시에 요청
+        exhausted, allowed = await asyncio.gather(
+            service.generate_todos_from_text("운동", user_id=1),
+            service.generate_todos_from_text("운동", user_id=2),
+            return_exceptions=True,
+        )
+
+        # Then
+        assert isinstance(exhausted, AIRateLimitExceeded)
+        assert exhausted.reason == "user"
+        assert allowed["tasks"][0]["title"] == "회의 준비"
+        assert model_service.call_count == 1
+
+
+class TestAIRateLimitAPI:
+    """AI API 호출 한도 응답 테스트"""
+
+    @pytest.fixture
+    def limited_ai_service(self, app_container):
+        limiter = create_limiter(user_rate_per_second=0.1, user_burst=1)
+        model_service = RateLimitedAIModelService(FakeAIModelService(), limiter)
+        app_container.ai_service.override(
+            providers.Object(AIService(model_service, rate_limiter=limiter))
+        )
+        yield
+        app_container.ai_service.reset_override()
+
+    @pytest.mark.parametrize("path", ["/api/todos/ai", "/api/todos/ai/stream"])
+    def test_over_limit_returns_429_with_retry_after(self, test_client, limited_ai_service, path):
+        """한도를 넘은 요청은 바로 429와 Retry-After로 거절"""
+        # Given
+        assert test_client.post(path, json={"user_input": "운동"}).status_code == 200
+
+        # When
+        response = test_client.post(path, json={"user_input": "장보기"})
+
+        # Then
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "10"
+
+    def test_batch_over_limit_marks_items(self, test_client, limited_ai_service):
+        """일괄 생성에서는 한도를 넘은 항목만 error로 표시"""
+        # When
+        items = [
+            {"user_input": "운동", "base_date": "2025-12-22"},
+            {"user_input": "장보기", "base_date": "2025-12-23"},
+        ]
+        response = test_client.post("/api/todos/ai/batch", json={"items": items})
+
+        # Then
+        results = response.json()["results"]
+        assert response.status_code == 200
+        assert [result["error"] is None for result in results].count(True) == 1
@@ -0,0 +1,244 @@
+import sqlite3
+import threading
+from datetime import date
+
+import pytest
+from dependency_injector import providers
+
+from src.application.services.ai_service import AIService
+from src.infrastructure.ai.cached_model_service import (
+    AIResultCache,
+    CachedAIModelService,
+    normalize_user_input,
+    open_ai_result_cache,
+)
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+from test.fake_ai_model_service import FakeAIModelService
+
+TARGET_DATE = date(2025, 12, 25)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FailingAIModelService(FakeAIModelService):
+    async def generate_todos_from_text(self, user_input, target_date=None):
+        self.call_count += 1
+        raise RuntimeError("Gemini API 호출 중 오류 발생")
+
+
+@pytest.fixture
+def disk_path(tmp_path):
+    return str(tmp_path / "cache" / "ai_result_cache.sqlite3")
+
+
+@pytest.fixture
+def cache(disk_path):
+    cache = AIResultCache(max_entries=10, ttl_seconds=3600, disk_path=disk_path)
+    yield cache
+    cache.close()
+
+
+class TestNormalizeUserInput:
+    """캐시 키 입력 정규화 테스트"""
+
+    def test_equivalent_inputs_share_key(self):
+        assert normalize_user_input("  운동하고   장보기  ") == "운동하고 장보기"
+        assert normalize_user_input("운동하고 장보기!!") == "운동하고 장보기"
+        assert normalize_user_input("Gym AND groceries.") == "gym and groceries"
+        assert normalize_user_input("ＡＢＣ") == "abc"
+
+    def test_different_inputs_keep_different_keys(self):
+        assert normalize_user_input("운동하고 장보기") != normalize_user_input("운동하고 청소하기")
+
+
+class TestCachedAIModelService:
+    """AI 결과 캐시 테스트"""
+
+    async def test_repeated_input_skips_model(self, cache):
+        """정규화 후 같은 입력과 날짜면 모델을 다시 호출하지 않음"""
+        # Given
+        model_service = FakeAIModelService()
+        service = CachedAIModelService(model_service, cache)
+        first = await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # When
+        second = await service.generate_todos_from_text(" 운동하고  장보기. ", TARGET_DATE)
+
+        # Then
+        assert second == first
+        assert model_service.call_count == 1
+        stats = cache.stats()
+        assert (stats.memory_hits, stats.disk_hits, stats.misses) == (1, 0, 1)
+        assert stats.hit_rate == 0.5
+
+    async def test_different_date_is_separate_entry(self, cache):
+        """날짜가 다르면 상대 표현 해석이 달라지므로 다시 생성"""
+        # Given
+        model_service = FakeAIModelService()
+        service = CachedAIModelService(model_service, cache)
+        await service.generate_todos_from_text("내일 회의 준비", TARGET_DATE)
+
+        # When
+        await service.generate_todos_from_text("내일 회의 준비", date(2025, 12, 26))
+
+        # Then
+        assert model_service.call_count == 2
+
+    async def test_disk_tier_survives_restart(self, cache, disk_path):
+        """프로세스가 재시작되어도 디스크 계층에서 결과를 찾음"""
+        # Given
+        await CachedAIModelService(FakeAIModelService(), cache).generate_todos_from_text(
+            "운동하고 장보기", TARGET_DATE
+        )
+        cache.close()
+
+        # When
+        restarted_cache = AIResultCache(max_entries=10, ttl_seconds=3600, disk_path=disk_path)
+        model_service = FakeAIModelService()
+        service = CachedAIModelService(model_service, restarted_cache)
+        result = await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+        await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # Then
+        assert result["tasks"][0]["title"] == "회의 준비"
+        assert model_service.call_count == 0
+        stats = restarted_cache.stats()
+        assert (stats.memory_hits, stats.disk_hits, stats.misses) == (1, 1, 0)
+        restarted_cache.close()
+
+    async def test_disk_tier_runs_off_event_loop(self, cache, monkeypatch):
+        """디스크 계층 조회/저장은 이벤트 루프 스레드가 아닌 곳에서 실행"""
+        # Given
+        disk_threads = []
+        disk = cache._disk
+        for name in ("get", "set"):
+            method = getattr(disk, name)
+
+            def record(*args, method=method):
+                disk_threads.append(threading.get_ident())
+                return method(*args)
+
+            monkeypatch.setattr(disk, name, record)
+
+        # When
+        await CachedAIModelService(FakeAIModelService(), cache).generate_todos_from_text(
+            "운동하고 장보기", TARGET_DATE
+        )
+
+        # Then: 메모리 미스 후 디스크 조회, 모델 결과 디스크 저장
+        assert len(disk_threads) == 2
+        assert threading.get_ident() not in disk_threads
+
+    async def test_results_are_copies(self, cache):
+        """AIService가 결과에 base_date를 추가해도 캐시 항목은 바뀌지 않음"""
+        # Given
+        model_service = CachedAIModelService(FakeAIModelService(), cache)
+        await AIService(model_service).generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # When
+        cached = await model_service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # Then
+        assert "base_date" not in cached
+
+    async def test_model_errors_are_not_cached(self, cache):
+        """모델 호출 실패는 캐시하지 않고 다음 요청에서 다시 호출"""
+        # Given
+        model_service = FailingAIModelService()
+        service = CachedAIModelService(model_service, cache)
+
+        # When
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # Then
+        assert model_service.call_count == 2
+
+    async def test_disabled_cache_always_calls_model(self, disk_path):
+        """캐시를 끄면 매번 모델을 호출하고 디스크 파일도 만들지 않음"""
+        # Given
+        cache = AIResultCache(max_entries=10, ttl_seconds=3600, disk_path=disk_path, enabled=False)
+        model_service = FakeAIModelService()
+        service = CachedAIModelService(model_service, cache)
+
+        # When
+        await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+        await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # Then
+        assert model_service.call_count == 2
+
+    async def test_stream_shares_cache_with_generate(self, cache):
+        """끝까지 받은 스트림 결과를 캐시하고, 일반 생성 요청도 그 결과를 재사용"""
+        # Given
+        model_service = FakeAIModelService()
+        service = CachedAIModelService(model_service, cache)
+
+        # When
+        streamed = [task async for task in service.stream_tasks_from_text("운동하고 장보기", TARGET_DATE)]
+        replayed = [task async for task in service.stream_tasks_from_text("운동하고 장보기", TARGET_DATE)]
+        generated = await service.generate_todos_from_text("운동하고 장보기", TARGET_DATE)
+
+        # Then
+        assert model_service.call_count == 1
+        assert streamed == replayed == generated["tasks"]
+
+
+    def test_resource_shutdown_closes_disk_connection(self, disk_path):
+        """컨테이너 Resource를 종료하면 디스크 계층의 SQLite 연결을 닫음"""
+        # Given
+        resource = providers.Resource(
+            open_ai_result_cache, max_entries=10, ttl_seconds=3600, disk_path=disk_path
+        )
+        disk = resource()._disk
+
+        # When
+        resource.shutdown()
+
+        # Then
+        with pytest.raises(sqlite3.ProgrammingError):
+            len(disk)
+
+
+class TestSQLiteCache:
+    """SQLite 디스크 캐시 테스트"""
+
+    def test_expired_entry_is_not_returned(self, disk_path):
+        # Given
+        clock = FakeClock()
+        cache = SQLiteCache(disk_path, max_entries=10, ttl_seconds=60, clock=clock)
+        cache.set("key", {"tasks": []})
+
+        # When
+        clock.now += 60
+
+        # Then
+        assert cache.get("key") is None
+        assert len(cache) == 0
+        cache.close()
+
+    def test_trim_keeps_most_recently_used(self, disk_path):
+        # Given
+        clock = FakeClock()
+        cache = SQLiteCache(disk_path, max_entries=2, ttl_seconds=60, clock=clock)
+        for key in ["a", "b", "c"]:
+            clock.now += 1
+            cache.set(key, {"key": key})
+        clock.now += 1
+        cache.get("a")
+
+        # When
+        cache.trim()
+
+        # Then
+        assert cache.get("b") is None
+        assert cache.get("a") == {"key": "a"}
+        assert cache.get("c") == {"key": "c"}
+        cache.close()
@@ -0,0 +1,144 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.ai.gemini_model_service import GeminiModelService
+from src.infrastructure.ai.response_parser import IncrementalTaskParser
+from src.infrastructure.ai.telemetry import AITelemetry
+
+RESPONSE_TEXT = """```json
+{
+  "tasks": [
+    {"title": "회의 {준비}\\"", "points": 15, "subtasks": [{"title": "자료]", "points": 0}]},
+    {"title": "보고서 작성", "points": "7"}
+  ]
+}
+```"""
+
+EXPECTED_TASKS = [
+    {"title": '회의 {준비}"', "points": 10, "subtasks": [{"title": "자료]", "points": 1}]},
+    {"title": "보고서 작성", "points": 7, "subtasks": []},
+]
+
+
+def parse_in_chunks(text, size):
+    parser = IncrementalTaskParser()
+    tasks = []
+    for start in range(0, len(text), size):
+        tasks.extend(parser.feed(text[start:start + size]))
+    parser.close()
+    return tasks
+
+
+class TestIncrementalTaskParser:
+    """스트리밍 응답 증분 파서 테스트"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 1000])
+    def test_chunk_boundaries_do_not_change_result(self, size):
+        """조각을 어디서 나누어도 같은 태스크를 검증/포인트 조정 후 반환"""
+        # When / Then
+        assert parse_in_chunks(RESPONSE_TEXT, size) == EXPECTED_TASKS
+
+    def test_task_is_emitted_when_it_closes(self):
+        """태스크 객체가 닫히는 조각에서 바로 반환하고 나머지를 기다리지 않음"""
+        # Given
+        parser = IncrementalTaskParser()
+        first_task_end = RESPONSE_TEXT.index("]},") + 2
+
+        # When
+        first = parser.feed(RESPONSE_TEXT[:first_task_end])
+        rest = parser.feed(RESPONSE_TEXT[first_task_end:])
+
+        # Then
+        assert first == EXPECTED_TASKS[:1]
+        assert rest == EXPECTED_TASKS[1:]
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ('{"items": []}', "'tasks' 필드"),
+            ('{"tasks": [{"title": "a", "points": 1}', "중간에 끝났습니다"),
+            ('{"tasks": [{"title": "a"}]}', "태스크에 필수 필드"),
+            ('{"tasks": [{"title": "a", "points": 1, "subtasks": [{"title": "b"}]}]}', "서브태스크"),
+            ('{"tasks": [{"title": "a", "points": null}]}', "숫자가 아닙니다"),
+            ('{"tasks": [{"title": "a", "points": "많이"}]}', "숫자가 아닙니다"),
+            ('{"tasks": [{"title": "a", "points": 1, "subtasks": null}]}', "배열이 아닙니다"),
+        ],
+    )
+    def test_invalid_response_raises(self, text, message):
+        """_parse_response와 같은 검증 규칙으로 잘못된 응답을 거부"""
+        # When / Then
+        with pytest.raises(ValueError, match=message):
+            parse_in_chunks(text, 5)
+
+
+class StreamingModelStub:
+    """Gemini 스트리밍 응답을 흉내 내며, 첫 태스크를 보낸 뒤 release될 때까지 기다림"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.release = asyncio.Event()
+
+    async def generate_content_async(self, prompt, stream=False):
+        assert stream
+        return self._iterate()
+
+    async def _iterate(self):
+        yield SimpleNamespace(parts=[object()], text=self.chunks[0])
+        await self.release.wait()
+        for chunk in self.chunks[1:]:
+            yield SimpleNamespace(parts=[object()], text=chunk)
+        yield SimpleNamespace(parts=[], text=None)
+
+
+class TestGeminiStreaming:
+    """Gemini 스트리밍 생성 테스트"""
+
+    async def test_first_task_arrives_before_response_ends(self):
+        """첫 태스크가 닫히면 응답이 끝나기 전에 내보냄"""
+        # Given
+        first_task_end = RESPONSE_TEXT.index("]},") + 2
+        model = StreamingModelStub([RESPONSE_TEXT[:first_task_end], RESPONSE_TEXT[first_task_end:]])
+        service = GeminiModelService(api_key="test-key")
+        service.model = model
+        stream = service.stream_tasks_from_text("회의 준비하고 보고서 작성")
+
+        # When
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        model.release.set()
+        rest = [task async for task in stream]
+
+        # Then
+        assert [first] + rest == EXPECTED_TASKS
+
+    async def test_invalid_stream_raises_runtime_error(self):
+        """스트림이 tasks 배열 중간에 끝나면 RuntimeError로 알림"""
+        # Given
+        model = StreamingModelStub(['{"tasks": [{"title": "a", "points": 1}'])
+        model.release.set()
+        service = GeminiModelService(api_key="test-key")
+        service.model = model
+
+        # When / Then
+        with pytest.raises(RuntimeError, match="중간에 끝났습니다"):
+            [task async for task in service.stream_tasks_from_text("a")]
+
+    async def test_wrongly_typed_task_is_recorded_as_parse_error(self):
+        """JSON으로는 올바르지만 points가 null인 태스크는 파싱 실패로 기록"""
+        # Given
+        model = StreamingModelStub(['{"tasks": [{"title": "a", "points": null}]}'])
+        model.release.set()
+        telemetry = AITelemetry()
+        service = GeminiModelService(
+            api_key="test-key", model_name="gemini-test", telemetry=telemetry
+        )
+        service.model = model
+
+        # When
+        with pytest.raises(RuntimeError, match="숫자가 아닙니다"):
+            [task async for task in service.stream_tasks_from_text("a")]
+
+        # Then
+        assert telemetry.calls.value(model="gemini-test", operation="stream", outcome="parse_error") == 1
+        assert telemetry.parse_failures.value(model="gemini-test") == 1
@@ -0,0 +1,116 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.ai.fallback_model_service import FallbackAIModelService
+from src.infrastructure.ai.gemini_model_service import GeminiModelService
+from src.infrastructure.ai.telemetry import AITelemetry
+from src.infrastructure.metrics.registry import MetricsRegistry
+from test.fake_ai_model_service import FakeAIModelService
+
+USAGE = SimpleNamespace(prompt_token_count=120, candidates_token_count=45)
+
+
+class ResponseModelStub:
+    """generate_content_async가 정해진 텍스트와 사용량을 돌려주는 Gemini 모델 스텁"""
+
+    def __init__(self, text):
+        self.text = text
+
+    async def generate_content_async(self, prompt, stream=False):
+        return SimpleNamespace(text=self.text, usage_metadata=USAGE)
+
+
+def create_gemini(text, telemetry):
+    service = GeminiModelService(api_key="test-key", model_name="gemini-test", telemetry=telemetry)
+    service.model = ResponseModelStub(text)
+    return service
+
+
+class TestMetricsRegistry:
+    """메트릭 저장소 테스트"""
+
+    def test_counter_and_histogram(self):
+        # Given
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "요청 수", ("route",))
+        histogram = registry.histogram("duration_seconds", "지연 시간", ("route",), buckets=(0.1, 1))
+
+        # When
+        counter.inc(route="/a")
+        counter.inc(2, route="/a")
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, route="/a")
+
+        # Then
+        assert counter.value(route="/a") == 3
+        snapshot = histogram.snapshot(route="/a")
+        assert snapshot.cumulative_counts() == [2, 3, 4]
+        assert snapshot.count == 4
+        assert snapshot.sum == pytest.approx(3.65)
+
+    def test_same_name_returns_same_metric_and_validates_shape(self):
+        # Given
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "요청 수", ("route",))
+
+        # When / Then
+        assert registry.counter("requests_total", "요청 수", ("route",)) is counter
+        with pytest.raises(ValueError):
+            registry.histogram("requests_total", "요청 수", ("route",))
+        with pytest.raises(ValueError):
+            counter.inc(method="GET")
+
+
+class TestAITelemetry:
+    """AI 모델 호출 계측 테스트"""
+
+    async def test_successful_call_records_latency_tokens_and_log(self, caplog, capsys):
+        """성공한 호출의 지연 시간/토큰 수/결과를 기록하고 표준 출력에는 쓰지 않음"""
+        # Given
+        telemetry = AITelemetry()
+        service = create_gemini('{"tasks": [{"title": "운동", "points": 3}]}', telemetry)
+
+        # When
+        with caplog.at_level(logging.INFO, logger="src.infrastructure.ai.telemetry"):
+            await service.generate_todos_from_text("운동")
+
+        # Then
+        labels = dict(model="gemini-test", operation="generate", outcome="success")
+        assert telemetry.calls.value(**labels) == 1
+        assert telemetry.latency.snapshot(**labels).count == 1
+        assert telemetry.tokens.value(model="gemini-test", kind="prompt") == 120
+        assert telemetry.tokens.value(model="gemini-test", kind="output") == 45
+        assert caplog.records[-1].ai_call["outcome"] == "success"
+        assert caplog.records[-1].ai_call["prompt_tokens"] == 120
+        assert capsys.readouterr().out == ""
+
+    async def test_parse_failure_is_recorded(self):
+        """응답 파싱 실패를 결과와 파싱 실패 수로 기록"""
+        # Given
+        telemetry = AITelemetry()
+        service = create_gemini("not json", telemetry)
+
+        # When
+        with pytest.raises(RuntimeError):
+            await service.generate_todos_from_text("운동")
+
+        # Then
+        assert telemetry.calls.value(model="gemini-test", operation="generate", outcome="parse_error") == 1
+        assert telemetry.parse_failures.value(model="gemini-test") == 1
+
+    async def test_fallback_retries_are_recorded(self):
+        """다음 제공자로 넘어간 요청을 재시도로 기록"""
+        # Given
+        telemetry = AITelemetry()
+        service = FallbackAIModelService(
+            [FakeAIModelService(error=RuntimeError("down")), FakeAIModelService()],
+            telemetry=telemetry,
+        )
+
+        # When
+        await service.generate_todos_from_text("운동")
+
+        # Then
+        assert telemetry.retries.value(reason="failover") == 1
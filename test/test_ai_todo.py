@@ -1,3 +1,15 @@
+import asyncio
+import time
+
+import httpx
+from dependency_injector import providers
+
+from src.application.services.ai_service import AIService
+from src.main import app
+from test.fake_ai_model_service import FakeAIModelService
+from test.fixtures import parse_sse
+
+
 class TestAITodoAPI:
     """AI를 활용한 TODO 생성 API 테스트"""
 
@@ -47,3 +59,172 @@ class TestAITodoAPI:
                 {"title": "보고서 작성", "points": 7, "subtasks": []},
             ],
         }
+
+    async def test_concurrent_ai_requests_do_not_block(self, app_container):
+        """모델 응답을 기다리는 요청이 동시에 처리되고 다른 라우트를 막지 않음"""
+        # Given: 응답에 0.5초가 걸리는 모델
+        model_service = FakeAIModelService(latency=0.5)
+        app_container.ai_service.override(providers.Object(AIService(model_service)))
+        transport = httpx.ASGITransport(app=app)
+
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                # When: AI 요청 50개를 동시에 보내고 그 사이에 헬스 체크 호출
+                started = time.perf_counter()
+                requests = [
+                    asyncio.create_task(
+                        client.post("/api/todos/ai", json={"user_input": f"할 일 {i}"})
+                    )
+                    for i in range(50)
+                ]
+                health = await client.get("/api/health")
+                health_elapsed = time.perf_counter() - started
+                responses = await asyncio.gather(*requests)
+                elapsed = time.perf_counter() - started
+        finally:
+            app_container.ai_service.reset_override()
+
+        # Then: 요청이 직렬로 처리되지 않고 헬스 체크는 모델 응답을 기다리지 않음
+        assert [response.status_code for response in responses] == [200] * 50
+        assert model_service.call_count == 50
+        assert health.status_code == 200
+        assert health_elapsed < 0.5
+        assert elapsed < 5
+
+    def test_stream_todo_with_ai(self, test_client):
+        """AI TODO 생성 결과를 태스크마다 SSE 이벤트로 전송"""
+        # When
+        request_data = {"user_input": "내일 회의 준비하고 보고서 작성해야 해", "base_date": "2025-12-25"}
+        response = test_client.post("/api/todos/ai/stream", json=request_data)
+
+        # Then
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert parse_sse(response.text) == [
+            (
+                "task",
+                {
+                    "title": "회의 준비",
+                    "points": 5,
+                    "subtasks": [
+                        {"title": "회의 자료 정리", "points": 3},
+                        {"title": "발표 자료 작성", "points": 4},
+                    ],
+                },
+            ),
+            ("task", {"title": "보고서 작성", "points": 7, "subtasks": []}),
+            ("done", {"base_date": "2025-12-25", "task_count": 2}),
+        ]
+
+    def test_stream_todo_with_ai_error_event(self, test_client, app_container):
+        """생성 중 오류가 나면 error 이벤트로 알리고 종료"""
+        # Given
+        class FailingModelService(FakeAIModelService):
+            async def generate_todos_from_text(self, user_input, target_date=None):
+                raise RuntimeError("Gemini API 호출 중 오류 발생")
+
+        app_container.ai_service.override(providers.Object(AIService(FailingModelService())))
+
+        # When
+        try:
+            response = test_client.post("/api/todos/ai/stream", json={"user_input": "운동"})
+        finally:
+            app_container.ai_service.reset_override()
+
+        # Then
+        assert parse_sse(response.text) == [
+            ("error", {"detail": "AI TODO 생성 중 오류가 발생했습니다"})
+        ]
+
+
+class ConcurrencyTrackingModelService(FakeAIModelService):
+    """동시에 진행 중인 호출 수를 기록하고, 입력이 "실패"면 오류를 내는 Fake 모델"""
+
+    def __init__(self, latency: float):
+        super().__init__(latency=latency)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_todos_from_text(self, user_input, target_date=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            result = await super().generate_todos_from_text(user_input, target_date)
+        finally:
+            self.in_flight -= 1
+        if user_input == "실패":
+            raise RuntimeError("Gemini API 호출 중 오류 발생")
+        return {"tasks": [{"title": user_input, "points": 3, "subtasks": []}]}
+
+
+class TestAITodoBatchAPI:
+    """AI TODO 일괄 생성 API 테스트"""
+
+    def test_results_keep_input_order_with_item_errors(self, test_client, app_container):
+        """항목별 결과를 입력 순서대로 반환하고, 실패한 항목만 error를 담음"""
+        # Given
+        model_service = ConcurrencyTrackingModelService(latency=0.01)
+        app_container.ai_service.override(providers.Object(AIService(model_service)))
+        items = [
+            {"user_input": "월요일 운동", "base_date": "2025-12-22"},
+            {"user_input": "실패", "base_date": "2025-12-23"},
+            {"user_input": "수요일 장보기", "base_date": "2025-12-24"},
+        ]
+
+        # When
+        try:
+            response = test_client.post("/api/todos/ai/batch", json={"items": items})
+        finally:
+            app_container.ai_service.reset_override()
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [
+                {
+                    "base_date": "2025-12-22",
+                    "tasks": [{"title": "월요일 운동", "points": 3, "subtasks": []}],
+                    "error": None,
+                },
+                {
+                    "base_date": "2025-12-23",
+                    "tasks": [],
+                    "error": "AI TODO 생성 중 오류가 발생했습니다",
+                },
+                {
+                    "base_date": "2025-12-24",
+                    "tasks": [{"title": "수요일 장보기", "points": 3, "subtasks": []}],
+                    "error": None,
+                },
+            ]
+        }
+
+    def test_empty_batch_is_rejected(self, test_client):
+        # When
+        response = test_client.post("/api/todos/ai/batch", json={"items": []})
+
+        # Then
+        assert response.status_code == 422
+
+    async def test_batch_concurrency_is_bounded(self):
+        """동시 모델 호출 수를 batch_concurrency로 제한하고, 전체 시간은 (항목 수 / 제한) 배 정도"""
+        # Given: 7일치 입력, 호출당 0.1초, 동시 실행 7개
+        model_service = ConcurrencyTrackingModelService(latency=0.1)
+        service = AIService(model_service, batch_concurrency=7)
+        requests = [(f"{day}일 계획", None) for day in range(7)]
+
+        # When
+        started = time.perf_counter()
+        results = await service.generate_todos_batch(requests)
+        elapsed = time.perf_counter() - started
+
+        # Then: 모든 항목이 한 번에 진행되어 가장 느린 항목 하나와 비슷한 시간에 끝남
+        assert [result["tasks"][0]["title"] for result in results] == [title for title, _ in requests]
+        assert model_service.max_in_flight == 7
+        assert elapsed < 0.4
+
+        # When: 동시 실행을 2개로 제한
+        model_service = ConcurrencyTrackingModelService(latency=0.01)
+        await AIService(model_service, batch_concurrency=2).generate_todos_batch(requests)
+
+        # Then
+        assert model_service.max_in_flight == 2
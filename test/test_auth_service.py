@@ -1,6 +1,7 @@
 import pytest
 from src.application.services.auth_service import AuthService, DEFAULT_NICKNAME, DEFAULT_PROFILE_IMAGE
 from src.application.services.social_auth_provider import SocialAuthProvider
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
 from src.infrastructure.database.sqlalchemy_user_repository import SqlAlchemyUserRepository
 from .fixtures import KakaoUserInfoFixture, UserFixture
 
@@ -25,7 +26,7 @@ class TestAuthService:
         user_repository = SqlAlchemyUserRepository(session_factory)
         return AuthService(user_repository, DummySocialAuthProvider())
 
-    def test_get_or_create_user_with_full_profile_info(self, auth_service):
+    async def test_get_or_create_user_with_full_profile_info(self, auth_service):
         """프로필 정보가 모두 제공된 경우 테스트"""
         kakao_user_info = KakaoUserInfoFixture.fixture_kakao_user_info(
             user_id=12345,
@@ -34,28 +35,28 @@ class TestAuthService:
             email="user@example.com"
         )
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.kakao_id == "12345"
         assert result.nickname == "카카오유저"
         assert result.profile_image == "https://profile.kakao.com/user.jpg"
         assert result.email == "user@example.com"
 
-    def test_get_or_create_user_with_no_profile_info(self, auth_service):
+    async def test_get_or_create_user_with_no_profile_info(self, auth_service):
         """프로필 정보가 전혀 제공되지 않은 경우 테스트 (비동의)"""
         kakao_user_info = KakaoUserInfoFixture.fixture_kakao_user_info_no_profile_consent(
             user_id=12346,
             email="user2@example.com"
         )
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.kakao_id == "12346"
         assert result.nickname == DEFAULT_NICKNAME
         assert result.profile_image == DEFAULT_PROFILE_IMAGE
         assert result.email == "user2@example.com"
 
-    def test_get_or_create_user_with_partial_profile_info(self, auth_service):
+    async def test_get_or_create_user_with_partial_profile_info(self, auth_service):
         """일부 프로필 정보만 제공된 경우 테스트"""
         kakao_user_info = KakaoUserInfoFixture.fixture_kakao_user_info_partial_consent(
             user_id=12347,
@@ -63,14 +64,14 @@ class TestAuthService:
             email="partial@example.com"
         )
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.kakao_id == "12347"
         assert result.nickname == "부분동의유저"
         assert result.profile_image == DEFAULT_PROFILE_IMAGE
         assert result.email == "partial@example.com"
 
-    def test_get_or_create_user_with_none_values(self, auth_service):
+    async def test_get_or_create_user_with_none_values(self, auth_service):
         """프로필 정보가 None으로 제공된 경우 테스트"""
         kakao_user_info = KakaoUserInfoFixture.fixture_kakao_user_info(
             user_id=12348,
@@ -79,14 +80,14 @@ class TestAuthService:
             email="none@example.com"
         )
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.kakao_id == "12348"
         assert result.nickname == DEFAULT_NICKNAME
         assert result.profile_image == DEFAULT_PROFILE_IMAGE
         assert result.email == "none@example.com"
 
-    def test_get_or_create_user_missing_properties_key(self, auth_service):
+    async def test_get_or_create_user_missing_properties_key(self, auth_service):
         """properties 키가 아예 없는 경우 테스트"""
         kakao_user_info = {
             "id": 12349,
@@ -95,14 +96,14 @@ class TestAuthService:
             }
         }
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.kakao_id == "12349"
         assert result.nickname == DEFAULT_NICKNAME
         assert result.profile_image == DEFAULT_PROFILE_IMAGE
         assert result.email == "no_properties@example.com"
 
-    def test_get_or_create_existing_user(self, auth_service, db_session):
+    async def test_get_or_create_existing_user(self, auth_service, db_session):
         """기존 사용자가 있는 경우 테스트"""
         from .fixtures import UserFixture
         
@@ -120,14 +121,14 @@ class TestAuthService:
         )
         kakao_user_info["id"] = "existing123"
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.id == existing_user_orm.id
         assert result.kakao_id == "existing123"
         assert result.nickname == "기존유저"
         assert result.profile_image == "https://existing.com/profile.jpg"
 
-    def test_get_or_create_user_empty_string_values(self, auth_service):
+    async def test_get_or_create_user_empty_string_values(self, auth_service):
         """빈 문자열이 제공된 경우 테스트 (기본값으로 대체되어야 함)"""
         kakao_user_info = KakaoUserInfoFixture.fixture_kakao_user_info(
             user_id=12350,
@@ -136,9 +137,111 @@ class TestAuthService:
             email="empty@example.com"
         )
 
-        result = auth_service.get_or_create_user(kakao_user_info)
+        result = await auth_service.get_or_create_user(kakao_user_info)
 
         assert result.kakao_id == "12350"
         assert result.nickname == DEFAULT_NICKNAME
         assert result.profile_image == DEFAULT_PROFILE_IMAGE
         assert result.email == "empty@example.com"
+
+
+class TestVerifiedTokenCache:
+    """검증된 JWT payload 캐시 테스트"""
+
+    class FakeClock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    @pytest.fixture
+    def decode_calls(self, monkeypatch):
+        """auth_service 모듈의 jwt.decode 호출 횟수"""
+        from src.application.services import auth_service as auth_service_module
+
+        calls = []
+        original_decode = auth_service_module.jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            calls.append(1)
+            return original_decode(*args, **kwargs)
+
+        monkeypatch.setattr(auth_service_module.jwt, "decode", counting_decode)
+        return calls
+
+    def create_service(self, cache):
+        return AuthService(None, DummySocialAuthProvider(), verified_token_cache=cache)
+
+    def test_repeated_token_skips_decode(self, decode_calls):
+        """같은 토큰을 다시 검증하면 jwt.decode를 호출하지 않음"""
+        # Given
+        service = self.create_service(LRUTTLCache(max_entries=10, ttl_seconds=1800))
+        token = service.create_access_token(UserFixture.fixture_user(id=1))
+
+        # When
+        first = service.verify_token(token)
+        second = service.verify_token(token)
+
+        # Then
+        assert first == second
+        assert first["sub"] == "1"
+        assert len(decode_calls) == 1
+
+    def test_entry_expires_at_token_exp(self, decode_calls):
+        """캐시 항목은 토큰의 exp 시각에 만료되어 다시 검증"""
+        # Given
+        clock = self.FakeClock()
+        cache = LRUTTLCache(max_entries=10, ttl_seconds=3600, clock=clock)
+        service = self.create_service(cache)
+        token = service.create_access_token(UserFixture.fixture_user(id=1))
+        service.verify_token(token)
+
+        # When: 캐시 기준으로 토큰 수명(30분)이 지남
+        clock.now = 30 * 60 + 1
+        service.verify_token(token)
+
+        # Then
+        assert len(decode_calls) == 2
+        assert cache.stats().expirations == 1
+
+    def test_invalid_token_is_not_cached(self, decode_calls):
+        """검증에 실패한 토큰은 캐시하지 않음"""
+        # Given
+        cache = LRUTTLCache(max_entries=10, ttl_seconds=1800)
+        service = self.create_service(cache)
+
+        # When
+        assert service.verify_token("invalid.token.value") is None
+        assert service.verify_token("invalid.token.value") is None
+
+        # Then
+        assert len(cache) == 0
+        assert len(decode_calls) == 2
+
+    def test_cache_is_scoped_to_signing_key(self, monkeypatch):
+        """서명 키가 다른 서비스는 캐시된 검증 결과를 재사용하지 않음"""
+        # Given
+        cache = LRUTTLCache(max_entries=10, ttl_seconds=1800)
+        token = self.create_service(cache).create_access_token(UserFixture.fixture_user(id=1))
+        self.create_service(cache).verify_token(token)
+
+        # When
+        monkeypatch.setenv("JWT_SECRET_KEY", "rotated-secret-key")
+        rotated_service = self.create_service(cache)
+
+        # Then
+        assert rotated_service.verify_token(token) is None
+
+    def test_returned_payload_does_not_change_cache(self):
+        """반환된 payload를 수정해도 캐시 항목은 바뀌지 않음"""
+        # Given
+        service = self.create_service(LRUTTLCache(max_entries=10, ttl_seconds=1800))
+        token = service.create_access_token(UserFixture.fixture_user(id=1))
+        service.verify_token(token)["sub"] = "2"
+
+        # When
+        payload = service.verify_token(token)
+
+        # Then
+        assert payload["sub"] == "1"
@@ -73,7 +73,7 @@ class TestBulkTodoAPI:
         # When
         response = test_client.post("/api/todos/bulk", json=request_data)
 
-        # Then
+        # Then: 부모 Task들이 먼저 일괄 생성된 뒤 서브태스크들이 생성됨
         assert response.json() == {
             "id": 1,
             "base_date": "2025-12-25",
@@ -86,14 +86,14 @@ class TestBulkTodoAPI:
                     "completed": False,
                     "subtasks": [
                         {
-                            "id": 2,
+                            "id": 3,
                             "title": "시장 조사",
                             "points": 5,
                             "todo_id": 1,
                             "completed": False,
                         },
                         {
-                            "id": 3,
+                            "id": 4,
                             "title": "경쟁사 분석",
                             "points": 4,
                             "todo_id": 1,
@@ -102,7 +102,7 @@ class TestBulkTodoAPI:
                     ],
                 },
                 {
-                    "id": 4,
+                    "id": 2,
                     "title": "보고서 작성",
                     "points": 6,
                     "todo_id": 1,
@@ -172,7 +172,28 @@ class TestBulkTodoAPI:
         response = test_client.post("/api/todos/bulk", json=request_data)
 
         # Then
-        print(response.json())
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Invalid parent_id: 10"}
+
+    def test_create_bulk_todo_nested_subtask(self, test_client):
+        """서브태스크를 부모로 지정하면 400 에러"""
+        # Given: 1번 태스크는 0번의 서브태스크
+        request_data = {
+            "base_date": "2025-12-25",
+            "tasks": [
+                {"title": "부모 태스크", "points": 5},
+                {"title": "자식 태스크", "points": 3, "parent_id": 0},
+                {"title": "손자 태스크", "points": 1, "parent_id": 1},
+            ],
+        }
+
+        # When
+        response = test_client.post("/api/todos/bulk", json=request_data)
+
+        # Then: 요청 전체가 롤백되어 Todo와 Task 모두 생성되지 않음
+        assert response.status_code == 400
+        todos = test_client.get("/api/todos?target_date=2025-12-25").json()
+        assert todos == []
 
     def test_create_bulk_todo_unauthorized(self, test_client):
         """인증 없이 Bulk TODO 생성 시 401 에러"""
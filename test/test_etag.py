@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from src.presentation.api.etag import etag_matches, make_etag
+from test.fixtures import UserFixture, count_queries, create_bulk_todo
+
+
+@pytest.fixture
+def dev_user(db_session):
+    """DISABLE_AUTH 개발 사용자에 해당하는 사용자 행"""
+    return UserFixture.create_user_orm(
+        session=db_session,
+        id=int(os.getenv("DEV_USER_ID", 9999999)),
+        kakao_id=os.getenv("DEV_KAKAO_ID", "dev_kakao_id"),
+    )
+
+
+class TestEtagMatching:
+    """If-None-Match 비교 테스트"""
+
+    def test_weak_comparison(self):
+        etag = make_etag(1, 3)
+        assert etag == 'W/"u1-v3"'
+        assert etag_matches('W/"u1-v3"', etag)
+        assert etag_matches('"u1-v3"', etag)
+        assert etag_matches('"u1-v1", W/"u1-v3"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('W/"u1-v2"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestEtagApi:
+    """데이터 버전 기반 ETag / 304 응답 테스트"""
+
+    def test_unchanged_day_view_returns_304_without_tree_queries(
+        self, test_client, async_sqlite_db, dev_user
+    ):
+        """태그가 최신이면 트리 조회 없이 본문 없는 304를 응답"""
+        # Given
+        create_bulk_todo(test_client, "2025-12-25")
+        response = test_client.get("/api/todos?target_date=2025-12-25")
+        etag = response.headers["ETag"]
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            not_modified = test_client.get(
+                "/api/todos?target_date=2025-12-25", headers={"If-None-Match": etag}
+            )
+
+        # Then
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["ETag"] == etag
+        assert statements == []
+
+    def test_write_changes_etag(self, test_client, dev_user):
+        """Task를 변경하면 이전 태그로는 전체 응답을 받음"""
+        # Given
+        created = create_bulk_todo(test_client, "2025-12-25", parent_count=1)
+        url = f"/api/todos/{created['id']}/tasks"
+        etag = test_client.get(url).headers["ETag"]
+
+        # When
+        test_client.patch(f"/api/tasks/{created['tasks'][0]['id']}/toggle")
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()[0]["completed"] is True
+        assert response.headers["ETag"] != etag
+        assert test_client.get(
+            url, headers={"If-None-Match": response.headers["ETag"]}
+        ).status_code == 304
+
+    def test_failed_write_keeps_etag(self, test_client, dev_user):
+        """롤백된 요청은 데이터 버전도 올리지 않음"""
+        # Given
+        created = create_bulk_todo(test_client, "2025-12-25", parent_count=1)
+        etag = test_client.get(f"/api/todos/{created['id']}").headers["ETag"]
+
+        # When
+        response = test_client.post(
+            "/api/todos/bulk",
+            json={"base_date": "2025-12-26", "tasks": [{"title": "잘못된", "points": 1, "parent_id": 5}]},
+        )
+
+        # Then
+        assert response.status_code == 400
+        assert test_client.get(f"/api/todos/{created['id']}").headers["ETag"] == etag
+
+    def test_version_is_shared_across_reads(self, test_client, dev_user):
+        """사용자 데이터 버전 하나로 모든 조회 응답의 태그를 만듦"""
+        # Given
+        created = create_bulk_todo(test_client, "2025-12-25", parent_count=1)
+
+        # When
+        etags = {
+            test_client.get(url).headers["ETag"]
+            for url in [
+                "/api/todos?target_date=2025-12-25",
+                f"/api/todos/{created['id']}",
+                f"/api/todos/{created['id']}/tasks",
+                f"/api/tasks/{created['tasks'][0]['id']}",
+            ]
+        }
+
+        # Then
+        assert etags == {make_etag(dev_user.id, 2)}
+
+    def test_no_etag_without_user_row(self, test_client):
+        """사용자 행이 없으면 ETag 없이 일반 응답"""
+        # When
+        response = test_client.get("/api/todos?target_date=2025-12-25")
+
+        # Then
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
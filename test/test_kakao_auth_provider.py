@@ -0,0 +1,112 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.auth import KakaoAuthProvider
+from src.infrastructure.http.client import create_http_client
+from src.main import app
+
+
+@pytest.fixture
+def kakao_requests():
+    return []
+
+
+@pytest.fixture
+async def kakao_client(kakao_requests):
+    """카카오 API 응답을 흉내 내는 MockTransport 클라이언트"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        kakao_requests.append(request)
+        if request.url.path == "/oauth/token":
+            return httpx.Response(200, json={"access_token": "kakao_access_token"})
+        if request.url.path == "/v2/user/me":
+            return httpx.Response(200, json={"id": 12345})
+        if request.url.path == "/v1/user/unlink":
+            return httpx.Response(200, json={"id": 12345})
+        return httpx.Response(404)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        yield client
+
+
+class TestKakaoAuthProvider:
+    """공유 HTTP 클라이언트를 사용하는 카카오 인증 제공자 테스트"""
+
+    async def test_login_calls_share_client(self, kakao_client, kakao_requests):
+        """로그인 흐름의 호출이 주입된 클라이언트 하나를 재사용하고 닫지 않음"""
+        # Given
+        provider = KakaoAuthProvider(client=kakao_client)
+
+        # When
+        access_token = await provider.get_access_token_from_code(
+            "code", "client_id", "client_secret", "https://example.com/callback"
+        )
+        user_info = await provider.get_user_info(access_token)
+
+        # Then
+        assert access_token == "kakao_access_token"
+        assert user_info == {"id": 12345}
+        assert [str(request.url) for request in kakao_requests] == [
+            "https://kauth.kakao.com/oauth/token",
+            "https://kapi.kakao.com/v2/user/me",
+        ]
+        assert kakao_requests[1].headers["Authorization"] == "Bearer kakao_access_token"
+        assert not kakao_client.is_closed
+
+    async def test_every_call_has_timeout(self, kakao_client, kakao_requests, monkeypatch):
+        """모든 호출에 설정한 타임아웃을 적용"""
+        # Given
+        monkeypatch.setenv("KAKAO_ADMIN_KEY", "admin_key")
+        timeout = httpx.Timeout(connect=1.0, read=2.0, write=3.0, pool=4.0)
+        provider = KakaoAuthProvider(client=kakao_client, timeout=timeout)
+
+        # When
+        await provider.get_access_token_from_code("code", "id", "secret", "uri")
+        await provider.get_user_info("token")
+        assert await provider.unlink_account("12345") is True
+
+        # Then
+        expected = {"connect": 1.0, "read": 2.0, "write": 3.0, "pool": 4.0}
+        assert [request.extensions["timeout"] for request in kakao_requests] == [expected] * 3
+
+    async def test_unlink_network_error_returns_false(self, monkeypatch):
+        """탈퇴 시 카카오 연결 해제의 네트워크 오류는 실패로 처리"""
+        # Given
+        monkeypatch.setenv("KAKAO_ADMIN_KEY", "admin_key")
+
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            provider = KakaoAuthProvider(client=client)
+
+            # When / Then
+            assert await provider.unlink_account("12345") is False
+
+
+class TestSharedHttpClientLifecycle:
+    """공유 HTTP 클라이언트 생성/종료 테스트"""
+
+    async def test_resource_closes_client(self):
+        """Resource 제너레이터가 끝나면 클라이언트를 닫음"""
+        # Given
+        resource = create_http_client(max_connections=5, http2=True)
+
+        # When
+        client = await resource.__anext__()
+        assert not client.is_closed
+        await resource.aclose()
+
+        # Then
+        assert client.is_closed
+
+    def test_app_lifespan_creates_and_closes_client(self, app_container):
+        """앱 lifespan에서 컨테이너의 카카오 클라이언트를 만들고 종료 시 정리"""
+        # Given
+        assert not app_container.kakao_http_client.initialized
+
+        # When / Then
+        with TestClient(app):
+            assert app_container.kakao_http_client.initialized
+        assert not app_container.kakao_http_client.initialized
@@ -0,0 +1,122 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.metrics.prometheus import render_prometheus
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.metrics.runtime import instrument_db_pool, register_threadpool_metrics
+
+
+class TestPrometheusFormat:
+    """Prometheus 텍스트 형식 테스트"""
+
+    def test_render_all_metric_types(self):
+        # Given
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "작업 수", ("name",)).inc(name='a"b')
+        registry.gauge("queue_depth", "대기 수").set(3)
+        histogram = registry.histogram("job_seconds", "작업 시간", buckets=(0.5, 1))
+        histogram.observe(0.25)
+        histogram.observe(2)
+
+        # When
+        body = render_prometheus(registry)
+
+        # Then
+        assert body == (
+            "# HELP job_seconds 작업 시간\n"
+            "# TYPE job_seconds histogram\n"
+            'job_seconds_bucket{le="0.5"} 1\n'
+            'job_seconds_bucket{le="1"} 1\n'
+            'job_seconds_bucket{le="+Inf"} 2\n'
+            "job_seconds_sum 2.25\n"
+            "job_seconds_count 2\n"
+            "# HELP jobs_total 작업 수\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{name="a\\"b"} 1\n'
+            "# HELP queue_depth 대기 수\n"
+            "# TYPE queue_depth gauge\n"
+            "queue_depth 3\n"
+        )
+
+
+class TestMetricsEndpoint:
+    """/api/metrics 테스트"""
+
+    def test_requests_are_recorded_per_route_template(self, test_client, app_container):
+        """경로 값이 아니라 라우트 템플릿과 상태 코드별로 요청을 기록"""
+        # Given: 미들웨어는 첫 요청에서 만들어짐
+        test_client.get("/api/health")
+        requests = app_container.metrics_registry().get("http_requests_total")
+        labels = dict(method="GET", route="/api/todos/{todo_id}", status=404)
+        before = requests.value(**labels)
+
+        # When
+        test_client.get("/api/todos/123456")
+        test_client.get("/api/todos/654321")
+        test_client.get("/api/no-such-path")
+        response = test_client.get("/api/metrics")
+
+        # Then
+        assert requests.value(**labels) == before + 2
+        assert requests.value(method="GET", route="unmatched", status=404) >= 1
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="/api/todos/{todo_id}",status="404"}'
+            in response.text
+        )
+        assert "threadpool_queue_depth 0" in response.text
+        assert "threadpool_max_threads 40" in response.text
+
+
+class TestDBPoolMetrics:
+    """커넥션 풀 메트릭 테스트"""
+
+    async def test_connection_hold_time_is_recorded(self, async_sqlite_db):
+        # Given
+        registry = MetricsRegistry()
+        instrument_db_pool(async_sqlite_db, registry)
+
+        # When
+        async with async_sqlite_db.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        # Then
+        assert registry.get("db_pool_connection_hold_seconds").snapshot().count == 1
+        assert "db_pool_connection_hold_seconds_count 1" in render_prometheus(registry)
+
+    async def test_instrumenting_twice_registers_once(self, async_sqlite_db):
+        """lifespan이 다시 실행되어도 리스너와 collector를 중복 등록하지 않음"""
+        # Given
+        registry = MetricsRegistry()
+        instrument_db_pool(async_sqlite_db, registry)
+        register_threadpool_metrics(registry)
+        collectors = len(registry._collectors)
+
+        # When
+        instrument_db_pool(async_sqlite_db, registry)
+        register_threadpool_metrics(registry)
+        async with async_sqlite_db.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        # Then
+        assert len(registry._collectors) == collectors
+        assert registry.get("db_pool_connection_hold_seconds").snapshot().count == 1
+
+    async def test_metrics_follow_pool_recreated_by_dispose(self, tmp_path):
+        """dispose로 풀을 다시 만들어도 새 풀의 커넥션을 기록"""
+        # Given
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+        registry = MetricsRegistry()
+        instrument_db_pool(engine, registry)
+        await engine.dispose()
+
+        # When
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            registry.collect()
+            checked_out = registry.get("db_pool_checked_out").value()
+        await engine.dispose()
+
+        # Then
+        assert checked_out == 1
+        assert registry.get("db_pool_connection_hold_seconds").snapshot().count == 1
@@ -0,0 +1,163 @@
+from datetime import date
+
+import pytest
+
+from src.domain.models.todo import Todo
+from src.infrastructure.database.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from src.infrastructure.database.sqlalchemy_todo_repository import (
+    SQLAlchemyTodoRepository,
+)
+from src.infrastructure.database.sqlalchemy_user_stats_repository import (
+    SQLAlchemyUserStatsRepository,
+)
+from test.fixtures import capture_statements, is_select
+
+UNIQUE_TODO_INDEX = "sqlite_autoindex_todos_1"  # uq_todos_user_id_base_date
+TASK_TODO_INDEX = "ix_tasks_todo_id_user_id_parent_id"
+TASK_PARENT_INDEX = "ix_tasks_parent_id"
+
+
+def query_plan(engine, statement, parameters):
+    """SQLite EXPLAIN QUERY PLAN 결과의 detail 목록"""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        connection.close()
+
+
+def table_access(plan, table):
+    return [detail for detail in plan if detail.split(" ")[1] == table]
+
+
+def searches_with_index(detail, table, index, key):
+    """인덱스 범위 탐색(SEARCH)이며 key 조건으로 시작하는지 확인 (COVERING 여부는 무관)"""
+    prefix = f"SEARCH {table} USING "
+    if not detail.startswith(prefix):
+        return False
+    rest = detail[len(prefix):].removeprefix("COVERING ")
+    return rest.startswith(f"INDEX {index} ({key}")
+
+
+class TestQueryPlans:
+    """주요 조회 쿼리가 접근 경로에 맞는 인덱스를 사용하는지 확인"""
+
+    @pytest.fixture
+    def todo_repository(self, session_factory):
+        return SQLAlchemyTodoRepository(session_factory)
+
+    @pytest.fixture
+    def task_repository(self, session_factory):
+        return SQLAlchemyTaskRepository(session_factory)
+
+    @pytest.fixture
+    def user_stats_repository(self, session_factory):
+        return SQLAlchemyUserStatsRepository(session_factory)
+
+    @pytest.fixture
+    def plans_for(self, sqlite_db, async_sqlite_db):
+        """저장소 호출이 실행한 SELECT 문들의 실행 계획 목록을 반환하는 함수"""
+
+        async def collect(call):
+            with capture_statements(async_sqlite_db, where=is_select) as captured:
+                await call()
+            return [
+                query_plan(sqlite_db, statement, params) for statement, params in captured
+            ]
+
+        return collect
+
+    async def test_todo_tree_by_date_uses_composite_indexes(
+        self, plans_for, todo_repository
+    ):
+        todo_plan, task_plan = await plans_for(
+            lambda: todo_repository.get_todos_with_tasks_by_user(1, date(2025, 12, 25)),
+        )
+
+        (todo_access,) = table_access(todo_plan, "todos")
+        assert searches_with_index(
+            todo_access, "todos", UNIQUE_TODO_INDEX, "user_id=? AND base_date=?)"
+        )
+        assert any(
+            searches_with_index(detail, "tasks", TASK_TODO_INDEX, "todo_id=? AND user_id=?")
+            for detail in table_access(task_plan, "tasks")
+        )
+
+    async def test_history_page_uses_user_date_index_without_sort(
+        self, plans_for, todo_repository
+    ):
+        plans = await plans_for(
+            lambda: todo_repository.get_todos_page_with_tasks(
+                1,
+                31,
+                after=(date(2025, 12, 25), 100),
+                date_from=date(2025, 1, 1),
+                date_to=date(2025, 12, 31),
+            ),
+        )
+
+        todo_plan = plans[0]
+        (todo_access,) = table_access(todo_plan, "todos")
+        assert searches_with_index(todo_access, "todos", UNIQUE_TODO_INDEX, "user_id=?")
+        assert not any("TEMP B-TREE" in detail for detail in todo_plan)
+
+    async def test_create_todo_lookup_uses_unique_index(
+        self, plans_for, todo_repository
+    ):
+        plans = await plans_for(
+            lambda: todo_repository.create_todo(
+                Todo(user_id=1, base_date=date(2025, 12, 25))
+            ),
+        )
+        plan = plans[0]
+
+        (todo_access,) = table_access(plan, "todos")
+        assert searches_with_index(
+            todo_access, "todos", UNIQUE_TODO_INDEX, "user_id=? AND base_date=?)"
+        )
+
+    async def test_tasks_by_todo_and_user_use_composite_index(
+        self, plans_for, task_repository
+    ):
+        (plan,) = await plans_for(
+            lambda: task_repository.get_by_todo_id_and_user(1, 1)
+        )
+
+        (task_access,) = table_access(plan, "tasks")
+        assert searches_with_index(
+            task_access, "tasks", TASK_TODO_INDEX, "todo_id=? AND user_id=?"
+        )
+
+    async def test_subtasks_by_parent_use_parent_index(
+        self, plans_for, task_repository
+    ):
+        (plan,) = await plans_for(
+            lambda: task_repository.get_subtasks_by_parent_id(1)
+        )
+
+        (task_access,) = table_access(plan, "tasks")
+        assert searches_with_index(task_access, "tasks", TASK_PARENT_INDEX, "parent_id=?)")
+
+    async def test_calendar_aggregate_uses_user_date_and_task_indexes(
+        self, plans_for, user_stats_repository
+    ):
+        (plan,) = await plans_for(
+            lambda: user_stats_repository.get_daily_from_tasks(
+                1, date(2025, 1, 1), date(2025, 12, 31)
+            )
+        )
+
+        (todo_access,) = table_access(plan, "todos")
+        assert searches_with_index(
+            todo_access, "todos", UNIQUE_TODO_INDEX, "user_id=? AND base_date>? AND base_date<?)"
+        )
+        (task_access,) = table_access(plan, "tasks")
+        assert searches_with_index(
+            task_access, "tasks", TASK_TODO_INDEX, "todo_id=? AND user_id=?"
+        )
+        # 유니크 인덱스가 base_date 순서이므로 GROUP BY에 임시 B-tree가 필요 없음
+        assert not any("TEMP B-TREE" in detail for detail in plan)
@@ -0,0 +1,118 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.infrastructure.metrics.query_profiler import QueryProfiler, normalize_statement
+from src.presentation.api.metrics import QueryProfilerMiddleware
+
+
+class TestNormalizeStatement:
+    """쿼리 모양 정규화 테스트"""
+
+    def test_literals_and_parameter_lists_are_collapsed(self):
+        # Given
+        first = "SELECT * FROM tasks WHERE todo_id IN (?, ?, ?) AND title = 'a'"
+        second = "SELECT *  FROM tasks\nWHERE todo_id IN (%s, %s) AND title = 'it''s'"
+
+        # When / Then
+        assert normalize_statement(first) == normalize_statement(second)
+        assert normalize_statement(first) == "SELECT * FROM tasks WHERE todo_id IN (?) AND title = ?"
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert normalize_statement("SELECT anon_1.id FROM anon_1 LIMIT 10") == (
+            "SELECT anon_1.id FROM anon_1 LIMIT ?"
+        )
+
+
+class TestQueryProfiler:
+    """요청별 쿼리 기록 테스트"""
+
+    async def test_repeated_selects_are_flagged_as_n_plus_one(self, async_sqlite_db):
+        # Given
+        profiler = QueryProfiler(n_plus_one_threshold=3)
+        profiler.instrument(async_sqlite_db)
+
+        # When
+        with profiler.profile() as profile:
+            async with async_sqlite_db.connect() as connection:
+                await connection.execute(text("SELECT count(*) FROM todos"))
+                for todo_id in range(4):
+                    await connection.execute(
+                        text("SELECT * FROM tasks WHERE todo_id = :todo_id"), {"todo_id": todo_id}
+                    )
+
+        # Then: 테스트 엔진은 BEGIN도 직접 실행
+        assert profile.query_count == 6
+        assert profile.duration > 0
+        assert profiler.n_plus_one_suspects(profile) == [
+            ("SELECT * FROM tasks WHERE todo_id = ?", 4)
+        ]
+
+    async def test_queries_outside_profile_are_not_recorded(self, async_sqlite_db):
+        # Given
+        profiler = QueryProfiler()
+        profiler.instrument(async_sqlite_db)
+        with profiler.profile() as profile:
+            pass
+
+        # When
+        async with async_sqlite_db.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        # Then
+        assert profile.query_count == 0
+
+    def test_threshold_must_detect_repetition(self):
+        with pytest.raises(ValueError):
+            QueryProfiler(n_plus_one_threshold=1)
+
+
+class TestQueryProfilerMiddleware:
+    """응답 헤더/로그 테스트"""
+
+    @pytest.fixture
+    def profiled_client(self, async_sqlite_db):
+        profiler = QueryProfiler(n_plus_one_threshold=3)
+        profiler.instrument(async_sqlite_db)
+        app = FastAPI()
+        app.add_middleware(QueryProfilerMiddleware, profiler=profiler)
+
+        @app.get("/todos/{count}")
+        async def list_todos(count: int):
+            async with async_sqlite_db.connect() as connection:
+                for todo_id in range(count):
+                    await connection.execute(
+                        text("SELECT * FROM tasks WHERE todo_id = :todo_id"), {"todo_id": todo_id}
+                    )
+            return {}
+
+        with TestClient(app) as client:
+            yield client
+
+    def test_headers_report_queries_and_n_plus_one(self, profiled_client, caplog):
+        # When
+        with caplog.at_level(logging.INFO, logger="src.presentation.api.metrics"):
+            response = profiled_client.get("/todos/3")
+
+        # Then: 테스트 엔진은 BEGIN도 직접 실행
+        assert response.headers["X-DB-Query-Count"] == "4"
+        assert response.headers["X-DB-N-Plus-One"] == "1"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert response.headers["Server-Timing"].endswith('desc="4 queries"')
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert record.sql_profile["route"] == "/todos/{count}"
+        assert record.sql_profile["n_plus_one"] == [
+            {"statement": "SELECT * FROM tasks WHERE todo_id = ?", "count": 3}
+        ]
+
+    def test_no_n_plus_one_header_below_threshold(self, profiled_client):
+        # When
+        response = profiled_client.get("/todos/2")
+
+        # Then
+        assert response.headers["X-DB-Query-Count"] == "3"
+        assert "X-DB-N-Plus-One" not in response.headers
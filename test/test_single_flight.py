@@ -0,0 +1,143 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from src.application.services.ai_service import AIService
+from src.infrastructure.concurrency.single_flight import SingleFlight
+from test.fake_ai_model_service import FakeAIModelService
+
+TARGET_DATE = date(2025, 12, 25)
+
+
+class TestSingleFlight:
+    """동시 호출 합치기(single-flight) 테스트"""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """같은 키의 동시 호출은 한 번만 실행하고 모두 같은 결과를 받음"""
+        # Given
+        group = SingleFlight()
+        executions = []
+
+        async def fn():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        # When
+        results = await asyncio.gather(*[group.do("key", fn) for _ in range(5)])
+
+        # Then
+        assert len(executions) == 1
+        assert results == [{"value": 1}] * 5
+        assert group.stats().calls == 1
+        assert group.stats().coalesced == 4
+        assert group.stats().in_flight == 0
+
+    async def test_different_keys_run_separately(self):
+        # Given
+        group = SingleFlight()
+
+        async def fn(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        # When
+        results = await asyncio.gather(group.do("a", lambda: fn("a")), group.do("b", lambda: fn("b")))
+
+        # Then
+        assert results == ["a", "b"]
+        assert group.stats().coalesced == 0
+
+    async def test_error_propagates_to_all_waiters_and_is_not_remembered(self):
+        """실패하면 모든 대기자가 같은 예외를 받고, 다음 호출은 다시 실행"""
+        # Given
+        group = SingleFlight()
+        executions = []
+
+        async def fn():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream error")
+
+        # When
+        results = await asyncio.gather(*[group.do("key", fn) for _ in range(3)], return_exceptions=True)
+        with pytest.raises(RuntimeError):
+            await group.do("key", fn)
+
+        # Then
+        assert [type(result) for result in results] == [RuntimeError] * 3
+        assert len(executions) == 2
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """대기자 하나가 취소되어도 공유 실행은 계속되고 나머지는 결과를 받음"""
+        # Given
+        group = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(group.do("key", fn))
+        second = asyncio.create_task(group.do("key", fn))
+        await asyncio.sleep(0.01)
+
+        # When
+        first.cancel()
+
+        # Then
+        assert await second == "done"
+        assert first.cancelled()
+
+    async def test_execution_is_cancelled_when_all_waiters_leave(self):
+        """모든 대기자가 취소되면 실행도 취소하고, 이후 호출은 새로 실행"""
+        # Given
+        group = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.create_task(group.do("key", slow)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        # When
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        async def fast():
+            return "new"
+
+        # Then
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert await group.do("key", fast) == "new"
+
+
+class TestAIServiceSingleFlight:
+    """AIService 동시 요청 합치기 테스트"""
+
+    async def test_equivalent_prompts_share_one_model_call(self):
+        """정규화 후 같은 입력/날짜의 동시 요청은 모델을 한 번만 호출"""
+        # Given
+        model_service = FakeAIModelService(latency=0.05)
+        single_flight = SingleFlight()
+        service = AIService(model_service, single_flight=single_flight)
+
+        # When
+        results = await asyncio.gather(
+            service.generate_todos_from_text("운동하고 장보기", TARGET_DATE),
+            service.generate_todos_from_text("  운동하고  장보기!", TARGET_DATE),
+            service.generate_todos_from_text("운동하고 장보기", date(2025, 12, 26)),
+        )
+
+        # Then
+        assert model_service.call_count == 2
+        assert single_flight.stats().coalesced == 1
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        assert results[2]["base_date"] == "2025-12-26"
@@ -0,0 +1,89 @@
+from datetime import date
+
+from sqlalchemy import create_engine, func, select
+
+from benchmarks.synthetic_data import SyntheticDataSpec, load_synthetic_data
+from src.infrastructure.database.sqlalchemy_models import (
+    Base,
+    DailyUserStatsORM,
+    TaskORM,
+    TodoORM,
+    UserLifetimeStatsORM,
+    UserORM,
+)
+
+TASK_COLUMNS = select(TaskORM.points, TaskORM.completed, TaskORM.parent_id).order_by(TaskORM.id)
+
+
+class TestSyntheticData:
+    """합성 데이터 생성기 테스트"""
+
+    def test_loads_requested_shape(self, synthetic_data, db_session):
+        # When
+        dataset = synthetic_data(
+            users=3, days=10, tasks_per_day=(2, 2), subtask_fanout=(1, 1), depth=2, batch_size=7
+        )
+
+        # Then: 날마다 최상위 2개, 각각 자식 1개와 손자 1개
+        assert dataset.user_ids == [1, 2, 3]
+        assert dataset.dates[0] == date(2025, 1, 1) and len(dataset.dates) == 10
+        assert dataset.todo_count == db_session.scalar(select(func.count(TodoORM.id))) == 30
+        assert dataset.task_count == db_session.scalar(select(func.count(TaskORM.id))) == 180
+        assert len(dataset.root_task_ids) == 60
+        roots = db_session.scalars(select(TaskORM).where(TaskORM.parent_id.is_(None))).all()
+        assert [task.id for task in roots] == dataset.root_task_ids
+        grandchild = db_session.get(TaskORM, dataset.root_task_ids[0] + 2)
+        assert grandchild.parent.parent_id == dataset.root_task_ids[0]
+        assert grandchild.todo_id == grandchild.parent.todo_id
+
+    def test_same_seed_produces_same_data(self, synthetic_data, db_session, tmp_path):
+        # Given
+        first = synthetic_data(users=2, days=30, seed=7)
+        engine = create_engine(f"sqlite:///{tmp_path / 'again.db'}")
+        Base.metadata.create_all(engine)
+
+        # When: 다른 데이터베이스에 같은 설정으로 다시 적재
+        with engine.begin() as connection:
+            second = load_synthetic_data(connection, SyntheticDataSpec(users=2, days=30, seed=7))
+            again = connection.execute(TASK_COLUMNS).all()
+        engine.dispose()
+
+        # Then
+        assert second == first
+        assert again == db_session.execute(TASK_COLUMNS).all()
+
+    def test_completion_ratio(self, synthetic_data, db_session):
+        # When
+        synthetic_data(days=200, completion_ratio=0.25)
+
+        # Then
+        ratio = db_session.scalar(select(func.avg(TaskORM.completed)))
+        assert 0.2 < ratio < 0.3
+        assert db_session.scalar(select(func.count(UserORM.id))) == 1
+
+    def test_point_rollups_match_tasks(self, synthetic_data, db_session):
+        # When
+        synthetic_data(users=2, days=20)
+
+        # Then
+        lifetime = db_session.get(UserLifetimeStatsORM, 2)
+        assert lifetime.total_points == db_session.scalar(
+            select(func.sum(TaskORM.points)).where(TaskORM.user_id == 2)
+        )
+        assert lifetime.completed_task_count == db_session.scalar(
+            select(func.count()).where(TaskORM.user_id == 2, TaskORM.completed)
+        )
+        assert db_session.scalar(select(func.count()).select_from(DailyUserStatsORM)) == 40
+
+    def test_history_is_served_by_api(self, synthetic_data, test_client):
+        # Given: 인증 우회 개발 사용자(9999999)의 히스토리
+        synthetic_data(days=40, first_user_id=9999999)
+
+        # When
+        response = test_client.get("/api/todos", params={"limit": 100})
+
+        # Then
+        todos = response.json()["todos"]
+        assert len(todos) == 40
+        assert todos[0]["base_date"] == "2025-02-09"
+        assert all(todo["tasks"] for todo in todos)
@@ -0,0 +1,168 @@
+from datetime import date
+
+from sqlalchemy import func, insert, select, update
+
+from src.infrastructure.database.sqlalchemy_models import TaskORM, TodoORM
+from src.infrastructure.database.sqlalchemy_task_repository import (
+    DELETE_BATCH_SIZE,
+    SQLAlchemyTaskRepository,
+)
+from test.fixtures import UserFixture, capture_statements, create_bulk_todo
+
+
+def is_data_statement(statement):
+    """트랜잭션 제어문(BEGIN/SAVEPOINT 등)을 제외한 SELECT/WITH/DELETE 문"""
+    return statement.lstrip().split(" ")[0].upper() in ("SELECT", "WITH", "DELETE")
+
+
+def statement_texts(captured):
+    return [statement.lstrip().upper() for statement, _ in captured]
+
+
+def insert_tasks(db_session, parent_ids):
+    """
+    (task_id -> parent_id) 매핑대로 태스크 행을 한 번에 삽입하고 todo를 반환
+    """
+    user = UserFixture.create_user_orm(db_session)
+    todo = TodoORM(user_id=user.id, base_date=date(2025, 12, 25))
+    db_session.add(todo)
+    db_session.commit()
+
+    db_session.execute(
+        insert(TaskORM),
+        [
+            {
+                "id": task_id,
+                "title": f"태스크 {task_id}",
+                "points": 1,
+                "todo_id": todo.id,
+                "user_id": user.id,
+                "completed": False,
+                "parent_id": parent_id,
+            }
+            for task_id, parent_id in parent_ids.items()
+        ],
+    )
+    db_session.commit()
+    return todo
+
+
+def remaining_task_ids(db_session):
+    return set(db_session.scalars(select(TaskORM.id)).all())
+
+
+class TestTaskSubtreeDelete:
+    """WITH RECURSIVE 기반 하위 태스크 연쇄 삭제 테스트"""
+
+    async def test_delete_deep_tree_with_one_select(
+        self, db_session, session_factory, async_sqlite_db
+    ):
+        """Python 재귀 한도보다 깊은 트리도 한 번의 조회로 삭제"""
+        # Given: 1 -> 2 -> ... -> 2000 체인과 무관한 태스크 9999
+        depth = 2000
+        parent_ids = {task_id: task_id - 1 or None for task_id in range(1, depth + 1)}
+        parent_ids[9999] = None
+        insert_tasks(db_session, parent_ids)
+        repository = SQLAlchemyTaskRepository(session_factory)
+
+        # When
+        with capture_statements(async_sqlite_db, where=is_data_statement) as captured:
+            await repository.delete_with_descendants(1)
+
+        # Then: CTE 조회 한 번, 깊이마다 DELETE 한 번
+        statements = statement_texts(captured)
+        assert remaining_task_ids(db_session) == {9999}
+        assert sum(s.startswith("WITH RECURSIVE") for s in statements) == 1
+        assert sum(s.startswith("DELETE") for s in statements) == depth
+        assert not [s for s in statements if s.startswith("SELECT")]
+
+    async def test_delete_wide_tree_by_depth(
+        self, db_session, session_factory, async_sqlite_db
+    ):
+        """넓은 트리는 깊이별 DELETE ... IN (...) 으로 삭제"""
+        # Given: 루트 1, 자식 2~(width+1), 각 자식의 손자 하나
+        width = DELETE_BATCH_SIZE + 500
+        parent_ids = {1: None}
+        for child_id in range(2, width + 2):
+            parent_ids[child_id] = 1
+            parent_ids[child_id + width] = child_id
+        parent_ids[99999] = None
+        insert_tasks(db_session, parent_ids)
+        repository = SQLAlchemyTaskRepository(session_factory)
+
+        # When
+        with capture_statements(async_sqlite_db, where=is_data_statement) as captured:
+            await repository.delete_with_descendants(1)
+
+        # Then: 손자 -> 자식 순으로 배치 크기만큼 나눠 삭제한 뒤 루트 삭제
+        assert remaining_task_ids(db_session) == {99999}
+        deletes = [s for s in statement_texts(captured) if s.startswith("DELETE")]
+        assert len(deletes) == 5
+
+    async def test_delete_subtree_only(self, db_session, session_factory):
+        """중간 태스크를 삭제하면 그 하위 태스크만 함께 삭제"""
+        # Given: 1 -> (2 -> 4, 3)
+        insert_tasks(db_session, {1: None, 2: 1, 3: 1, 4: 2})
+        repository = SQLAlchemyTaskRepository(session_factory)
+
+        # When
+        await repository.delete_with_descendants(2)
+
+        # Then
+        assert remaining_task_ids(db_session) == {1, 3}
+
+    async def test_delete_missing_task(self, db_session, session_factory):
+        """존재하지 않는 태스크 삭제는 아무것도 지우지 않음"""
+        # Given
+        insert_tasks(db_session, {1: None, 2: 1})
+        repository = SQLAlchemyTaskRepository(session_factory)
+
+        # When
+        await repository.delete_with_descendants(100)
+
+        # Then
+        assert db_session.scalar(select(func.count(TaskORM.id))) == 2
+
+    async def test_delete_cyclic_tree_terminates(self, db_session, session_factory):
+        """잘못된 데이터로 부모 체인에 순환이 있어도 한 번씩만 방문해 삭제"""
+        # Given: 1 -> 2 -> 3 -> 1 순환, 자기 자신이 부모인 4
+        insert_tasks(db_session, {1: None, 2: 1, 3: 2, 4: None})
+        db_session.execute(update(TaskORM).where(TaskORM.id == 1).values(parent_id=3))
+        db_session.execute(update(TaskORM).where(TaskORM.id == 4).values(parent_id=4))
+        db_session.commit()
+        repository = SQLAlchemyTaskRepository(session_factory)
+
+        # When
+        cycle_deleted = await repository.delete_with_descendants(1)
+        self_deleted = await repository.delete_with_descendants(4)
+
+        # Then
+        assert remaining_task_ids(db_session) == set()
+        assert cycle_deleted.task_count == 3
+        assert self_deleted.task_count == 1
+
+
+class TestTaskParentCycle:
+    """부모 변경으로 순환을 만들 수 없는지 확인"""
+
+    def test_task_cannot_become_its_own_or_descendants_child(self, test_client):
+        # Given
+        todo = create_bulk_todo(test_client, "2025-12-25", parent_count=1, subtask_count=1)
+        parent = todo["tasks"][0]
+        subtask = parent["subtasks"][0]
+
+        # When
+        self_parent = test_client.put(
+            f"/api/tasks/{parent['id']}", json={"parent_id": parent["id"]}
+        )
+        child_parent = test_client.put(
+            f"/api/tasks/{parent['id']}", json={"parent_id": subtask["id"]}
+        )
+        deleted = test_client.delete(f"/api/tasks/{parent['id']}")
+
+        # Then
+        assert self_parent.status_code == 404
+        assert self_parent.json()["detail"] == "태스크 자신이나 하위 태스크를 부모로 지정할 수 없습니다."
+        assert child_parent.status_code == 404
+        assert deleted.status_code == 204
+        assert test_client.get(f"/api/tasks/{subtask['id']}").status_code == 404
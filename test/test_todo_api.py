@@ -12,7 +12,7 @@ class TestTodoAPI:
         """인증된 사용자로 Todo 목록 조회"""
         response = test_client.get("/api/todos")
         assert response.status_code == 200
-        assert isinstance(response.json(), list)
+        assert response.json() == {"todos": [], "limit": 30, "next_cursor": None}
 
     def test_create_todo(self, test_client):
         """Todo 생성 테스트"""
@@ -0,0 +1,90 @@
+from test.fixtures import count_queries
+
+
+class TestTodoHistoryPagination:
+    """Todo 히스토리 커서 페이지네이션 테스트"""
+
+    def create_todos(self, test_client, days):
+        for day in days:
+            response = test_client.post(
+                "/api/todos", json={"base_date": f"2025-12-{day:02d}"}
+            )
+            assert response.status_code == 201
+
+    def test_paginate_history_with_cursor(self, test_client):
+        """next_cursor를 따라가면 최신 날짜부터 모든 Todo를 한 번씩 조회"""
+        # Given
+        self.create_todos(test_client, [3, 1, 5, 2, 4])
+
+        # When
+        pages = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            page = test_client.get("/api/todos", params=params).json()
+            pages.append([todo["base_date"] for todo in page["todos"]])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        # Then
+        assert pages == [
+            ["2025-12-05", "2025-12-04"],
+            ["2025-12-03", "2025-12-02"],
+            ["2025-12-01"],
+        ]
+
+    def test_last_full_page_has_no_next_cursor(self, test_client):
+        """남은 Todo가 limit과 같으면 next_cursor가 없음"""
+        # Given
+        self.create_todos(test_client, [1, 2])
+
+        # When
+        page = test_client.get("/api/todos", params={"limit": 2}).json()
+
+        # Then
+        assert page["limit"] == 2
+        assert len(page["todos"]) == 2
+        assert page["next_cursor"] is None
+
+    def test_filter_history_by_date_range(self, test_client):
+        """from/to 범위에 포함된 날짜만 조회"""
+        # Given
+        self.create_todos(test_client, [1, 2, 3, 4, 5])
+
+        # When
+        page = test_client.get(
+            "/api/todos", params={"from": "2025-12-02", "to": "2025-12-04"}
+        ).json()
+
+        # Then
+        assert [todo["base_date"] for todo in page["todos"]] == [
+            "2025-12-04",
+            "2025-12-03",
+            "2025-12-02",
+        ]
+
+    def test_deep_page_costs_constant_queries(self, test_client, async_sqlite_db):
+        """뒤쪽 페이지도 Todo 조회 1번, Task 조회 1번으로 끝남"""
+        # Given
+        self.create_todos(test_client, range(1, 21))
+        cursor = test_client.get("/api/todos", params={"limit": 15}).json()[
+            "next_cursor"
+        ]
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            page = test_client.get(
+                "/api/todos", params={"limit": 15, "cursor": cursor}
+            ).json()
+
+        # Then
+        assert len(page["todos"]) == 5
+        assert len(statements) == 2
+
+    def test_invalid_cursor(self, test_client):
+        """잘못된 커서는 400 에러"""
+        response = test_client.get("/api/todos", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
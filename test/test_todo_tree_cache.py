@@ -0,0 +1,245 @@
+from contextvars import Context
+from datetime import date
+
+import pytest
+from dependency_injector import providers
+
+from src.database import Database, UnitOfWork
+from src.domain.models.todo import Todo
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.infrastructure.cache.todo_tree_cache import TodoTreeCache
+from test.fixtures import count_queries, create_bulk_todo
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUTTLCache:
+    """LRU + TTL 캐시 단위 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 제거"""
+        # Given
+        cache = LRUTTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # When
+        cache.set("c", 3)
+
+        # Then
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_expires_after_ttl(self):
+        """TTL이 지난 항목은 조회되지 않음"""
+        # Given
+        clock = FakeClock()
+        cache = LRUTTLCache(max_entries=10, ttl_seconds=60, clock=clock)
+        cache.set("a", 1)
+
+        # When
+        clock.now = 60
+
+        # Then
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.expirations, stats.size) == (0, 1, 1, 0)
+
+
+class TestTodoTreeCache:
+    """사용자별 Todo 트리 캐시 단위 테스트"""
+
+    @pytest.fixture
+    def loader(self):
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return [Todo(id=1, user_id=1, base_date=date(2025, 12, 25))]
+
+        load.calls = calls
+        return load
+
+    async def test_returns_copies(self, loader):
+        """캐시된 트리를 호출자가 수정해도 캐시 항목은 바뀌지 않음"""
+        # Given
+        cache = TodoTreeCache()
+        todos = await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+        todos[0].tasks.append("변경")
+
+        # When
+        cached = await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+
+        # Then
+        assert cached[0].tasks == []
+        assert len(loader.calls) == 1
+
+    async def test_invalidate_user_only_drops_that_user(self, loader):
+        """무효화는 해당 사용자의 항목에만 적용"""
+        # Given
+        cache = TodoTreeCache()
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+        await cache.get_todos_by_date(2, date(2025, 12, 25), loader)
+
+        # When
+        cache.invalidate_user(1)
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+        await cache.get_todos_by_date(2, date(2025, 12, 25), loader)
+
+        # Then
+        assert len(loader.calls) == 3
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 3)
+
+    async def test_invalidation_during_load_discards_result(self):
+        """조회 도중 무효화되면 조회 결과는 캐시에 남지 않음"""
+        # Given
+        cache = TodoTreeCache()
+
+        async def load_while_writing():
+            cache.invalidate_user(1)
+            return [Todo(id=1, user_id=1, base_date=date(2025, 12, 25))]
+
+        await cache.get_todos_by_date(1, date(2025, 12, 25), load_while_writing)
+
+        # When
+        await cache.get_todos_by_date(1, date(2025, 12, 25), load_while_writing)
+
+        # Then
+        assert cache.stats().hits == 0
+
+    async def test_write_committed_after_unit_of_work_start_discards_result(
+        self, loader, async_sqlite_db
+    ):
+        """작업 단위 시작 후 다른 요청의 쓰기가 무효화되면, 이 작업 단위의 조회 결과는 캐시에 남지 않음"""
+        # Given
+        unit_of_work = UnitOfWork(Database(async_sqlite_db))
+        cache = TodoTreeCache(unit_of_work=unit_of_work)
+
+        async with unit_of_work.begin():
+            # 스냅샷을 고정한 뒤, 조회 전에 다른 요청(다른 컨텍스트)의 쓰기가 커밋되고 무효화됨
+            Context().run(cache.invalidate_user, 1)
+            await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+
+        # When
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+
+        # Then
+        assert len(loader.calls) == 2
+        assert cache.stats().hits == 0
+
+    async def test_versions_are_bounded_without_reviving_entries(self, loader):
+        """무효화 기록은 max_entries명까지만 남고, 버린 사용자의 무효화된 항목도 다시 쓰이지 않음"""
+        # Given: 사용자 1의 항목을 캐시한 뒤 무효화
+        cache = TodoTreeCache(max_entries=2)
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+        cache.invalidate_user(1)
+
+        # When: 다른 사용자들의 쓰기로 사용자 1의 기록이 밀려남
+        for user_id in range(2, 10):
+            cache.invalidate_user(user_id)
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+
+        # Then
+        assert len(cache._versions) == 2
+        assert len(loader.calls) == 2
+        assert cache.stats().hits == 0
+
+    async def test_disabled_cache_always_loads(self, loader):
+        """캐시를 끄면 매번 조회하고 통계도 남기지 않음"""
+        # Given
+        cache = TodoTreeCache(enabled=False)
+
+        # When
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+        await cache.get_todos_by_date(1, date(2025, 12, 25), loader)
+
+        # Then
+        assert len(loader.calls) == 2
+        assert cache.stats().hits == cache.stats().misses == 0
+
+
+class TestTodoTreeCacheApi:
+    """API 레벨 Todo 트리 캐시 테스트"""
+
+    def test_repeated_day_view_hits_cache(self, test_client, async_sqlite_db, app_container):
+        """같은 날짜를 다시 열면 DB를 조회하지 않음"""
+        # Given
+        create_bulk_todo(test_client, "2025-12-25")
+        first = test_client.get("/api/todos?target_date=2025-12-25").json()
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            second = test_client.get("/api/todos?target_date=2025-12-25").json()
+
+        # Then
+        assert second == first
+        assert statements == []
+        assert app_container.todo_tree_cache().stats().hits == 1
+
+    def test_task_update_invalidates_cached_views(self, test_client):
+        """Task를 수정하면 캐시된 날짜/ID 조회에 바로 반영"""
+        # Given
+        created = create_bulk_todo(test_client, "2025-12-25", parent_count=1)
+        task = created["tasks"][0]
+        test_client.get("/api/todos?target_date=2025-12-25")
+        test_client.get(f"/api/todos/{created['id']}")
+
+        # When
+        test_client.patch(f"/api/tasks/{task['id']}/toggle")
+
+        # Then
+        by_date = test_client.get("/api/todos?target_date=2025-12-25").json()
+        by_id = test_client.get(f"/api/todos/{created['id']}").json()
+        assert by_date[0]["tasks"][0]["completed"] is True
+        assert by_id["tasks"][0]["completed"] is True
+
+    def test_task_delete_invalidates_cached_view(self, test_client):
+        """Task를 삭제하면 캐시된 날짜 조회에 바로 반영"""
+        # Given
+        created = create_bulk_todo(test_client, "2025-12-25", parent_count=2)
+        test_client.get("/api/todos?target_date=2025-12-25")
+
+        # When
+        test_client.delete(f"/api/tasks/{created['tasks'][0]['id']}")
+
+        # Then
+        todos = test_client.get("/api/todos?target_date=2025-12-25").json()
+        assert [task["id"] for task in todos[0]["tasks"]] == [created["tasks"][1]["id"]]
+
+    def test_new_todo_invalidates_cached_empty_day(self, test_client):
+        """비어 있던 날짜를 캐시한 뒤 Todo를 만들면 새 Todo가 조회됨"""
+        # Given
+        assert test_client.get("/api/todos?target_date=2025-12-25").json() == []
+
+        # When
+        test_client.post("/api/todos", json={"base_date": "2025-12-25"})
+
+        # Then
+        todos = test_client.get("/api/todos?target_date=2025-12-25").json()
+        assert [todo["base_date"] for todo in todos] == ["2025-12-25"]
+
+    def test_disabled_cache_queries_every_time(
+        self, test_client, async_sqlite_db, app_container
+    ):
+        """캐시를 끄면 매번 DB에서 트리를 조회"""
+        # Given
+        app_container.todo_tree_cache.override(providers.Object(TodoTreeCache(enabled=False)))
+        create_bulk_todo(test_client, "2025-12-25")
+        test_client.get("/api/todos?target_date=2025-12-25")
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            test_client.get("/api/todos?target_date=2025-12-25")
+
+        # Then
+        assert len(statements) == 2
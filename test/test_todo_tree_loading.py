@@ -0,0 +1,57 @@
+from test.fixtures import count_queries, create_bulk_todo
+
+
+class TestTodoTreeLoading:
+    """Todo 트리 조회 쿼리 수 테스트"""
+
+    def test_get_all_todos_builds_tree_with_constant_queries(
+        self, test_client, async_sqlite_db
+    ):
+        """전체 Todo 조회는 Todo 수와 무관하게 일정한 쿼리 수로 트리를 구성"""
+        # Given: 여러 날짜의 Todo와 부모/자식 Task
+        for day in range(1, 6):
+            create_bulk_todo(test_client, f"2025-12-{day:02d}")
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            response = test_client.get("/api/todos")
+
+        # Then
+        todos = response.json()["todos"]
+        assert len(todos) == 5
+        for todo in todos:
+            assert len(todo["tasks"]) == 3
+            for task in todo["tasks"]:
+                assert len(task["subtasks"]) == 2
+        assert len(statements) == 2
+
+    def test_get_todos_by_date_returns_only_that_date(
+        self, test_client, async_sqlite_db
+    ):
+        """날짜별 조회는 해당 날짜의 트리만 반환"""
+        # Given
+        create_bulk_todo(test_client, "2025-12-24", parent_count=1)
+        create_bulk_todo(test_client, "2025-12-25", parent_count=2, subtask_count=1)
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            response = test_client.get("/api/todos?target_date=2025-12-25")
+
+        # Then
+        todos = response.json()
+        assert [todo["base_date"] for todo in todos] == ["2025-12-25"]
+        assert [len(task["subtasks"]) for task in todos[0]["tasks"]] == [1, 1]
+        assert len(statements) == 2
+
+    def test_get_todo_by_id_builds_tree(self, test_client, async_sqlite_db):
+        """ID로 조회 시에도 서브태스크까지 포함한 트리를 반환"""
+        # Given
+        created = create_bulk_todo(test_client, "2025-12-25", parent_count=2)
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            response = test_client.get(f"/api/todos/{created['id']}")
+
+        # Then
+        assert response.json() == created
+        assert len(statements) == 2
@@ -0,0 +1,63 @@
+from test.fixtures import count_transactions
+
+
+class TestUnitOfWork:
+    """요청 단위 작업 단위(UnitOfWork) 테스트"""
+
+    def create_task(self, test_client):
+        response = test_client.post(
+            "/api/todos/bulk",
+            json={
+                "base_date": "2025-12-25",
+                "tasks": [
+                    {"title": "부모 태스크", "points": 5},
+                    {"title": "자식 태스크", "points": 3, "parent_id": 0},
+                ],
+            },
+        )
+        return response.json()["tasks"][0]
+
+    def test_update_task_uses_single_transaction(self, test_client, async_sqlite_db):
+        """조회와 검증, 수정이 한 트랜잭션에서 실행되고 한 번 커밋됨"""
+        # Given
+        task = self.create_task(test_client)
+
+        # When
+        with count_transactions(async_sqlite_db) as counts:
+            response = test_client.put(
+                f"/api/tasks/{task['id']}", json={"title": "수정된 태스크", "points": 8}
+            )
+
+        # Then
+        assert response.status_code == 200
+        assert counts == {"begin": 1, "commit": 1, "rollback": 0}
+
+    def test_bulk_create_uses_single_transaction(self, test_client, async_sqlite_db):
+        """Todo 생성과 Task 일괄 생성이 한 번의 커밋으로 끝남"""
+        # When
+        with count_transactions(async_sqlite_db) as counts:
+            self.create_task(test_client)
+
+        # Then
+        assert counts == {"begin": 1, "commit": 1, "rollback": 0}
+
+    def test_failed_request_rolls_back(self, test_client, async_sqlite_db):
+        """핸들러에서 예외가 발생하면 그 요청에서 먼저 실행된 쓰기까지 모두 롤백됨"""
+        # When: Todo를 만든 뒤 서브태스크의 서브태스크 때문에 실패하는 요청
+        with count_transactions(async_sqlite_db) as counts:
+            response = test_client.post(
+                "/api/todos/bulk",
+                json={
+                    "base_date": "2025-12-26",
+                    "tasks": [
+                        {"title": "부모 태스크", "points": 5},
+                        {"title": "자식 태스크", "points": 3, "parent_id": 0},
+                        {"title": "손자 태스크", "points": 1, "parent_id": 1},
+                    ],
+                },
+            )
+
+        # Then
+        assert response.status_code == 400
+        assert counts == {"begin": 1, "commit": 0, "rollback": 1}
+        assert test_client.get("/api/todos?target_date=2025-12-26").json() == []
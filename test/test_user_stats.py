@@ -0,0 +1,155 @@
+from sqlalchemy import case, func, select
+
+from src.domain.models.task import Task
+from src.domain.models.task_stats import TaskStats
+from src.infrastructure.database.sqlalchemy_models import TaskORM, TodoORM
+from test.fixtures import count_queries, create_bulk_todo
+
+
+def stats_of(response_stats: dict) -> TaskStats:
+    return TaskStats(**response_stats)
+
+
+def recompute_daily(db_session, base_date: str) -> TaskStats:
+    """집계 테이블 없이 태스크를 모두 읽어 계산한 날짜별 집계"""
+    row = db_session.execute(
+        select(
+            func.coalesce(func.sum(TaskORM.points), 0),
+            func.coalesce(func.sum(case((TaskORM.completed, TaskORM.points), else_=0)), 0),
+            func.count(TaskORM.id),
+            func.coalesce(func.sum(case((TaskORM.completed, 1), else_=0)), 0),
+        )
+        .join(TodoORM, TodoORM.id == TaskORM.todo_id)
+        .where(TodoORM.base_date == base_date)
+    ).one()
+    return TaskStats(*row)
+
+
+class TestTaskStats:
+    """태스크 집계 값 테스트"""
+
+    def test_tree_and_delta(self):
+        # Given
+        parent = Task(id=1, title="부모", points=5, todo_id=1, completed=True)
+        parent.subtasks = [Task(id=2, title="자식", points=2, todo_id=1, parent_id=1)]
+
+        # When
+        stats = TaskStats.of_tree([parent])
+
+        # Then
+        assert stats == TaskStats(
+            total_points=7, completed_points=5, task_count=2, completed_task_count=1
+        )
+        assert (stats - stats).is_zero()
+        assert -stats + stats == TaskStats()
+
+
+class TestUserStatsApi:
+    """태스크 쓰기와 함께 갱신되는 포인트 집계 테스트"""
+
+    def test_writes_keep_rollups_in_sync(self, test_client, db_session):
+        # Given: 2026-03-04(수)에 부모 5점 x 2, 자식 1점 x 2씩, 같은 주 월요일에 부모 1개
+        todo = create_bulk_todo(test_client, "2026-03-04", parent_count=2, subtask_count=2)
+        create_bulk_todo(test_client, "2026-03-02", parent_count=1, subtask_count=0)
+        parent, other_parent = todo["tasks"]
+
+        # When
+        test_client.patch(f"/api/tasks/{parent['id']}/toggle")
+        test_client.patch(f"/api/tasks/{parent['subtasks'][0]['id']}/toggle")
+        test_client.put(f"/api/tasks/{parent['id']}", json={"points": 8})
+        test_client.delete(f"/api/tasks/{other_parent['id']}")
+        response = test_client.get("/api/stats", params={"base_date": "2026-03-04"})
+
+        # Then: 부모 8점(완료) + 자식 1점 x 2(하나 완료)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["base_date"] == "2026-03-04"
+        assert stats_of(body["today"]) == TaskStats(
+            total_points=10, completed_points=9, task_count=3, completed_task_count=2
+        )
+        assert stats_of(body["today"]) == recompute_daily(db_session, "2026-03-04")
+        assert stats_of(body["week"]) == TaskStats(
+            total_points=15, completed_points=9, task_count=4, completed_task_count=2
+        )
+        assert stats_of(body["lifetime"]) == stats_of(body["week"])
+
+    def test_other_week_is_excluded(self, test_client):
+        # Given
+        create_bulk_todo(test_client, "2026-03-08", parent_count=1, subtask_count=0)
+        create_bulk_todo(test_client, "2026-03-09", parent_count=1, subtask_count=0)
+
+        # When: 2026-03-09는 월요일
+        body = test_client.get("/api/stats", params={"base_date": "2026-03-09"}).json()
+
+        # Then
+        assert stats_of(body["week"]).total_points == 5
+        assert stats_of(body["lifetime"]).total_points == 10
+
+    def test_empty_user_and_reads_skip_tasks(self, test_client, async_sqlite_db):
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            body = test_client.get("/api/stats").json()
+
+        # Then: 태스크/Todo 테이블은 읽지 않음
+        assert stats_of(body["today"]) == TaskStats()
+        assert stats_of(body["lifetime"]) == TaskStats()
+        assert statements == []
+
+
+class TestCalendarStatsApi:
+    """날짜별 히트맵 집계 테스트"""
+
+    def test_dense_arrays_from_single_grouped_query(self, test_client, async_sqlite_db):
+        # Given: 3/2에 부모 5점 + 자식 1점 x 2, 3/4에 부모 5점
+        todo = create_bulk_todo(test_client, "2026-03-02", parent_count=1, subtask_count=2)
+        create_bulk_todo(test_client, "2026-03-04", parent_count=1, subtask_count=0)
+        create_bulk_todo(test_client, "2026-03-06", parent_count=1, subtask_count=0)
+        test_client.patch(f"/api/tasks/{todo['tasks'][0]['subtasks'][0]['id']}/toggle")
+
+        # When
+        with count_queries(async_sqlite_db) as statements:
+            response = test_client.get(
+                "/api/stats/calendar", params={"from": "2026-03-01", "to": "2026-03-05"}
+            )
+
+        # Then: 태스크가 없는 날은 0, 범위 밖(3/6)은 제외
+        assert response.status_code == 200
+        assert response.json() == {
+            "from": "2026-03-01",
+            "to": "2026-03-05",
+            "total_points": [0, 7, 0, 5, 0],
+            "completed_points": [0, 1, 0, 0, 0],
+            "task_count": [0, 3, 0, 1, 0],
+            "completed_task_count": [0, 1, 0, 0, 0],
+        }
+        assert len(statements) == 1
+
+    def test_matches_rollup_for_each_day(self, test_client):
+        # Given
+        create_bulk_todo(test_client, "2026-03-02", parent_count=2, subtask_count=1)
+
+        # When
+        calendar = test_client.get(
+            "/api/stats/calendar", params={"from": "2026-03-02", "to": "2026-03-02"}
+        ).json()
+        summary = test_client.get("/api/stats", params={"base_date": "2026-03-02"}).json()
+
+        # Then
+        today = stats_of(summary["today"])
+        assert calendar["total_points"] == [today.total_points]
+        assert calendar["task_count"] == [today.task_count]
+
+    def test_invalid_ranges_are_rejected(self, test_client):
+        # When
+        reversed_range = test_client.get(
+            "/api/stats/calendar", params={"from": "2026-03-05", "to": "2026-03-01"}
+        )
+        too_long = test_client.get(
+            "/api/stats/calendar", params={"from": "2025-01-01", "to": "2026-01-02"}
+        )
+        missing = test_client.get("/api/stats/calendar", params={"from": "2026-03-01"})
+
+        # Then
+        assert reversed_range.status_code == 400
+        assert too_long.status_code == 400
+        assert missing.status_code == 422